@@ -2,35 +2,255 @@
 Author: Sepehr Bayat | Open Source Chess MVP
 
 AI Engine for computer player using minimax algorithm with alpha-beta pruning.
+
+With more than one worker, root moves are split across a process pool; the
+workers share the best root score so far as their alpha bound.
+
+This module runs in headless engine and worker processes, so neither it nor
+anything it imports may import pygame (checked by test_chess.py). The
+process pool modules are only imported once a parallel search is set up.
 """
 
+import os
 import random
-from typing import Tuple, List, Optional
-from chess.board import Board
+import time
+from typing import Callable, Dict, Tuple, List, Optional
+from chess.board import Board, FIFTY_MOVE_PLIES
 from chess.evaluator import Evaluator
+from chess.bitboard import PIECE_TYPES, PAWN
+from chess.constants import PIECE_VALUES
+from chess.movegen import generate_legal_moves
+from chess.moves import NULL_MOVE, pack_move, unpack_move
+from chess.psqt import MATERIAL_VALUES, MATERIAL_BY_INDEX
+from chess.transposition import (
+    TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND, DEPTH, SCORE, FLAG, BEST_MOVE
+)
+
+# Score for delivering checkmate; mates found closer to the root score higher
+MATE_SCORE = 100000
+MATE_THRESHOLD = MATE_SCORE - 1000
+
+# Depth cap when only a time or node budget limits the search
+MAX_SEARCH_DEPTH = 64
+
+# How many nodes to search between time/node budget checks
+CHECK_INTERVAL = 64
+
+# Move ordering tiers: hash move, then captures/promotions, then killers,
+# then quiet moves by history score (always below KILLER_SCORE)
+HASH_MOVE_SCORE = 10000000
+CAPTURE_SCORE = 1000000
+KILLER_SCORE = 900000
+
+# Piece values for MVV/LVA ordering, indexed by piece type code
+ORDER_VALUES = tuple(PIECE_VALUES[piece_type] for piece_type in PIECE_TYPES)
+
+# Quiescence delta pruning: skip captures that cannot lift the score back to
+# alpha even with this much positional gain on top (centipawns)
+DELTA_MARGIN = 200
+
+# Seconds between budget checks while waiting on parallel workers
+WAIT_INTERVAL = 0.01
+
+
+def _score_to_table(score: float, ply: int) -> float:
+    """Store mate scores relative to the position rather than the root."""
+    if score > MATE_THRESHOLD:
+        return score + ply
+    if score < -MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_table(score: float, ply: int) -> float:
+    """Convert a stored mate score back to distance from the root."""
+    if score > MATE_THRESHOLD:
+        return score - ply
+    if score < -MATE_THRESHOLD:
+        return score + ply
+    return score
+
+
+# Per-process state of parallel search workers, set up by _init_worker
+_worker_ai: Optional['ChessAI'] = None
+_worker_alpha = None
+_worker_search = None
+_worker_generation = None
+
+
+def _init_worker(shared_alpha, shared_stop, shared_search, hash_size_mb: float,
+                 eval_mobility: bool):
+    """Create the search worker's own AI; runs once in each pool process."""
+    global _worker_ai, _worker_alpha, _worker_search
+    _worker_ai = ChessAI(depth=1, hash_size_mb=hash_size_mb, eval_mobility=eval_mobility)
+    _worker_ai._shared_stop = shared_stop
+    _worker_alpha = shared_alpha
+    _worker_search = shared_search
+
+
+def _search_root_move(state: tuple, move, depth: int, time_limit: Optional[float],
+                      node_limit: Optional[int], search_id: int, generation: int):
+    """
+    Search one root move in a worker process.
+    
+    The window is narrowed by the best root score any worker has found so
+    far, which is then raised if this move beats it. The shared alpha is
+    only raised while search_id is still the current search, so a task
+    left over from an earlier position can never narrow a later window.
+    The first task of each new generation ages the worker's transposition
+    table and move ordering tables, as get_best_move does in the parent.
+    
+    Args:
+        state: Root position from Board.to_state
+        move: Root move to search
+        depth: Search depth including the root move
+        time_limit: Seconds left in the parent's time budget
+        node_limit: This task's share of the parent's node budget
+        search_id: Value of the shared search counter when submitted
+        generation: Transposition table age of the parent's search
+        
+    Returns:
+        (move, score, alpha the move was searched with, nodes searched);
+        score is None if the search was stopped
+    """
+    global _worker_generation
+    ai = _worker_ai
+    if generation != _worker_generation:
+        _worker_generation = generation
+        ai._start_new_search()
+    board = Board.from_state(state)
+    alpha = _worker_alpha.value
+    ai._set_limits(time_limit, node_limit)
+    board.push(move)
+    score = -ai._minimax(board, depth - 1, float('-inf'), -alpha, 1)
+    if ai._stop:
+        return move, None, alpha, ai.nodes
+    with _worker_alpha.get_lock():
+        if _worker_search.value == search_id and score > _worker_alpha.value:
+            _worker_alpha.value = score
+    return move, score, alpha, ai.nodes
 
 
 class ChessAI:
     """AI engine for playing chess using minimax algorithm."""
     
-    def __init__(self, depth: int = 3):
+    def __init__(self, depth: Optional[int] = 3, hash_size_mb: float = 16,
+                 time_limit: Optional[float] = None, node_limit: Optional[int] = None,
+                 seed: Optional[int] = None, eval_mobility: bool = True,
+                 workers: Optional[int] = 1):
         """
         Initialize the AI.
         
         Args:
-            depth: Search depth for minimax algorithm (default: 3)
+            depth: Maximum search depth for minimax algorithm (default: 3).
+                None searches as deep as the time or node budget allows.
+            hash_size_mb: Transposition table memory budget in MB (default: 16)
+            time_limit: Default time budget per move in seconds (None for no limit)
+            node_limit: Default node budget per move (None for no limit)
+            seed: Seed for breaking ties between equally ordered root moves
+                (None for a different choice every game)
+            eval_mobility: Add the attack-count mobility term to leaf
+                evaluation; without it leaf evaluation is O(1)
+            workers: Number of processes to split root moves across
+                (default: 1 searches in this process; None uses every CPU).
+                Workers are spawned, so scripts using them need an
+                ``if __name__ == "__main__":`` guard.
         """
+        if depth is None and time_limit is None and node_limit is None:
+            raise ValueError("An unlimited depth needs a time or node limit")
         self.depth = depth
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.eval_mobility = eval_mobility
+        self.hash_size_mb = hash_size_mb
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
         self.evaluator = Evaluator()
+        # Kept between moves so later searches reuse earlier results
+        self.transposition_table = TranspositionTable(hash_size_mb)
+        self._rng = random.Random(seed)
+        
+        # Move ordering heuristics: two killer moves per ply, and history
+        # scores per color indexed by from_square * 64 + to_square
+        self._killers: List[List] = [[None, None] for _ in range(MAX_SEARCH_DEPTH + 1)]
+        self._history: List[List[int]] = [[0] * 4096, [0] * 4096]
+        
+        # Search state
+        self.nodes = 0
+        self.completed_depth = 0
+        self.best_score = 0.0
+        self._stop = False
+        self._deadline: Optional[float] = None
+        self._node_budget: Optional[int] = None
+        
+        # Parallel search: the pool is started on first use; the shared
+        # values carry the best root score, the stop request and the id of
+        # the current root search to workers
+        self._pool = None
+        self._futures: set = set()
+        self._mp_context = None
+        self._shared_alpha = None
+        self._shared_stop = None
+        self._shared_search = None
+        if self.workers > 1:
+            import multiprocessing
+            # Forking while another thread holds a lock (the GUI, or a UCI
+            # loop blocked on stdin) can deadlock the child, so spawn workers
+            self._mp_context = multiprocessing.get_context('spawn')
+            self._shared_alpha = self._mp_context.Value('d', float('-inf'))
+            self._shared_stop = self._mp_context.Value('b', 0)
+            self._shared_search = self._mp_context.Value('i', 0)
     
-    def get_best_move(self, board: Board, color: str) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    def stop(self):
+        """Ask a running search to stop; it returns its best move so far."""
+        self._stop = True
+        if self._shared_stop is not None:
+            self._shared_stop.value = 1
+    
+    def close(self):
+        """Shut down the parallel search worker processes, if started."""
+        if self._pool is not None:
+            # shutdown(cancel_futures=True) needs Python 3.9
+            for future in self._futures:
+                future.cancel()
+            self._futures = set()
+            self._pool.shutdown()
+            self._pool = None
+    
+    def _start_new_search(self):
+        """Age the transposition table and move ordering tables for a new search."""
+        self.transposition_table.new_search()
+        self._killers = [[None, None] for _ in range(MAX_SEARCH_DEPTH + 1)]
+        for table in self._history:
+            for index in range(4096):
+                table[index] >>= 1  # Age history so recent searches dominate
+    
+    def _set_limits(self, time_limit: Optional[float], node_limit: Optional[int]):
+        """Reset the node counter and stop flag and start the search budgets."""
+        self._deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        self._node_budget = node_limit
+        self._stop = False
+        self.nodes = 0
+    
+    def get_best_move(self, board: Board, color: str, time_limit: Optional[float] = None,
+                      node_limit: Optional[int] = None,
+                      progress_callback: Optional[Callable[[Dict], None]] = None
+                      ) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
-        Get the best move for the given color using minimax.
+        Get the best move for the given color using iterative deepening minimax.
+        
+        Searches depth 1, 2, ... up to the maximum depth, keeping the best
+        move of each completed iteration. When the time or node budget runs
+        out the current iteration is abandoned and the last completed result
+        is returned (or a better move already proven in the abandoned one).
         
         Args:
             board: Current board state
             color: Color to play ('white' or 'black')
-            
+            time_limit: Time budget in seconds, overriding the default
+            node_limit: Node budget, overriding the default
+            progress_callback: Called with a dict of depth, score, nodes,
+                nps, time, best_move and pv after each completed iteration
+                
         Returns:
             Best move as ((start_row, start_col), (end_row, end_col)) or None if no moves available
         """
@@ -38,117 +258,478 @@ class ChessAI:
         if not moves:
             return None
         
+        if time_limit is None:
+            time_limit = self.time_limit
+        if node_limit is None:
+            node_limit = self.node_limit
+        start_time = time.perf_counter()
+        self._set_limits(time_limit, node_limit)
+        if self._shared_stop is not None:
+            self._shared_stop.value = 0
+        self.completed_depth = 0
+        self._start_new_search()
+        
+        max_depth = self.depth if self.depth is not None else MAX_SEARCH_DEPTH
+        
+        # Random tie-breakers give variety between equally ordered moves
+        tie_breakers = {move: self._rng.random() for move in moves}
+        best_move = max(moves, key=tie_breakers.get)  # Fallback if not even depth 1 completes
+        
+        for depth in range(1, max_depth + 1):
+            hash_move = unpack_move(self.transposition_table.get_best_move(board.zobrist_key))
+            scores = self._score_moves(board, moves, 0, hash_move)
+            moves.sort(key=lambda m: (scores[m], tie_breakers[m]), reverse=True)
+            if self.workers > 1:
+                move, score = self._search_root_parallel(board, moves, depth, hash_move)
+            else:
+                move, score = self._search_root(board, moves, depth, hash_move)
+            if move is not None:
+                best_move = move
+                self.best_score = score
+            if self._stop:
+                break
+            self.completed_depth = depth
+            if progress_callback is not None:
+                elapsed = time.perf_counter() - start_time
+                progress_callback({
+                    'depth': depth,
+                    'score': score,
+                    'nodes': self.nodes,
+                    'nps': int(self.nodes / elapsed) if elapsed > 0 else 0,
+                    'time': elapsed,
+                    'best_move': best_move,
+                    'pv': self.get_principal_variation(board, depth),
+                })
+            if abs(score) > MATE_THRESHOLD:
+                break  # Forced mate found; deeper search cannot improve it
+        
+        return best_move
+    
+    def _search_root(self, board: Board, moves: List, depth: int, hash_move):
+        """
+        Search all root moves to a fixed depth.
+        
+        Args:
+            board: Current board state
+            moves: Legal root moves, already ordered
+            depth: Search depth for this iteration
+            hash_move: Previous best move, which the ordering put first
+            
+        Returns:
+            (best move, score). If the search was stopped, the best move is
+            only returned when it beat the previous iteration's best move,
+            which is searched first; otherwise it is None.
+        """
         # Use minimax with alpha-beta pruning
         best_move = None
         best_score = float('-inf')
         alpha = float('-inf')
         beta = float('inf')
+        if hash_move not in moves:
+            hash_move = None
         
-        # Shuffle moves for variety
-        random.shuffle(moves)
-        
-        for move in moves:
-            # Make the move on a copy
-            test_board = board.copy()
-            start, end = move
-            test_board.make_move(start, end)
+        for index, move in enumerate(moves):
+            # Make the move in place and undo it after searching
+            board.push(move)
             
             # Evaluate the move
-            score = self._minimax(test_board, self.depth - 1, alpha, beta, False, color)
+            score = -self._minimax(board, depth - 1, -beta, -alpha, 1)
+            board.pop()
+            
+            if self._stop:
+                if hash_move is None or index == 0:
+                    best_move = None  # Nothing reliable from this iteration
+                break
             
             if score > best_score:
                 best_score = score
                 best_move = move
             
             alpha = max(alpha, best_score)
-            if beta <= alpha:
-                break  # Alpha-beta pruning
         
-        return best_move if best_move else moves[0]  # Fallback to first move
+        if best_move and not self._stop:
+            self.transposition_table.store(board.zobrist_key, depth, best_score, EXACT,
+                                           pack_move(best_move))
+        
+        return best_move, best_score
     
-    def _minimax(self, board: Board, depth: int, alpha: float, beta: float, 
-                 maximizing: bool, ai_color: str) -> float:
+    def _search_root_parallel(self, board: Board, moves: List, depth: int, hash_move):
         """
-        Minimax algorithm with alpha-beta pruning.
+        Search all root moves to a fixed depth across the worker processes.
+        
+        The first move is searched on its own so that the rest start with
+        its score as alpha; the remaining moves are then searched at once.
+        
+        Args:
+            board: Current board state
+            moves: Legal root moves, already ordered
+            depth: Search depth for this iteration
+            hash_move: Previous best move, which the ordering put first
+            
+        Returns:
+            (best move, score), with the same rules as _search_root when
+            the search was stopped
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+        pool = self._get_pool()
+        state = board.to_state()
+        with self._shared_alpha.get_lock():
+            self._shared_search.value += 1
+            self._shared_alpha.value = float('-inf')
+        search_id = self._shared_search.value
+        generation = self.transposition_table.age
+        if hash_move not in moves:
+            hash_move = None
+        
+        # Move -> (score, whether it beat the alpha it was searched with)
+        results = {}
+        for batch in (moves[:1], moves[1:]):
+            if not batch:
+                break
+            time_left = (max(0.0, self._deadline - time.perf_counter())
+                         if self._deadline is not None else None)
+            # Split the node budget so the batch as a whole cannot overshoot it
+            nodes_left = (max(1, (self._node_budget - self.nodes) // len(batch))
+                          if self._node_budget is not None else None)
+            pending = {
+                pool.submit(_search_root_move, state, move, depth, time_left, nodes_left,
+                            search_id, generation)
+                for move in batch
+            }
+            self._futures = pending
+            # Loop until every task has finished, including ones already
+            # running when a stop arrives, before the shared values are reused
+            while pending:
+                done, pending = wait(pending, timeout=WAIT_INTERVAL,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    move, score, searched_alpha, nodes = future.result()
+                    self.nodes += nodes
+                    if score is not None:
+                        results[move] = (score, score > searched_alpha)
+                if pending and not self._stop:
+                    self._check_limits()
+                if self._stop and pending:
+                    self._shared_stop.value = 1
+                    for future in pending:
+                        future.cancel()
+            self._futures = set()
+            if self._stop:
+                break
+        
+        if self._stop and (hash_move is None or moves[0] not in results):
+            return None, float('-inf')  # Nothing reliable from this iteration
+        
+        # Fail-low scores are only upper bounds, so exact scores win ties
+        best_move = None
+        best_result = (float('-inf'), False)
+        for move in moves:
+            if move in results and results[move] > best_result:
+                best_move = move
+                best_result = results[move]
+        best_score = best_result[0]
+        
+        if best_move and not self._stop:
+            self.transposition_table.store(board.zobrist_key, depth, best_score, EXACT,
+                                           pack_move(best_move))
+        
+        return best_move, best_score
+    
+    def _get_pool(self):
+        """Start the worker processes on first use."""
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._mp_context,
+                initializer=_init_worker,
+                initargs=(self._shared_alpha, self._shared_stop, self._shared_search,
+                          self.hash_size_mb, self.eval_mobility)
+            )
+        return self._pool
+    
+    def _check_limits(self):
+        """Stop the search once the time or node budget is spent or a stop is shared."""
+        if self._node_budget is not None and self.nodes >= self._node_budget:
+            self._stop = True
+        elif self._deadline is not None and time.perf_counter() >= self._deadline:
+            self._stop = True
+        elif self._shared_stop is not None and self._shared_stop.value:
+            self._stop = True
+    
+    def _minimax(self, board: Board, depth: int, alpha: float, beta: float, ply: int) -> float:
+        """
+        Minimax algorithm with alpha-beta pruning, in negamax form.
+        
+        Scores are from the point of view of the side to move, so each
+        child's score is negated. Results are cached in the transposition
+        table together with whether they are exact or only a bound.
         
         Args:
             board: Current board state
             depth: Remaining search depth
-            alpha: Best value for maximizing player
-            beta: Best value for minimizing player
-            maximizing: True if maximizing (AI's turn), False if minimizing (opponent's turn)
-            ai_color: Color the AI is playing
+            alpha: Score the side to move is already guaranteed
+            beta: Score above which the opponent will avoid this line
+            ply: Distance from the root, used to prefer faster mates
             
         Returns:
-            Evaluation score
+            Evaluation score for the side to move
         """
-        # Terminal conditions
+        self.nodes += 1
+        if self.nodes % CHECK_INTERVAL == 0:
+            self._check_limits()
+        if self._stop:
+            return 0  # Result is discarded by the caller
+        
+        # A position repeated once is scored as a draw: whichever side could
+        # gain from the repetition can repeat it again
+        if board.repetition_count() > 1:
+            return 0
+        
+        # Checked before the table probe, as keys do not include the clock;
+        # checkmate still takes precedence over the fifty-move rule
+        if board.halfmove_clock >= FIFTY_MOVE_PLIES:
+            color = board.current_turn
+            if board.is_in_check(color) and not generate_legal_moves(board, color):
+                return -(MATE_SCORE - ply)
+            return 0
+        
+        # Terminal conditions: resolve captures before evaluating
         if depth == 0:
-            return self._evaluate_board(board, ai_color)
+            return self._quiescence(board, alpha, beta, ply)
+        
+        key = board.zobrist_key
+        original_alpha = alpha
+        hash_move = None
+        entry = self.transposition_table.probe(key)
+        if entry is not None:
+            hash_move = unpack_move(entry[BEST_MOVE])
+            if entry[DEPTH] >= depth:
+                score = _score_from_table(entry[SCORE], ply)
+                if entry[FLAG] == EXACT:
+                    return score
+                if entry[FLAG] == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
         
-        current_color = ai_color if maximizing else ('black' if ai_color == 'white' else 'white')
-        moves = board.get_all_moves(current_color)
+        current_color = board.current_turn
+        moves = generate_legal_moves(board, current_color)  # Search positions rarely repeat; skip the cache
         
         if not moves:
             # No moves available - check if checkmate or stalemate
             if board.is_in_check(current_color):
-                return float('-inf') if maximizing else float('inf')  # Checkmate
+                return -(MATE_SCORE - ply)  # Checkmate
             else:
                 return 0  # Stalemate
         
-        if maximizing:
-            max_score = float('-inf')
-            for move in moves:
-                test_board = board.copy()
-                test_board.make_move(move[0], move[1])
-                score = self._minimax(test_board, depth - 1, alpha, beta, False, ai_color)
-                max_score = max(max_score, score)
-                alpha = max(alpha, score)
-                if beta <= alpha:
-                    break  # Alpha-beta pruning
-            return max_score
+        scores = self._score_moves(board, moves, ply, hash_move)
+        moves.sort(key=scores.__getitem__, reverse=True)
+        
+        best_score = float('-inf')
+        best_move = None
+        for move in moves:
+            board.push(move)
+            score = -self._minimax(board, depth - 1, -beta, -alpha, ply + 1)
+            board.pop()
+            if self._stop:
+                return 0  # Incomplete; do not cache
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+            if beta <= alpha:
+                end_row, end_col = move[1]
+                if board.grid[end_row][end_col] is None:
+                    self._record_quiet_cutoff(board, move, depth, ply)
+                break  # Alpha-beta pruning
+        
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
         else:
-            min_score = float('inf')
-            for move in moves:
-                test_board = board.copy()
-                test_board.make_move(move[0], move[1])
-                score = self._minimax(test_board, depth - 1, alpha, beta, True, ai_color)
-                min_score = min(min_score, score)
-                beta = min(beta, score)
-                if beta <= alpha:
-                    break  # Alpha-beta pruning
-            return min_score
+            flag = EXACT
+        self.transposition_table.store(key, depth, _score_to_table(best_score, ply), flag,
+                                       pack_move(best_move) if best_move else NULL_MOVE)
+        
+        return best_score
     
-    def _evaluate_board(self, board: Board, color: str) -> float:
+    def _quiescence(self, board: Board, alpha: float, beta: float, ply: int) -> float:
         """
-        Evaluate the board position for the given color.
+        Search captures and promotions until the position is quiet.
+        
+        The side to move may "stand pat" on the static evaluation instead of
+        capturing, so only forcing moves are searched. Captures that cannot
+        raise the score to alpha are skipped (delta pruning). When in check,
+        all evasions are searched and having none is checkmate.
         
         Args:
-            board: Board state to evaluate
-            color: Color to evaluate for
+            board: Current board state
+            alpha: Score the side to move is already guaranteed
+            beta: Score above which the opponent will avoid this line
+            ply: Distance from the root
             
         Returns:
-            Evaluation score (positive is better for the color)
+            Evaluation score for the side to move
         """
-        # Material balance
-        material = self.evaluator.calculate_material_balance(board, color)
+        self.nodes += 1
+        if self.nodes % CHECK_INTERVAL == 0:
+            self._check_limits()
+        if self._stop:
+            return 0  # Result is discarded by the caller
+        
+        color = board.current_turn
+        in_check = board.is_in_check(color)
+        if in_check:
+            moves = generate_legal_moves(board, color)
+            if not moves:
+                return -(MATE_SCORE - ply)  # Checkmate
+            best_score = float('-inf')
+            stand_pat = None
+        else:
+            stand_pat = self._evaluate_board(board, color)
+            if stand_pat >= beta or ply >= MAX_SEARCH_DEPTH:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+            best_score = stand_pat
+            moves = generate_legal_moves(board, color, captures_only=True)
         
-        # Position score
-        position = self.evaluator.calculate_position_score(board, color)
+        scores = self._score_moves(board, moves, ply, None)
+        moves.sort(key=scores.__getitem__, reverse=True)
         
-        # Check/checkmate bonus/penalty
-        check_bonus = 0
-        opponent_color = 'black' if color == 'white' else 'white'
-        if board.is_in_check(opponent_color):
-            if board.is_checkmate(opponent_color):
-                check_bonus = 1000  # Checkmate is very good
-            else:
-                check_bonus = 50  # Check is good
+        grid = board.grid
+        for move in moves:
+            if stand_pat is not None:
+                end_row, end_col = move[1]
+                victim = grid[end_row][end_col]
+                if victim is not None:
+                    gain = MATERIAL_BY_INDEX[victim.index]
+                elif end_row == 0 or end_row == 7:
+                    gain = MATERIAL_VALUES['queen'] - MATERIAL_VALUES['pawn']
+                else:
+                    gain = MATERIAL_VALUES['pawn']  # En passant
+                if stand_pat + gain + DELTA_MARGIN < alpha:
+                    continue  # Delta pruning
+            
+            board.push(move)
+            score = -self._quiescence(board, -beta, -alpha, ply + 1)
+            board.pop()
+            if self._stop:
+                return 0
+            if score > best_score:
+                best_score = score
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+        
+        return best_score
+    
+    def _score_moves(self, board: Board, moves: List, ply: int, hash_move) -> dict:
+        """
+        Give each move an ordering score; higher scores are searched first.
+        
+        Order: hash move, captures by most valuable victim / least valuable
+        attacker (promotions count as capturing a queen), killer moves for
+        this ply, then quiet moves by history score.
         
-        if board.is_in_check(color):
-            if board.is_checkmate(color):
-                check_bonus = -1000  # Being checkmated is very bad
+        Args:
+            board: Current board state
+            moves: Moves to score
+            ply: Distance from the root
+            hash_move: Best move stored in the transposition table, or None
+            
+        Returns:
+            Dict mapping each move to its score
+        """
+        grid = board.grid
+        en_passant = board.en_passant_target
+        killers = self._killers[ply] if ply < len(self._killers) else (None, None)
+        history = self._history[0 if board.current_turn == 'white' else 1]
+        scores = {}
+        for move in moves:
+            if move == hash_move:
+                scores[move] = HASH_MOVE_SCORE
+                continue
+            (start_row, start_col), (end_row, end_col) = move
+            attacker = grid[start_row][start_col]
+            victim = grid[end_row][end_col]
+            if victim is not None:
+                scores[move] = (CAPTURE_SCORE + 10 * ORDER_VALUES[victim.type_index] -
+                                ORDER_VALUES[attacker.type_index])
+            elif attacker.type_index == PAWN and (end_row == 0 or end_row == 7):
+                scores[move] = CAPTURE_SCORE + 10 * PIECE_VALUES['queen']
+            elif attacker.type_index == PAWN and en_passant == (end_row, end_col):
+                scores[move] = CAPTURE_SCORE + 10 * PIECE_VALUES['pawn'] - PIECE_VALUES['pawn']
+            elif move == killers[0]:
+                scores[move] = KILLER_SCORE + 1
+            elif move == killers[1]:
+                scores[move] = KILLER_SCORE
             else:
-                check_bonus = -25  # Being in check is bad
+                scores[move] = history[(start_row * 8 + start_col) * 64 + end_row * 8 + end_col]
+        return scores
+    
+    def _record_quiet_cutoff(self, board: Board, move, depth: int, ply: int):
+        """Remember a quiet move that caused a beta cutoff as a killer and in history."""
+        if ply < len(self._killers):
+            killers = self._killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        (start_row, start_col), (end_row, end_col) = move
+        history = self._history[0 if board.current_turn == 'white' else 1]
+        index = (start_row * 8 + start_col) * 64 + end_row * 8 + end_col
+        # Keep history below the killer tier
+        history[index] = min(history[index] + depth * depth, KILLER_SCORE - 1)
+    
+    def get_principal_variation(self, board: Board, max_length: int = MAX_SEARCH_DEPTH) -> List:
+        """
+        Follow the best moves stored in the transposition table from a position.
+        
+        Args:
+            board: Position to start from; restored before returning
+            max_length: Maximum number of moves to follow
+            
+        Returns:
+            Expected line of play, stopping at a missing or illegal table
+            move or a repeated position
+        """
+        pv = []
+        seen = set()
+        while len(pv) < max_length and board.zobrist_key not in seen:
+            seen.add(board.zobrist_key)
+            move = unpack_move(self.transposition_table.get_best_move(board.zobrist_key))
+            if move is None or move not in board.get_all_moves(board.current_turn):
+                break
+            board.push(move)
+            pv.append(move)
+        for _ in pv:
+            board.pop()
+        return pv
+    
+    def get_stats(self) -> dict:
+        """Get transposition table counters from the searches so far."""
+        return self.transposition_table.stats()
+    
+    def _evaluate_board(self, board: Board, color: str) -> float:
+        """
+        Evaluate the board position for the given color.
+        
+        Uses the evaluator's fast score: material and piece-square totals
+        kept up to date by the board, plus optional mobility. No move
+        generation is needed. Checks and checkmates are
+        left to the search. The score is symmetric: evaluating for the
+        opponent gives the negated value, as the negamax search requires.
         
-        return material + position + check_bonus
+        Args:
+            board: Board state to evaluate
+            color: Color to evaluate for
+            
+        Returns:
+            Evaluation score in centipawns (positive is better for the color)
+        """
+        return self.evaluator.evaluate_fast(board, color, self.eval_mobility)
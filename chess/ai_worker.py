@@ -0,0 +1,105 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Background worker that runs ChessAI searches off the render thread.
+"""
+
+import queue
+import threading
+from typing import List, Optional, Tuple
+
+from chess.ai import ChessAI
+from chess.board import Board
+
+# Message kinds placed on AIWorker.messages
+PROGRESS = 'progress'
+BEST_MOVE = 'best_move'
+
+
+class AIWorker:
+    """Runs one ChessAI search at a time on a daemon thread."""
+    
+    def __init__(self):
+        """Initialize the worker."""
+        # (kind, payload) tuples: (PROGRESS, info dict) or (BEST_MOVE, move)
+        self.messages: "queue.Queue[Tuple[str, object]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._ai: Optional[ChessAI] = None
+        self._cancelled = False
+    
+    def start(self, ai: ChessAI, board: Board, color: str,
+              time_limit: Optional[float] = None):
+        """
+        Start searching for a move in the background.
+        
+        The search runs on a copy of the board, so the caller may keep
+        drawing and reading its own board meanwhile.
+        
+        Args:
+            ai: AI to search with
+            board: Current board state
+            color: Color to play
+            time_limit: Time budget in seconds (None for the AI's default)
+        """
+        self.cancel()
+        self._ai = ai
+        self._cancelled = False
+        self.messages = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, args=(ai, board.copy(), color, time_limit, self.messages),
+            daemon=True
+        )
+        self._thread.start()
+    
+    def _run(self, ai: ChessAI, board: Board, color: str,
+             time_limit: Optional[float], messages: queue.Queue):
+        """
+        Thread body: search and post progress and the result.
+        
+        BEST_MOVE is posted even if the search raises (with None as the
+        move), so the UI never waits forever for a failed search.
+        """
+        move = None
+        try:
+            move = ai.get_best_move(
+                board, color, time_limit=time_limit,
+                progress_callback=lambda info: messages.put((PROGRESS, info))
+            )
+        finally:
+            if not self._cancelled:
+                messages.put((BEST_MOVE, move))
+    
+    def is_running(self) -> bool:
+        """Check if a search is in progress."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def poll(self) -> List[Tuple[str, object]]:
+        """
+        Get all messages posted since the last poll without blocking.
+        
+        Returns:
+            List of (kind, payload) tuples
+        """
+        results = []
+        while True:
+            try:
+                results.append(self.messages.get_nowait())
+            except queue.Empty:
+                return results
+    
+    def cancel(self, timeout: float = 1.0):
+        """
+        Stop the current search and discard its result.
+        
+        Args:
+            timeout: Seconds to wait for the search thread to finish
+        """
+        if not self.is_running():
+            return
+        self._cancelled = True
+        waited = 0.0
+        while self._thread.is_alive() and waited < timeout:
+            # Repeat the request in case the search had not started yet
+            self._ai.stop()
+            self._thread.join(0.05)
+            waited += 0.05
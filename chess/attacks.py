@@ -0,0 +1,134 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Precomputed attack tables for every square, built once at import time.
+
+Leaper tables (knight, king, pawn) are given both as bitboard masks and as
+lists of (row, col) targets. Sliding pieces use per-direction rays from each
+square, again as masks and as ordered target lists.
+"""
+
+from typing import List, Tuple
+
+from chess.bitboard import lsb
+
+# Directions as (row step, col step); rook directions first, then bishop
+DIRECTIONS = [
+    (0, 1), (0, -1), (1, 0), (-1, 0),
+    (1, 1), (1, -1), (-1, 1), (-1, -1)
+]
+ROOK_DIRECTIONS = (0, 1, 2, 3)
+BISHOP_DIRECTIONS = (4, 5, 6, 7)
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+
+# A direction is "positive" if it walks toward higher square indices, so the
+# nearest blocker on its ray is the lowest set bit (otherwise the highest)
+POSITIVE_DIRECTION = [dr > 0 or (dr == 0 and dc > 0) for dr, dc in DIRECTIONS]
+
+KNIGHT_OFFSETS = [
+    (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+    (1, -2), (1, 2), (2, -1), (2, 1)
+]
+KING_OFFSETS = [
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1)
+]
+
+
+def _leaper_targets(offsets) -> List[List[Tuple[int, int]]]:
+    """Build per-square target lists for a piece with fixed jump offsets."""
+    table = []
+    for square in range(64):
+        row, col = square >> 3, square & 7
+        table.append([
+            (row + dr, col + dc) for dr, dc in offsets
+            if 0 <= row + dr < 8 and 0 <= col + dc < 8
+        ])
+    return table
+
+
+def _to_mask(targets: List[Tuple[int, int]]) -> int:
+    """Convert a list of (row, col) targets to a bitboard."""
+    mask = 0
+    for row, col in targets:
+        mask |= 1 << (row * 8 + col)
+    return mask
+
+
+def _ray_targets(dr: int, dc: int) -> List[List[Tuple[int, int]]]:
+    """Build per-square lists of squares along one direction, nearest first."""
+    table = []
+    for square in range(64):
+        row, col = square >> 3, square & 7
+        ray = []
+        row, col = row + dr, col + dc
+        while 0 <= row < 8 and 0 <= col < 8:
+            ray.append((row, col))
+            row, col = row + dr, col + dc
+        table.append(ray)
+    return table
+
+
+KNIGHT_TARGETS = _leaper_targets(KNIGHT_OFFSETS)
+KNIGHT_ATTACKS = [_to_mask(targets) for targets in KNIGHT_TARGETS]
+
+KING_TARGETS = _leaper_targets(KING_OFFSETS)
+KING_ATTACKS = [_to_mask(targets) for targets in KING_TARGETS]
+
+# Squares attacked by a pawn of each color (index 0 white, 1 black).
+# White pawns move toward row 0, black pawns toward row 7.
+PAWN_TARGETS = [
+    _leaper_targets([(-1, -1), (-1, 1)]),
+    _leaper_targets([(1, -1), (1, 1)]),
+]
+PAWN_ATTACKS = [[_to_mask(targets) for targets in table] for table in PAWN_TARGETS]
+
+RAY_TARGETS = [_ray_targets(dr, dc) for dr, dc in DIRECTIONS]
+RAY_MASKS = [[_to_mask(ray) for ray in table] for table in RAY_TARGETS]
+
+
+def first_blocker(direction: int, square: int, occupied: int) -> int:
+    """
+    Find the first occupied square along a ray.
+    
+    Args:
+        direction: Index into DIRECTIONS
+        square: Square index the ray starts from (exclusive)
+        occupied: Occupancy bitboard
+        
+    Returns:
+        Square index of the nearest occupied square, or -1 if the ray is empty
+    """
+    blockers = RAY_MASKS[direction][square] & occupied
+    if not blockers:
+        return -1
+    if POSITIVE_DIRECTION[direction]:
+        return lsb(blockers)
+    return blockers.bit_length() - 1
+
+
+def sliding_attacks(square: int, directions, occupied: int) -> int:
+    """
+    Get the squares a slider attacks, stopping at (and including) blockers.
+    
+    Args:
+        square: Square index of the slider
+        directions: Direction indices to slide along
+        occupied: Occupancy bitboard
+        
+    Returns:
+        Bitboard of attacked squares
+    """
+    attacks = 0
+    for direction in directions:
+        ray = RAY_MASKS[direction][square]
+        blockers = ray & occupied
+        if blockers:
+            if POSITIVE_DIRECTION[direction]:
+                blocker = lsb(blockers)
+            else:
+                blocker = blockers.bit_length() - 1
+            ray ^= RAY_MASKS[direction][blocker]
+        attacks |= ray
+    return attacks
@@ -0,0 +1,69 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Bitboard helpers: square indexing, piece bitboard slots, and bit operations.
+
+Squares are numbered row-major in the same orientation as Board.grid, so
+square 0 is (0, 0) (a8) and square 63 is (7, 7) (h1). Bitboards are plain
+Python ints with bit ``n`` set when square ``n`` is occupied.
+"""
+
+from typing import Iterator, Tuple
+
+COLORS = ('white', 'black')
+PIECE_TYPES = ('pawn', 'knight', 'bishop', 'rook', 'queen', 'king')
+
+WHITE_INDEX = 0
+BLACK_INDEX = 1
+
+# Offsets of each piece type within a color's block of six bitboards
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+
+# Index of each (piece_type, color) bitboard in Board.bitboards
+PIECE_INDEX = {
+    (piece_type, color): color_index * 6 + type_index
+    for color_index, color in enumerate(COLORS)
+    for type_index, piece_type in enumerate(PIECE_TYPES)
+}
+
+COLOR_INDEX = {'white': WHITE_INDEX, 'black': BLACK_INDEX}
+
+FULL_BOARD = (1 << 64) - 1
+
+
+def square_index(row: int, col: int) -> int:
+    """Convert a (row, col) position to a square index (0-63)."""
+    return row * 8 + col
+
+
+def square_position(square: int) -> Tuple[int, int]:
+    """Convert a square index (0-63) to a (row, col) position."""
+    return square >> 3, square & 7
+
+
+def square_bit(row: int, col: int) -> int:
+    """Get the single-bit mask for a (row, col) position."""
+    return 1 << (row * 8 + col)
+
+
+if hasattr(int, 'bit_count'):
+    def popcount(bitboard: int) -> int:
+        """Count the set bits in a bitboard."""
+        return bitboard.bit_count()
+else:  # Python < 3.10
+    def popcount(bitboard: int) -> int:
+        """Count the set bits in a bitboard."""
+        return bin(bitboard).count('1')
+
+
+def lsb(bitboard: int) -> int:
+    """Get the index of the least significant set bit (-1 if empty)."""
+    return (bitboard & -bitboard).bit_length() - 1
+
+
+def iter_bits(bitboard: int) -> Iterator[int]:
+    """Yield the square index of every set bit, lowest first."""
+    while bitboard:
+        low = bitboard & -bitboard
+        yield low.bit_length() - 1
+        bitboard ^= low
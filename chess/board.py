@@ -4,9 +4,50 @@ Author: Sepehr Bayat | Open Source Chess MVP
 Board class for managing the chess board state, moves, and game rules.
 """
 
-from typing import Optional, Tuple, List
-from copy import deepcopy
+from typing import Dict, Optional, Tuple, List
 from chess.pieces import Piece, Pawn, Rook, Knight, Bishop, Queen, King
+from chess.bitboard import (
+    PIECE_INDEX, COLOR_INDEX, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING,
+    PIECE_TYPES, lsb, square_position, iter_bits
+)
+from chess.attacks import (
+    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, RAY_MASKS,
+    ROOK_DIRECTIONS, BISHOP_DIRECTIONS, first_blocker
+)
+from chess.movegen import generate_legal_moves
+from chess.zobrist import (
+    PIECE_KEYS, SIDE_KEY, CASTLING_KEYS, CASTLING_MASKS,
+    WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE,
+    castling_rights_from_pieces, en_passant_key, compute_key
+)
+from chess.notation import square_name, parse_square
+from chess.moves import unpack_move
+from chess.psqt import PIECE_SQUARE_TABLES, MATERIAL_BY_INDEX
+
+# Piece classes in PIECE_TYPES order, for rebuilding pieces from bitboards
+PIECE_CLASSES = (Pawn, Knight, Bishop, Rook, Queen, King)
+PIECE_CLASS_BY_TYPE = dict(zip(PIECE_TYPES, PIECE_CLASSES))
+PROMOTION_CLASSES = {'queen': Queen, 'rook': Rook, 'bishop': Bishop, 'knight': Knight}
+
+# Number of positions whose legal moves get_all_moves remembers
+MOVE_CACHE_SIZE = 16
+
+# Plies without a capture or pawn move after which the game is drawn
+FIFTY_MOVE_PLIES = 100
+
+STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# FEN piece letters (white upper case) and their piece types
+FEN_PIECE_TYPES = {'p': 'pawn', 'n': 'knight', 'b': 'bishop', 'r': 'rook', 'q': 'queen', 'k': 'king'}
+FEN_LETTERS = {piece_type: letter for letter, piece_type in FEN_PIECE_TYPES.items()}
+
+# FEN castling letters: (right, row, king col, rook col)
+FEN_CASTLING = (
+    ('K', WHITE_KINGSIDE, 7, 4, 7),
+    ('Q', WHITE_QUEENSIDE, 7, 4, 0),
+    ('k', BLACK_KINGSIDE, 0, 4, 7),
+    ('q', BLACK_QUEENSIDE, 0, 4, 0),
+)
 
 
 class Board:
@@ -15,43 +56,83 @@ class Board:
     def __init__(self):
         """Initialize an empty board."""
         self.grid: List[List[Optional[Piece]]] = [[None for _ in range(8)] for _ in range(8)]
+        # Bitboards kept in sync with grid: one per (piece_type, color),
+        # plus per-color and total occupancy masks
+        self.bitboards: List[int] = [0] * 12
+        self.color_occupancy: List[int] = [0, 0]
+        self.occupied = 0
+        # Zobrist position key, updated incrementally as pieces move
+        self.zobrist_key = 0
+        self.castling_rights = 0
+        # Running centipawn material and piece-square totals per color
+        # (index 0 white, 1 black), updated as pieces are placed and removed
+        self.material: List[int] = [0, 0]
+        self.psqt_score: List[int] = [0, 0]
         self.current_turn = 'white'
         self.move_history: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
         self.en_passant_target: Optional[Tuple[int, int]] = None
+        # Plies since the last capture or pawn move, and the FEN move number
+        # (starts at 1, counts up after each black move)
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+        # Undo records for push/pop, one per move made
+        self._undo_stack: List[tuple] = []
+        # Legal moves and check state by (zobrist_key, color), so the UI,
+        # move validation and status checks share one generation
+        self._move_cache: Dict[Tuple[int, str], Tuple[tuple, bool]] = {}
         self._initialize_board()
+        self.castling_rights = castling_rights_from_pieces(self)
+        self.zobrist_key = compute_key(self)
+        self._set_key_history([self.zobrist_key])
+    
+    def _set_key_history(self, keys: List[int]):
+        """
+        Replace the position key history.
+        
+        key_history holds the key of every position reached, ending with the
+        current one; _key_counts counts each key so repetition checks are a
+        single dict lookup. push and pop keep both in step.
+        
+        Args:
+            keys: Position keys, oldest first
+        """
+        self.key_history: List[int] = list(keys)
+        self._key_counts: Dict[int, int] = {}
+        for key in self.key_history:
+            self._key_counts[key] = self._key_counts.get(key, 0) + 1
     
     def _initialize_board(self):
         """Set up the initial chess board position."""
         # Place pawns
         for col in range(8):
-            self.grid[6][col] = Pawn('white', 6, col)
-            self.grid[1][col] = Pawn('black', 1, col)
+            self.set_piece(6, col, Pawn('white', 6, col))
+            self.set_piece(1, col, Pawn('black', 1, col))
         
         # Place rooks
-        self.grid[7][0] = Rook('white', 7, 0)
-        self.grid[7][7] = Rook('white', 7, 7)
-        self.grid[0][0] = Rook('black', 0, 0)
-        self.grid[0][7] = Rook('black', 0, 7)
+        self.set_piece(7, 0, Rook('white', 7, 0))
+        self.set_piece(7, 7, Rook('white', 7, 7))
+        self.set_piece(0, 0, Rook('black', 0, 0))
+        self.set_piece(0, 7, Rook('black', 0, 7))
         
         # Place knights
-        self.grid[7][1] = Knight('white', 7, 1)
-        self.grid[7][6] = Knight('white', 7, 6)
-        self.grid[0][1] = Knight('black', 0, 1)
-        self.grid[0][6] = Knight('black', 0, 6)
+        self.set_piece(7, 1, Knight('white', 7, 1))
+        self.set_piece(7, 6, Knight('white', 7, 6))
+        self.set_piece(0, 1, Knight('black', 0, 1))
+        self.set_piece(0, 6, Knight('black', 0, 6))
         
         # Place bishops
-        self.grid[7][2] = Bishop('white', 7, 2)
-        self.grid[7][5] = Bishop('white', 7, 5)
-        self.grid[0][2] = Bishop('black', 0, 2)
-        self.grid[0][5] = Bishop('black', 0, 5)
+        self.set_piece(7, 2, Bishop('white', 7, 2))
+        self.set_piece(7, 5, Bishop('white', 7, 5))
+        self.set_piece(0, 2, Bishop('black', 0, 2))
+        self.set_piece(0, 5, Bishop('black', 0, 5))
         
         # Place queens
-        self.grid[7][3] = Queen('white', 7, 3)
-        self.grid[0][3] = Queen('black', 0, 3)
+        self.set_piece(7, 3, Queen('white', 7, 3))
+        self.set_piece(0, 3, Queen('black', 0, 3))
         
         # Place kings
-        self.grid[7][4] = King('white', 7, 4)
-        self.grid[0][4] = King('black', 0, 4)
+        self.set_piece(7, 4, King('white', 7, 4))
+        self.set_piece(0, 4, King('black', 0, 4))
     
     def get_piece(self, row: int, col: int) -> Optional[Piece]:
         """Get the piece at the given position."""
@@ -59,6 +140,43 @@ class Board:
             return self.grid[row][col]
         return None
     
+    def set_piece(self, row: int, col: int, piece: Optional[Piece]):
+        """
+        Place a piece on a square (or clear it), keeping bitboards, the
+        position key and the material/piece-square totals in sync.
+        
+        Args:
+            row, col: Square to update
+            piece: Piece to place, or None to empty the square
+        """
+        square = row * 8 + col
+        bit = 1 << square
+        old_piece = self.grid[row][col]
+        if old_piece is not None:
+            index = old_piece.index
+            color_index = old_piece.color_index
+            self.bitboards[index] &= ~bit
+            self.color_occupancy[color_index] &= ~bit
+            self.occupied &= ~bit
+            self.zobrist_key ^= PIECE_KEYS[index][square]
+            self.material[color_index] -= MATERIAL_BY_INDEX[index]
+            self.psqt_score[color_index] -= PIECE_SQUARE_TABLES[index][square]
+        
+        self.grid[row][col] = piece
+        if piece is not None:
+            index = piece.index
+            color_index = piece.color_index
+            self.bitboards[index] |= bit
+            self.color_occupancy[color_index] |= bit
+            self.occupied |= bit
+            self.zobrist_key ^= PIECE_KEYS[index][square]
+            self.material[color_index] += MATERIAL_BY_INDEX[index]
+            self.psqt_score[color_index] += PIECE_SQUARE_TABLES[index][square]
+    
+    def get_bitboard(self, piece_type: str, color: str) -> int:
+        """Get the bitboard of all pieces of a type and color."""
+        return self.bitboards[PIECE_INDEX[(piece_type, color)]]
+    
     def is_valid_position(self, row: int, col: int) -> bool:
         """Check if the position is valid (within board bounds)."""
         return 0 <= row < 8 and 0 <= col < 8
@@ -86,54 +204,156 @@ class Board:
         if end not in valid_moves:
             return False
         
+        self.push((start, end))
+        return True
+    
+    def push(self, move: Tuple[Tuple[int, int], Tuple[int, int]]):
+        """
+        Make a move in place without validating it, recording how to undo it.
+        
+        The move must be legal for the side to move; use make_move for
+        validated moves. Every push must be matched by a pop.
+        
+        Args:
+            move: ((start_row, start_col), (end_row, end_col)), with an
+                optional third element naming the promotion piece type
+                (default queen), or the same move packed by chess.moves
+        """
+        if isinstance(move, int):
+            move = unpack_move(move)
+        start, end = move[0], move[1]
+        start_row, start_col = start
+        end_row, end_col = end
+        
+        piece = self.grid[start_row][start_col]
+        captured_piece = self.grid[end_row][end_col]
+        captured_position = end
+        previous_en_passant = self.en_passant_target
+        previous_has_moved = piece.has_moved
+        previous_key = self.zobrist_key
+        previous_castling = self.castling_rights
+        previous_halfmove = self.halfmove_clock
+        rook_move = None
+        is_pawn = piece.type_index == PAWN
+        
+        # Take the old en passant file out of the key
+        self.zobrist_key ^= en_passant_key(self)
+        
         # Handle en passant capture
-        captured_piece = self.get_piece(end_row, end_col)
-        if (piece.piece_type == 'pawn' and 
-            self.en_passant_target == (end_row, end_col) and
+        if (is_pawn and
+            previous_en_passant == end and
             captured_piece is None):
-            # Capture the pawn that moved two squares
-            direction = -1 if piece.color == 'white' else 1
-            captured_pawn = self.get_piece(end_row - direction, end_col)
-            if captured_pawn:
-                self.grid[end_row - direction][end_col] = None
+            # Capture the pawn that moved two squares (it sits beside the start square)
+            captured_piece = self.grid[start_row][end_col]
+            captured_position = (start_row, end_col)
+            if captured_piece:
+                self.set_piece(start_row, end_col, None)
         
         # Handle castling
-        if piece.piece_type == 'king' and abs(end_col - start_col) == 2:
+        if piece.type_index == KING and abs(end_col - start_col) == 2:
             if end_col > start_col:  # Kingside
-                rook = self.get_piece(start_row, 7)
-                self.grid[start_row][7] = None
-                self.grid[start_row][5] = rook
-                if rook:
-                    rook.set_position(start_row, 5)
+                rook_from, rook_to = 7, 5
             else:  # Queenside
-                rook = self.get_piece(start_row, 0)
-                self.grid[start_row][0] = None
-                self.grid[start_row][3] = rook
-                if rook:
-                    rook.set_position(start_row, 3)
+                rook_from, rook_to = 0, 3
+            rook = self.grid[start_row][rook_from]
+            if rook:
+                rook_move = (rook, start_row, rook_from, rook_to, rook.has_moved)
+                self.set_piece(start_row, rook_from, None)
+                self.set_piece(start_row, rook_to, rook)
+                rook.set_position(start_row, rook_to)
         
         # Update en passant target
         self.en_passant_target = None
-        if piece.piece_type == 'pawn' and abs(end_row - start_row) == 2:
+        if is_pawn and abs(end_row - start_row) == 2:
             direction = -1 if piece.color == 'white' else 1
             self.en_passant_target = (start_row + direction, start_col)
         
         # Move the piece
-        self.grid[start_row][start_col] = None
-        self.grid[end_row][end_col] = piece
+        self.set_piece(start_row, start_col, None)
+        self.set_piece(end_row, end_col, piece)
         piece.set_position(end_row, end_col)
         
         # Handle pawn promotion
-        if piece.piece_type == 'pawn' and (end_row == 0 or end_row == 7):
-            self.grid[end_row][end_col] = Queen(piece.color, end_row, end_col)
-        
-        # Record move
-        self.move_history.append((start, end))
+        if is_pawn and (end_row == 0 or end_row == 7):
+            promotion = PROMOTION_CLASSES[move[2]] if len(move) > 2 else Queen
+            self.set_piece(end_row, end_col, promotion(piece.color, end_row, end_col))
+        
+        # Update castling rights for pieces leaving or arriving on home squares
+        self.castling_rights &= CASTLING_MASKS[start_row * 8 + start_col] & CASTLING_MASKS[end_row * 8 + end_col]
+        if self.castling_rights != previous_castling:
+            self.zobrist_key ^= CASTLING_KEYS[previous_castling] ^ CASTLING_KEYS[self.castling_rights]
+        
+        # Update move clocks
+        if is_pawn or captured_piece is not None:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+        if piece.color == 'black':
+            self.fullmove_number += 1
+        
+        # Record move and undo information
+        self.move_history.append(move)
+        self._undo_stack.append((
+            move, piece, captured_piece, captured_position,
+            previous_en_passant, previous_has_moved, rook_move,
+            previous_key, previous_castling, previous_halfmove
+        ))
         
         # Switch turn
         self.current_turn = 'black' if self.current_turn == 'white' else 'white'
+        key = self.zobrist_key ^ SIDE_KEY ^ en_passant_key(self)
+        self.zobrist_key = key
+        self.key_history.append(key)
+        self._key_counts[key] = self._key_counts.get(key, 0) + 1
+    
+    def pop(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        Undo the last move made with push or make_move.
         
-        return True
+        Returns:
+            The move that was undone
+        """
+        (move, piece, captured_piece, captured_position,
+         previous_en_passant, previous_has_moved, rook_move,
+         previous_key, previous_castling, previous_halfmove) = self._undo_stack.pop()
+        self.move_history.pop()
+        key = self.key_history.pop()
+        count = self._key_counts[key] - 1
+        if count:
+            self._key_counts[key] = count
+        else:
+            del self._key_counts[key]
+        (start_row, start_col), (end_row, end_col) = move[0], move[1]
+        
+        # Switch turn back
+        self.current_turn = piece.color
+        
+        # Move the piece back (this also removes a promoted piece)
+        self.set_piece(end_row, end_col, None)
+        self.set_piece(start_row, start_col, piece)
+        piece.row = start_row
+        piece.col = start_col
+        piece.has_moved = previous_has_moved
+        
+        # Restore captured piece (including en passant captures)
+        if captured_piece is not None:
+            self.set_piece(captured_position[0], captured_position[1], captured_piece)
+        
+        # Move the castling rook back
+        if rook_move is not None:
+            rook, rook_row, rook_from, rook_to, rook_has_moved = rook_move
+            self.set_piece(rook_row, rook_to, None)
+            self.set_piece(rook_row, rook_from, rook)
+            rook.col = rook_from
+            rook.has_moved = rook_has_moved
+        
+        self.en_passant_target = previous_en_passant
+        self.castling_rights = previous_castling
+        self.zobrist_key = previous_key
+        self.halfmove_clock = previous_halfmove
+        if piece.color == 'black':
+            self.fullmove_number -= 1
+        return move
     
     def is_move_safe(self, start_row: int, start_col: int, 
                      end_row: int, end_col: int, color: str) -> bool:
@@ -148,19 +368,15 @@ class Board:
         Returns:
             True if move is safe (doesn't leave king in check)
         """
-        # Create a temporary board to test the move
-        temp_board = self.copy()
-        piece = temp_board.get_piece(start_row, start_col)
-        if piece is None:
+        if self.grid[start_row][start_col] is None:
             return False
         
-        # Make the move on temp board
-        temp_board.grid[start_row][start_col] = None
-        temp_board.grid[end_row][end_col] = piece
-        piece.set_position(end_row, end_col)
+        # Try the move in place and undo it afterwards
+        self.push(((start_row, start_col), (end_row, end_col)))
+        in_check = self.is_in_check(color)
+        self.pop()
         
-        # Check if king is in check after move
-        return not temp_board.is_in_check(color)
+        return not in_check
     
     def is_square_attacked(self, row: int, col: int, by_color: str) -> bool:
         """
@@ -173,100 +389,36 @@ class Board:
         Returns:
             True if square is attacked by opponent
         """
-        opponent_color = 'black' if by_color == 'white' else 'white'
-        
-        # Check all opponent pieces
-        for r in range(8):
-            for c in range(8):
-                piece = self.get_piece(r, c)
-                if piece and piece.color == opponent_color:
-                    # Get raw moves without check filtering (for attack detection)
-                    raw_moves = self._get_raw_moves(piece)
-                    if (row, col) in raw_moves:
+        square = row * 8 + col
+        own_index = COLOR_INDEX[by_color]
+        base = 6 * (1 - own_index)  # Opponent's block of bitboards
+        bitboards = self.bitboards
+        
+        # Leapers: look outward from the square with the same attack pattern
+        if KNIGHT_ATTACKS[square] & bitboards[base + KNIGHT]:
+            return True
+        if KING_ATTACKS[square] & bitboards[base + KING]:
+            return True
+        # A pawn of our color on this square would attack exactly the
+        # squares from which an opponent pawn attacks it
+        if PAWN_ATTACKS[own_index][square] & bitboards[base + PAWN]:
+            return True
+        
+        # Sliders: the nearest piece on a ray must be a matching slider
+        queens = bitboards[base + QUEEN]
+        occupied = self.occupied
+        for directions, sliders in ((ROOK_DIRECTIONS, bitboards[base + ROOK] | queens),
+                                    (BISHOP_DIRECTIONS, bitboards[base + BISHOP] | queens)):
+            if not sliders:
+                continue
+            for direction in directions:
+                if RAY_MASKS[direction][square] & sliders:
+                    blocker = first_blocker(direction, square, occupied)
+                    if (sliders >> blocker) & 1:
                         return True
         
         return False
     
-    def _get_raw_moves(self, piece: Piece) -> List[Tuple[int, int]]:
-        """Get moves without check filtering (for attack detection)."""
-        moves = []
-        
-        if piece.piece_type == 'pawn':
-            direction = -1 if piece.color == 'white' else 1
-            # Diagonal captures
-            for col_offset in [-1, 1]:
-                new_col = piece.col + col_offset
-                new_row = piece.row + direction
-                if 0 <= new_row < 8 and 0 <= new_col < 8:
-                    moves.append((new_row, new_col))
-        
-        elif piece.piece_type == 'rook':
-            directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-            for dr, dc in directions:
-                for i in range(1, 8):
-                    new_row = piece.row + (dr * i)
-                    new_col = piece.col + (dc * i)
-                    if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                        break
-                    moves.append((new_row, new_col))
-                    target = self.get_piece(new_row, new_col)
-                    if target is not None:
-                        break
-        
-        elif piece.piece_type == 'knight':
-            knight_moves = [
-                (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-                (1, -2), (1, 2), (2, -1), (2, 1)
-            ]
-            for dr, dc in knight_moves:
-                new_row = piece.row + dr
-                new_col = piece.col + dc
-                if 0 <= new_row < 8 and 0 <= new_col < 8:
-                    moves.append((new_row, new_col))
-        
-        elif piece.piece_type == 'bishop':
-            directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-            for dr, dc in directions:
-                for i in range(1, 8):
-                    new_row = piece.row + (dr * i)
-                    new_col = piece.col + (dc * i)
-                    if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                        break
-                    moves.append((new_row, new_col))
-                    target = self.get_piece(new_row, new_col)
-                    if target is not None:
-                        break
-        
-        elif piece.piece_type == 'queen':
-            directions = [
-                (0, 1), (0, -1), (1, 0), (-1, 0),
-                (1, 1), (1, -1), (-1, 1), (-1, -1)
-            ]
-            for dr, dc in directions:
-                for i in range(1, 8):
-                    new_row = piece.row + (dr * i)
-                    new_col = piece.col + (dc * i)
-                    if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                        break
-                    moves.append((new_row, new_col))
-                    target = self.get_piece(new_row, new_col)
-                    if target is not None:
-                        break
-        
-        elif piece.piece_type == 'king':
-            king_moves = [
-                (-1, -1), (-1, 0), (-1, 1),
-                (0, -1),           (0, 1),
-                (1, -1),  (1, 0),  (1, 1)
-            ]
-            for dr, dc in king_moves:
-                new_row = piece.row + dr
-                new_col = piece.col + dc
-                if 0 <= new_row < 8 and 0 <= new_col < 8:
-                    moves.append((new_row, new_col))
-        
-        return moves
-    
     def is_in_check(self, color: str) -> bool:
         """
         Check if the king of the given color is in check.
@@ -278,41 +430,51 @@ class Board:
             True if king is in check
         """
         # Find the king
-        king = None
-        for row in range(8):
-            for col in range(8):
-                piece = self.get_piece(row, col)
-                if piece and piece.piece_type == 'king' and piece.color == color:
-                    king = piece
-                    break
-            if king:
-                break
-        
-        if king is None:
+        king_bitboard = self.bitboards[PIECE_INDEX[('king', color)]]
+        if not king_bitboard:
             return False
         
         # Check if any opponent piece can attack the king's square
-        return self.is_square_attacked(king.row, king.col, color)
+        row, col = square_position(lsb(king_bitboard))
+        return self.is_square_attacked(row, col, color)
     
     def get_all_moves(self, color: str) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
         Get all valid moves for a given color.
         
+        Results are remembered per position, so asking again before the
+        position changes costs no move generation.
+        
         Args:
             color: 'white' or 'black'
             
         Returns:
             List of ((start_row, start_col), (end_row, end_col)) tuples
         """
-        moves = []
-        for row in range(8):
-            for col in range(8):
-                piece = self.get_piece(row, col)
-                if piece and piece.color == color:
-                    valid_moves = piece.get_valid_moves(self)
-                    for end_pos in valid_moves:
-                        moves.append(((row, col), end_pos))
-        return moves
+        return list(self._legal_state(color)[0])
+    
+    def _legal_state(self, color: str) -> Tuple[tuple, bool]:
+        """
+        Get the legal moves and check state of a color, generating them once
+        per position.
+        
+        The zobrist key changes with every set_piece, push and pop, so
+        entries never need invalidating; the cache is simply emptied when full.
+        
+        Args:
+            color: 'white' or 'black'
+            
+        Returns:
+            (tuple of legal moves, whether the color is in check)
+        """
+        cache_key = (self.zobrist_key, color)
+        state = self._move_cache.get(cache_key)
+        if state is None:
+            if len(self._move_cache) >= MOVE_CACHE_SIZE:
+                self._move_cache.clear()
+            state = (tuple(generate_legal_moves(self, color)), self.is_in_check(color))
+            self._move_cache[cache_key] = state
+        return state
     
     def is_checkmate(self, color: str) -> bool:
         """
@@ -324,12 +486,8 @@ class Board:
         Returns:
             True if checkmate
         """
-        if not self.is_in_check(color):
-            return False
-        
-        # Check if there are any valid moves
-        moves = self.get_all_moves(color)
-        return len(moves) == 0
+        moves, in_check = self._legal_state(color)
+        return in_check and not moves
     
     def is_stalemate(self, color: str) -> bool:
         """
@@ -341,12 +499,28 @@ class Board:
         Returns:
             True if stalemate
         """
-        if self.is_in_check(color):
-            return False
+        moves, in_check = self._legal_state(color)
+        return not in_check and not moves
+    
+    def repetition_count(self) -> int:
+        """
+        Count how often the current position has occurred, including now.
         
-        # Check if there are any valid moves
-        moves = self.get_all_moves(color)
-        return len(moves) == 0
+        Positions are compared by zobrist key, which covers the pieces, side
+        to move, castling rights and en passant file.
+        
+        Returns:
+            Number of occurrences (1 for a position seen for the first time)
+        """
+        return self._key_counts.get(self.zobrist_key, 0)
+    
+    def is_threefold_repetition(self) -> bool:
+        """Check if the current position has occurred at least three times."""
+        return self.repetition_count() >= 3
+    
+    def is_fifty_move_draw(self) -> bool:
+        """Check if fifty moves each have passed without a capture or pawn move."""
+        return self.halfmove_clock >= FIFTY_MOVE_PLIES
     
     def copy(self):
         """Create a deep copy of the board."""
@@ -360,9 +534,201 @@ class Board:
                 if piece:
                     new_board.grid[row][col] = piece.copy()
         
+        new_board.bitboards = self.bitboards.copy()
+        new_board.color_occupancy = self.color_occupancy.copy()
+        new_board.occupied = self.occupied
+        new_board.zobrist_key = self.zobrist_key
+        new_board.castling_rights = self.castling_rights
+        new_board.material = self.material.copy()
+        new_board.psqt_score = self.psqt_score.copy()
         new_board.current_turn = self.current_turn
         new_board.move_history = self.move_history.copy()
         new_board.en_passant_target = self.en_passant_target
+        new_board.halfmove_clock = self.halfmove_clock
+        new_board.fullmove_number = self.fullmove_number
+        # Undo records reference this board's pieces, so a copy starts fresh
+        new_board._undo_stack = []
+        new_board._move_cache = {}
+        new_board.key_history = self.key_history.copy()
+        new_board._key_counts = self._key_counts.copy()
         
         return new_board
-
+    
+    def to_state(self) -> tuple:
+        """
+        Pack the position into a small tuple of ints and strings.
+        
+        The state is cheap to pickle, which makes it the form boards take
+        when sent to search worker processes. Move history is not included,
+        but the position keys since the last capture or pawn move are, so
+        repetitions are still detected.
+        
+        Returns:
+            (bitboards, moved, current_turn, en_passant_target, castling_rights,
+             halfmove_clock, fullmove_number, keys), where moved is a bitboard
+            of squares holding pieces that have moved and keys is a tuple of
+            position keys ending with the current one
+        """
+        moved = 0
+        for row in range(8):
+            for col in range(8):
+                piece = self.grid[row][col]
+                if piece is not None and piece.has_moved:
+                    moved |= 1 << (row * 8 + col)
+        return (tuple(self.bitboards), moved, self.current_turn,
+                self.en_passant_target, self.castling_rights,
+                self.halfmove_clock, self.fullmove_number,
+                tuple(self.key_history[-(self.halfmove_clock + 1):]))
+    
+    @classmethod
+    def from_state(cls, state: tuple) -> 'Board':
+        """
+        Rebuild a board from a tuple made by to_state.
+        
+        Args:
+            state: Tuple returned by to_state
+            
+        Returns:
+            New Board with the same position
+        """
+        (bitboards, moved, current_turn, en_passant_target, castling_rights,
+         halfmove_clock, fullmove_number, keys) = state
+        board = cls._empty()
+        for index, bitboard in enumerate(bitboards):
+            color = 'white' if index < 6 else 'black'
+            piece_class = PIECE_CLASSES[index % len(PIECE_TYPES)]
+            for square in iter_bits(bitboard):
+                row, col = square_position(square)
+                piece = piece_class(color, row, col)
+                piece.has_moved = bool(moved >> square & 1)
+                board.set_piece(row, col, piece)
+        board.current_turn = current_turn
+        board.en_passant_target = en_passant_target
+        board.castling_rights = castling_rights
+        board.halfmove_clock = halfmove_clock
+        board.fullmove_number = fullmove_number
+        board.zobrist_key = compute_key(board)
+        board._set_key_history(keys)
+        return board
+    
+    @classmethod
+    def _empty(cls) -> 'Board':
+        """Create a board with no pieces, white to move and no history."""
+        board = cls.__new__(cls)  # Create instance without the initial setup
+        board.grid = [[None for _ in range(8)] for _ in range(8)]
+        board.bitboards = [0] * 12
+        board.color_occupancy = [0, 0]
+        board.occupied = 0
+        board.zobrist_key = 0
+        board.castling_rights = 0
+        board.material = [0, 0]
+        board.psqt_score = [0, 0]
+        board.current_turn = 'white'
+        board.move_history = []
+        board.en_passant_target = None
+        board.halfmove_clock = 0
+        board.fullmove_number = 1
+        board._undo_stack = []
+        board._move_cache = {}
+        board._set_key_history([])
+        return board
+    
+    @classmethod
+    def from_fen(cls, fen: str) -> 'Board':
+        """
+        Create a board from a FEN string.
+        
+        Kings and rooks are marked unmoved only where the castling field
+        allows castling with them.
+        The two move clock fields may be left out (default "0 1").
+        
+        Args:
+            fen: Forsyth-Edwards Notation of the position
+            
+        Returns:
+            New Board with the position
+            
+        Raises:
+            ValueError: If the FEN string is malformed
+        """
+        fields = fen.split()
+        if len(fields) == 4:
+            fields += ['0', '1']
+        if len(fields) != 6:
+            raise ValueError(f"FEN needs 4 or 6 fields: {fen!r}")
+        placement, turn, castling, en_passant, halfmove, fullmove = fields
+        
+        ranks = placement.split('/')
+        if len(ranks) != 8:
+            raise ValueError(f"FEN placement needs 8 ranks: {placement!r}")
+        board = cls._empty()
+        for row, rank in enumerate(ranks):
+            col = 0
+            for char in rank:
+                if char.isdigit():
+                    col += int(char)
+                    continue
+                piece_type = FEN_PIECE_TYPES.get(char.lower())
+                if piece_type is None or col > 7:
+                    raise ValueError(f"Invalid FEN rank: {rank!r}")
+                color = 'white' if char.isupper() else 'black'
+                piece = PIECE_CLASS_BY_TYPE[piece_type](color, row, col)
+                # Only castling depends on has_moved; the castling field decides it
+                piece.has_moved = piece_type in ('king', 'rook')
+                board.set_piece(row, col, piece)
+                col += 1
+            if col != 8:
+                raise ValueError(f"FEN rank does not have 8 squares: {rank!r}")
+        
+        if turn not in ('w', 'b'):
+            raise ValueError(f"Invalid side to move: {turn!r}")
+        board.current_turn = 'white' if turn == 'w' else 'black'
+        
+        for letter, _, row, king_col, rook_col in FEN_CASTLING:
+            if letter in castling:
+                for col in (king_col, rook_col):
+                    piece = board.grid[row][col]
+                    if piece is not None:
+                        piece.has_moved = False
+        board.castling_rights = castling_rights_from_pieces(board)
+        
+        board.en_passant_target = parse_square(en_passant) if en_passant != '-' else None
+        try:
+            board.halfmove_clock = int(halfmove)
+            board.fullmove_number = int(fullmove)
+        except ValueError:
+            raise ValueError(f"Invalid FEN move clocks: {halfmove!r} {fullmove!r}") from None
+        board.zobrist_key = compute_key(board)
+        board._set_key_history([board.zobrist_key])
+        return board
+    
+    def to_fen(self) -> str:
+        """
+        Get the FEN string of the position.
+        
+        Returns:
+            Forsyth-Edwards Notation with all six fields
+        """
+        ranks = []
+        for row in range(8):
+            rank = ''
+            empty = 0
+            for col in range(8):
+                piece = self.grid[row][col]
+                if piece is None:
+                    empty += 1
+                    continue
+                if empty:
+                    rank += str(empty)
+                    empty = 0
+                letter = FEN_LETTERS[piece.piece_type]
+                rank += letter.upper() if piece.color == 'white' else letter
+            if empty:
+                rank += str(empty)
+            ranks.append(rank)
+        
+        castling = ''.join(letter for letter, right, _, _, _ in FEN_CASTLING
+                           if self.castling_rights & right) or '-'
+        en_passant = square_name(*self.en_passant_target) if self.en_passant_target else '-'
+        return (f"{'/'.join(ranks)} {'w' if self.current_turn == 'white' else 'b'} "
+                f"{castling} {en_passant} {self.halfmove_clock} {self.fullmove_number}")
@@ -52,6 +52,11 @@ UI_PANEL_WIDTH = 300
 WINDOW_WIDTH = BOARD_SIZE + UI_PANEL_WIDTH
 WINDOW_HEIGHT = BOARD_SIZE
 
+# Frame Timing
+FPS = 60                  # Frame rate while the AI is thinking or about to move
+IDLE_TIMEOUT_MS = 1000    # Longest wait for an event while nothing is happening
+AI_MOVE_DELAY_MS = 500    # Pause before the AI starts its move (for smoothness)
+
 # Piece Values (for evaluation)
 PIECE_VALUES = {
     'pawn': 1,
@@ -0,0 +1,92 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Headless command-line entry point for the chess engine.
+
+Finds the best move for a position without a display:
+
+    python -m chess.engine --depth 4
+    python -m chess.engine --fen "<FEN>" --time 2.5 --workers 8
+    python -m chess.engine --moves e2e4 e7e5 g1f3 --quiet
+
+Only the board, pieces, AI and evaluator modules are imported here. The
+engine must never import pygame, which would add its start-up cost to every
+batch worker; test_chess.py checks this.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from chess.ai import ChessAI
+from chess.board import Board, STARTING_FEN
+from chess.movegen import generate_legal_moves
+from chess.notation import move_to_uci, uci_to_move
+from chess.uci import format_score
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+    
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+        
+    Returns:
+        Exit status: 0 when a move was found, 1 if the side to move has none
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess.engine",
+                                     description="Find the best move for a chess position.")
+    parser.add_argument("--fen", default=STARTING_FEN, help="Position (default: start position)")
+    parser.add_argument("--moves", nargs="*", default=[], metavar="MOVE",
+                        help="UCI moves to play from the position first")
+    parser.add_argument("--depth", type=int, help="Search depth (default: 3 without other limits)")
+    parser.add_argument("--time", type=float, help="Time budget in seconds")
+    parser.add_argument("--nodes", type=int, help="Node budget")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Search processes (default: 1; 0 uses every CPU)")
+    parser.add_argument("--hash", type=float, default=16, help="Transposition table size in MB")
+    parser.add_argument("--seed", type=int, help="Seed for choosing between equal moves")
+    parser.add_argument("--quiet", action="store_true", help="Only print the best move")
+    args = parser.parse_args(argv)
+    
+    try:
+        board = Board.from_fen(args.fen)
+    except ValueError as e:
+        parser.error(str(e))
+    for text in args.moves:
+        try:
+            move = uci_to_move(text)
+        except ValueError as e:
+            parser.error(str(e))
+        if move not in generate_legal_moves(board, board.current_turn, underpromotions=True):
+            parser.error(f"Illegal move in this position: {text}")
+        board.push(move)
+    
+    depth = args.depth
+    if depth is None and args.time is None and args.nodes is None:
+        depth = 3
+    ai = ChessAI(depth=depth, hash_size_mb=args.hash, time_limit=args.time,
+                 node_limit=args.nodes, seed=args.seed, workers=args.workers or None)
+    
+    def report(info):
+        """Print one line per completed search depth."""
+        print(f"info depth {info['depth']} score {format_score(info['score'])} "
+              f"nodes {info['nodes']} nps {info['nps']} time {int(info['time'] * 1000)} "
+              f"pv {move_to_uci(info['best_move'], board)}", flush=True)
+    
+    try:
+        best_move = ai.get_best_move(board, board.current_turn,
+                                     progress_callback=None if args.quiet else report)
+    finally:
+        ai.close()
+    
+    if best_move is None:
+        print("bestmove (none)")
+        return 1
+    print(f"bestmove {move_to_uci(best_move, board)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,11 @@ Evaluator class for calculating move quality scores (0-100).
 
 from typing import Tuple
 from chess.constants import PIECE_VALUES
+from chess.bitboard import KNIGHT, BISHOP, ROOK, QUEEN, iter_bits, popcount
+from chess.attacks import KNIGHT_ATTACKS, ROOK_DIRECTIONS, BISHOP_DIRECTIONS, sliding_attacks
+
+# Centipawns per square a knight, bishop, rook or queen attacks
+MOBILITY_WEIGHT = 4
 
 
 class Evaluator:
@@ -32,26 +37,16 @@ class Evaluator:
         start_row, start_col = start
         end_row, end_col = end
         
-        # Create a copy of the board to evaluate the move
-        temp_board = board.copy()
-        piece = temp_board.get_piece(start_row, start_col)
+        piece = board.get_piece(start_row, start_col)
         if piece is None:
             return 50  # Neutral score if invalid
         
-        # Make the move on temp board
-        captured_piece = temp_board.get_piece(end_row, end_col)
-        temp_board.grid[start_row][start_col] = None
-        temp_board.grid[end_row][end_col] = piece
-        piece.set_position(end_row, end_col)
-        
-        # Handle pawn promotion
-        if piece.piece_type == 'pawn' and (end_row == 0 or end_row == 7):
-            temp_board.grid[end_row][end_col] = None
-            from chess.pieces import Queen
-            temp_board.grid[end_row][end_col] = Queen(piece.color, end_row, end_col)
+        # Make the move in place; it is undone once scoring is done
+        captured_piece = board.get_piece(end_row, end_col)
+        board.push(move)
         
         # Calculate base position evaluation
-        position_score = self.evaluate_position(temp_board, color)
+        position_score = self.evaluate_position(board, color)
         
         # Calculate material gain/loss from the move
         material_score = 0
@@ -61,7 +56,7 @@ class Evaluator:
         # Check bonus (putting opponent in check)
         check_bonus = 0
         opponent_color = 'black' if color == 'white' else 'white'
-        if temp_board.is_in_check(opponent_color):
+        if board.is_in_check(opponent_color):
             check_bonus = 15
         
         # Center control bonus
@@ -71,7 +66,9 @@ class Evaluator:
             center_bonus = 5
         
         # Piece activity (mobility)
-        mobility_score = self._calculate_mobility(temp_board, color) * 2
+        mobility_score = self._calculate_mobility(board, color) * 2
+        
+        board.pop()
         
         # Combine scores
         raw_score = position_score + material_score + check_bonus + center_bonus + mobility_score
@@ -111,22 +108,12 @@ class Evaluator:
         Returns:
             Material score (positive is better for the color)
         """
-        my_material = 0
-        opponent_material = 0
-        opponent_color = 'black' if color == 'white' else 'white'
-        
-        for row in range(8):
-            for col in range(8):
-                piece = board.get_piece(row, col)
-                if piece:
-                    value = self.piece_values.get(piece.piece_type, 0)
-                    if piece.color == color:
-                        my_material += value
-                    else:
-                        opponent_material += value
+        # Board keeps running centipawn totals (kings count zero)
+        my_index = 0 if color == 'white' else 1
+        material_difference = board.material[my_index] - board.material[1 - my_index]
         
         # Return difference (positive means advantage)
-        return (my_material - opponent_material) * 2
+        return material_difference // 50  # Two points per pawn
     
     def calculate_position_score(self, board, color: str) -> float:
         """
@@ -156,10 +143,9 @@ class Evaluator:
                         score += 2
                     elif (row, col) in extended_center:
                         score += 1
-                    
-                    # Piece activity (number of moves available)
-                    moves = piece.get_valid_moves(board)
-                    score += len(moves) * 0.5
+        
+        # Piece activity (number of moves available)
+        score += len(board.get_all_moves(color)) * 0.5
         
         return score
     
@@ -174,13 +160,58 @@ class Evaluator:
         Returns:
             Mobility score
         """
-        total_moves = 0
-        for row in range(8):
-            for col in range(8):
-                piece = board.get_piece(row, col)
-                if piece and piece.color == color:
-                    moves = piece.get_valid_moves(board)
-                    total_moves += len(moves)
+        # One cached generation covers every piece of the color
+        return len(board.get_all_moves(color))
+    
+    def evaluate_fast(self, board, color: str, mobility: bool = True) -> int:
+        """
+        Cheap evaluation for search leaves, in centipawns.
         
-        return total_moves
-
+        Material and piece-square totals are read from the board in O(1);
+        the optional mobility term counts attacks with attack tables. No
+        moves are generated and the board is not modified. The result is
+        symmetric: evaluating for the opponent gives the negated value.
+        
+        Args:
+            board: Board instance
+            color: 'white' or 'black'
+            mobility: Include the mobility term
+            
+        Returns:
+            Score in centipawns (positive is better for the color)
+        """
+        # Material and piece-square totals are maintained by the board
+        score = ((board.material[0] + board.psqt_score[0]) -
+                 (board.material[1] + board.psqt_score[1]))
+        
+        if mobility:
+            score += MOBILITY_WEIGHT * (self._attack_mobility(board, 0) -
+                                        self._attack_mobility(board, 1))
+        
+        return score if color == 'white' else -score
+    
+    def _attack_mobility(self, board, color_index: int) -> int:
+        """
+        Count squares attacked by minor and major pieces using attack tables.
+        
+        Args:
+            board: Board instance
+            color_index: 0 for white, 1 for black
+            
+        Returns:
+            Number of attacked squares not occupied by friendly pieces
+        """
+        bitboards = board.bitboards
+        base = color_index * 6
+        not_own = ~board.color_occupancy[color_index]
+        occupied = board.occupied
+        
+        total = 0
+        for square in iter_bits(bitboards[base + KNIGHT]):
+            total += popcount(KNIGHT_ATTACKS[square] & not_own)
+        queens = bitboards[base + QUEEN]
+        for square in iter_bits(bitboards[base + BISHOP] | queens):
+            total += popcount(sliding_attacks(square, BISHOP_DIRECTIONS, occupied) & not_own)
+        for square in iter_bits(bitboards[base + ROOK] | queens):
+            total += popcount(sliding_attacks(square, ROOK_DIRECTIONS, occupied) & not_own)
+        return total
@@ -2,19 +2,25 @@
 Author: Sepehr Bayat | Open Source Chess MVP
 
 Game class for managing the main game loop, input handling, and rendering.
+
+Rendering only redraws what changed: squares whose piece or highlight
+differ from the last frame and the UI panel when its text changes, and only
+those rectangles are sent to the display.
 """
 
 import pygame
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
 from chess.board import Board
 from chess.evaluator import Evaluator
 from chess.ai import ChessAI
+from chess.ai_worker import AIWorker, PROGRESS, BEST_MOVE
 from chess.menu import GameMenu
+from chess.notation import move_to_uci
 from chess.piece_images import PieceImageLoader
 from chess.constants import (
     SQUARE_SIZE, BOARD_SIZE, UI_PANEL_WIDTH, WINDOW_WIDTH, WINDOW_HEIGHT,
     LIGHT_SQUARE, DARK_SQUARE, HIGHLIGHT, VALID_MOVE_HIGHLIGHT,
-    UI_BACKGROUND, UI_TEXT, WHITE, BLACK
+    UI_BACKGROUND, UI_TEXT, FPS, IDLE_TIMEOUT_MS, AI_MOVE_DELAY_MS
 )
 
 
@@ -43,15 +49,28 @@ class Game:
         self.last_move_score: Optional[int] = None
         self.last_move_color: Optional[str] = None
         self.game_status: str = "Playing"
+        self.game_over = False
         
         # Game mode
         self.game_mode: Optional[str] = None
         self.ai_white: Optional[ChessAI] = None
         self.ai_black: Optional[ChessAI] = None
         self.ai_thinking = False
+        self.ai_worker = AIWorker()
+        self.ai_progress: Optional[dict] = None
         
         # Clock for FPS control
         self.clock = pygame.time.Clock()
+        
+        # Rendering caches: the checkerboard is drawn once; the state drawn
+        # on each square and the panel lines are remembered so unchanged
+        # parts are skipped; panel text surfaces are kept per line
+        self._board_background = self._create_board_background()
+        self._highlight_overlays = self._create_highlight_overlays()
+        self._drawn_squares: List[Optional[tuple]] = [None] * 64
+        self._drawn_panel: Optional[list] = None
+        self._panel_text: Dict[int, Tuple[pygame.font.Font, str, pygame.Surface]] = {}
+        self._full_redraw = True
     
     def show_menu(self) -> bool:
         """
@@ -63,6 +82,7 @@ class Game:
         menu = GameMenu(self.screen)
         selected_mode = menu.run()
         
+        self._full_redraw = True  # The menu drew over the whole window
         if selected_mode:
             self.game_mode = selected_mode
             self._setup_game_mode()
@@ -93,7 +113,7 @@ class Game:
         return False
     
     def _make_ai_move(self):
-        """Make a move for the AI player."""
+        """Start the AI player's search on the background worker."""
         if self.ai_thinking:
             return
         
@@ -102,10 +122,24 @@ class Game:
             return
         
         self.ai_thinking = True
+        self.ai_progress = None
+        self.ai_worker.start(ai_player, self.board, self.board.current_turn)
+    
+    def _poll_ai_move(self):
+        """Apply progress and the finished move from the AI worker, if any."""
+        for kind, payload in self.ai_worker.poll():
+            if kind == PROGRESS:
+                self.ai_progress = payload
+            elif kind == BEST_MOVE:
+                self._apply_ai_move(payload)
+    
+    def _apply_ai_move(self, best_move):
+        """
+        Play the move found by the AI worker.
         
-        # Get best move from AI
-        best_move = ai_player.get_best_move(self.board, self.board.current_turn)
-        
+        Args:
+            best_move: ((start_row, start_col), (end_row, end_col)) or None
+        """
         if best_move:
             start, end = best_move
             move_color = self.board.current_turn
@@ -130,8 +164,8 @@ class Game:
         Args:
             pos: (x, y) mouse position
         """
-        # Don't handle clicks if it's AI's turn
-        if self._is_ai_turn():
+        # Don't handle clicks if it's AI's turn or the game has ended
+        if self._is_ai_turn() or self.game_over:
             return
         
         x, y = pos
@@ -183,39 +217,51 @@ class Game:
                     self.valid_moves = piece.get_valid_moves(self.board)
     
     def _update_game_status(self):
-        """Update the game status (check, checkmate, stalemate)."""
-        if self.board.is_checkmate('white'):
-            self.game_status = "Checkmate! Black Wins"
-        elif self.board.is_checkmate('black'):
-            self.game_status = "Checkmate! White Wins"
-        elif self.board.is_stalemate(self.board.current_turn):
+        """Update the game status (check, checkmate, stalemate, draws)."""
+        # Only the side to move can be mated or stalemated; all three checks
+        # share the board's cached move generation for this position
+        turn = self.board.current_turn
+        self.game_over = False
+        if self.board.is_checkmate(turn):
+            winner = 'Black' if turn == 'white' else 'White'
+            self.game_status = f"Checkmate! {winner} Wins"
+            self.game_over = True
+        elif self.board.is_stalemate(turn):
             self.game_status = "Stalemate - Draw"
-        elif self.board.is_in_check(self.board.current_turn):
-            self.game_status = f"{self.board.current_turn.capitalize()} in Check"
+            self.game_over = True
+        elif self.board.is_threefold_repetition():
+            self.game_status = "Draw by Repetition"
+            self.game_over = True
+        elif self.board.is_fifty_move_draw():
+            self.game_status = "Draw by Fifty-Move Rule"
+            self.game_over = True
+        elif self.board.is_in_check(turn):
+            self.game_status = f"{turn.capitalize()} in Check"
         else:
             self.game_status = "Playing"
     
     def draw(self):
-        """Draw the game board and UI."""
-        self.screen.fill(UI_BACKGROUND)
-        
-        # Draw board
-        self._draw_board()
+        """Draw the parts of the game board and UI that changed since the last frame."""
+        if self._full_redraw:
+            self.screen.fill(UI_BACKGROUND)
+            self._drawn_squares = [None] * 64
+            self._drawn_panel = None
         
-        # Draw pieces
-        self._draw_pieces()
-        
-        # Draw highlights
-        if self.selected_piece:
-            self._draw_highlights()
+        # Draw board, pieces and highlights
+        dirty_rects = self._draw_board()
         
         # Draw UI panel
-        self._draw_ui_panel()
+        dirty_rects += self._draw_ui_panel()
         
-        pygame.display.flip()
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
     
-    def _draw_board(self):
-        """Draw the checkerboard pattern."""
+    def _create_board_background(self) -> pygame.Surface:
+        """Draw the checkerboard pattern once onto its own surface."""
+        background = pygame.Surface((BOARD_SIZE, BOARD_SIZE)).convert()
         for row in range(8):
             for col in range(8):
                 x = col * SQUARE_SIZE
@@ -223,116 +269,149 @@ class Game:
                 
                 # Alternate square colors
                 color = LIGHT_SQUARE if (row + col) % 2 == 0 else DARK_SQUARE
-                pygame.draw.rect(self.screen, color, (x, y, SQUARE_SIZE, SQUARE_SIZE))
+                pygame.draw.rect(background, color, (x, y, SQUARE_SIZE, SQUARE_SIZE))
+        return background
+    
+    def _create_highlight_overlays(self) -> Dict[str, pygame.Surface]:
+        """Build the translucent square overlays once, keyed by highlight kind."""
+        overlays = {}
+        for kind, color, alpha in (('selected', HIGHLIGHT, 128),
+                                   ('move', VALID_MOVE_HIGHLIGHT, 100)):
+            overlay = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE)).convert()
+            overlay.fill(color)
+            overlay.set_alpha(alpha)
+            overlays[kind] = overlay
+        return overlays
     
-    def _draw_pieces(self):
-        """Draw all pieces on the board."""
+    def _draw_board(self) -> List[pygame.Rect]:
+        """
+        Redraw the squares whose piece or highlight changed since the last frame.
+        
+        Returns:
+            Screen rectangles that were redrawn
+        """
+        valid_moves = set(self.valid_moves) if self.selected_piece else set()
+        dirty_rects = []
         for row in range(8):
             for col in range(8):
-                piece = self.board.get_piece(row, col)
-                if piece:
-                    x = col * SQUARE_SIZE + SQUARE_SIZE // 2
-                    y = row * SQUARE_SIZE + SQUARE_SIZE // 2
-                    
-                    # Try to use image first
-                    piece_image = self.image_loader.get_piece_image(piece.piece_type, piece.color)
-                    
-                    if piece_image:
-                        # Draw image
-                        img_rect = piece_image.get_rect(center=(x, y))
-                        self.screen.blit(piece_image, img_rect)
-                    else:
-                        # Always use drawn chess pieces (they look much better than Unicode)
-                        drawn_image = self.image_loader.create_simple_image(piece.piece_type, piece.color)
-                        if drawn_image:
-                            img_rect = drawn_image.get_rect(center=(x, y))
-                            self.screen.blit(drawn_image, img_rect)
-                        else:
-                            # Last resort: Unicode symbol (shouldn't happen)
-                            symbol = piece.get_symbol()
-                            text_surface = self.font_large.render(symbol, True, BLACK if piece.color == 'white' else WHITE)
-                            text_rect = text_surface.get_rect(center=(x, y))
-                            self.screen.blit(text_surface, text_rect)
+                piece = self.board.grid[row][col]
+                if (row, col) == self.selected_piece:
+                    highlight = 'selected'
+                elif (row, col) in valid_moves:
+                    highlight = 'move'
+                else:
+                    highlight = None
+                state = (piece.piece_type, piece.color, highlight) if piece else (None, None, highlight)
+                if self._drawn_squares[row * 8 + col] != state:
+                    self._drawn_squares[row * 8 + col] = state
+                    dirty_rects.append(self._draw_square(row, col, piece, highlight))
+        return dirty_rects
     
-    def _draw_highlights(self):
-        """Draw highlights for selected piece and valid moves."""
-        if self.selected_piece:
-            row, col = self.selected_piece
-            x = col * SQUARE_SIZE
-            y = row * SQUARE_SIZE
+    def _draw_square(self, row: int, col: int, piece, highlight: Optional[str]) -> pygame.Rect:
+        """
+        Draw one square with its piece and highlight.
+        
+        Args:
+            row, col: Square to draw
+            piece: Piece on the square, or None
+            highlight: 'selected', 'move' or None
             
-            # Highlight selected piece
-            highlight_surface = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE))
-            highlight_surface.set_alpha(128)
-            highlight_surface.fill(HIGHLIGHT)
-            self.screen.blit(highlight_surface, (x, y))
+        Returns:
+            Screen rectangle of the square
+        """
+        rect = pygame.Rect(col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+        self.screen.blit(self._board_background, rect, rect)
+        
+        if piece:
+            # Sprites are cached by the loader, so this is only a blit
+            piece_image = self.image_loader.get_sprite(piece.piece_type, piece.color)
+            img_rect = piece_image.get_rect(center=rect.center)
+            self.screen.blit(piece_image, img_rect)
+        
+        if highlight is not None:
+            # Highlight selected piece or valid move with a prebuilt overlay
+            self.screen.blit(self._highlight_overlays[highlight], rect)
+        
+        return rect
+    
+    def _text_surface(self, line: int, font: pygame.font.Font, text: str) -> pygame.Surface:
+        """
+        Get the rendered text for a panel line, rendering only when it changed.
+        
+        Args:
+            line: Index of the line in the panel
+            font: Font to render with
+            text: Text of the line
             
-            # Highlight valid moves
-            for move_row, move_col in self.valid_moves:
-                move_x = move_col * SQUARE_SIZE
-                move_y = move_row * SQUARE_SIZE
-                
-                move_surface = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE))
-                move_surface.set_alpha(100)
-                move_surface.fill(VALID_MOVE_HIGHLIGHT)
-                self.screen.blit(move_surface, (move_x, move_y))
+        Returns:
+            Rendered text surface
+        """
+        cached = self._panel_text.get(line)
+        if cached is not None and cached[0] is font and cached[1] == text:
+            return cached[2]
+        surface = font.render(text, True, UI_TEXT)
+        self._panel_text[line] = (font, text, surface)
+        return surface
     
-    def _draw_ui_panel(self):
-        """Draw the UI panel with game information."""
+    def _draw_ui_panel(self) -> List[pygame.Rect]:
+        """
+        Draw the UI panel with game information if any of it changed.
+        
+        Returns:
+            Screen rectangles that were redrawn
+        """
         panel_x = BOARD_SIZE
         panel_y = 0
         
-        # Draw panel background
-        pygame.draw.rect(self.screen, UI_BACKGROUND, 
-                        (panel_x, panel_y, UI_PANEL_WIDTH, WINDOW_HEIGHT))
-        
+        # Collect the panel's lines as (font, text, y) first
+        lines = []
         y_offset = 20
         
         # Title
-        title = self.font_large.render("Chess MVP", True, UI_TEXT)
-        self.screen.blit(title, (panel_x + 10, y_offset))
+        lines.append((self.font_large, "Chess MVP", y_offset))
         y_offset += 50
         
         # Author
-        author = self.font_small.render("By Sepehr Bayat", True, UI_TEXT)
-        self.screen.blit(author, (panel_x + 10, y_offset))
+        lines.append((self.font_small, "By Sepehr Bayat", y_offset))
         y_offset += 40
         
         # Game mode
         if self.game_mode:
             mode_text = self.game_mode.replace('_', ' ').title()
-            mode_surface = self.font_small.render(f"Mode: {mode_text}", True, UI_TEXT)
-            self.screen.blit(mode_surface, (panel_x + 10, y_offset))
+            lines.append((self.font_small, f"Mode: {mode_text}", y_offset))
             y_offset += 30
         
         # Current turn
         turn_text = f"Turn: {self.board.current_turn.capitalize()}"
         if self._is_ai_turn():
             turn_text += " (AI)"
-        turn_surface = self.font_medium.render(turn_text, True, UI_TEXT)
-        self.screen.blit(turn_surface, (panel_x + 10, y_offset))
+        lines.append((self.font_medium, turn_text, y_offset))
         y_offset += 40
         
         # AI thinking indicator
         if self.ai_thinking:
-            thinking_text = self.font_small.render("AI thinking...", True, UI_TEXT)
-            self.screen.blit(thinking_text, (panel_x + 10, y_offset))
+            lines.append((self.font_small, "AI thinking...", y_offset))
             y_offset += 30
+            
+            if self.ai_progress:
+                progress = self.ai_progress
+                progress_text = f"Depth {progress['depth']}  {progress['nodes']} nodes"
+                if progress.get('best_move'):
+                    progress_text += f"  {move_to_uci(progress['best_move'])}"
+                lines.append((self.font_small, progress_text, y_offset))
+                y_offset += 30
         
         # Game status
-        status_surface = self.font_medium.render(self.game_status, True, UI_TEXT)
-        self.screen.blit(status_surface, (panel_x + 10, y_offset))
+        lines.append((self.font_medium, self.game_status, y_offset))
         y_offset += 50
         
         # Move score section
-        score_title = self.font_medium.render("Move Score:", True, UI_TEXT)
-        self.screen.blit(score_title, (panel_x + 10, y_offset))
+        lines.append((self.font_medium, "Move Score:", y_offset))
         y_offset += 35
         
         if self.last_move_score is not None and self.last_move_color:
             score_text = f"{self.last_move_color.capitalize()}: {self.last_move_score}/100"
-            score_surface = self.font_large.render(score_text, True, UI_TEXT)
-            self.screen.blit(score_surface, (panel_x + 10, y_offset))
+            lines.append((self.font_large, score_text, y_offset))
             y_offset += 40
             
             # Score interpretation
@@ -345,8 +424,7 @@ class Game:
             else:
                 interpretation = "Poor move"
             
-            interp_surface = self.font_small.render(interpretation, True, UI_TEXT)
-            self.screen.blit(interp_surface, (panel_x + 10, y_offset))
+            lines.append((self.font_small, interpretation, y_offset))
             y_offset += 30
         
         y_offset += 20
@@ -369,23 +447,47 @@ class Game:
         
         for instruction in instructions:
             if instruction:
-                inst_surface = self.font_small.render(instruction, True, UI_TEXT)
-                self.screen.blit(inst_surface, (panel_x + 10, y_offset))
+                lines.append((self.font_small, instruction, y_offset))
             y_offset += 25
+        
+        # Nothing to do if the panel shows the same lines already
+        if lines == self._drawn_panel:
+            return []
+        self._drawn_panel = lines
+        
+        # Draw panel background
+        panel_rect = pygame.Rect(panel_x, panel_y, UI_PANEL_WIDTH, WINDOW_HEIGHT)
+        pygame.draw.rect(self.screen, UI_BACKGROUND, panel_rect)
+        
+        for index, (font, text, y) in enumerate(lines):
+            self.screen.blit(self._text_surface(index, font, text), (panel_x + 10, y))
+        return [panel_rect]
     
     def run(self):
-        """Run the main game loop."""
+        """
+        Run the main game loop.
+        
+        While the AI is thinking or about to move the loop runs at FPS to
+        poll the search. Otherwise it sleeps in pygame.event.wait until input
+        arrives, so an idle window uses almost no CPU.
+        """
         # Show menu first
         if not self.show_menu():
             pygame.quit()
             return
         
         running = True
-        ai_move_timer = 0
-        ai_move_delay = 30  # Frames to wait before AI makes move (for smoothness)
+        ai_move_time: Optional[int] = None  # Ticks at which the AI starts its move
         
         while running:
-            for event in pygame.event.get():
+            busy = self.ai_thinking or (self._is_ai_turn() and not self.game_over)
+            if busy:
+                events = pygame.event.get()
+            else:
+                # Idle: block until something happens
+                events = [pygame.event.wait(IDLE_TIMEOUT_MS)] + pygame.event.get()
+            
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
@@ -394,17 +496,25 @@ class Game:
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Left click
                         self.handle_click(event.pos)
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._full_redraw = True  # Window contents were lost
             
-            # Handle AI moves
-            if self._is_ai_turn() and not self.ai_thinking:
-                ai_move_timer += 1
-                if ai_move_timer >= ai_move_delay:
+            # Handle AI moves; the search runs on the worker thread so the
+            # window keeps drawing and responding while the AI thinks
+            self._poll_ai_move()
+            if self._is_ai_turn() and not self.ai_thinking and not self.game_over:
+                now = pygame.time.get_ticks()
+                if ai_move_time is None:
+                    ai_move_time = now + AI_MOVE_DELAY_MS
+                elif now >= ai_move_time:
                     self._make_ai_move()
-                    ai_move_timer = 0
+                    ai_move_time = None
             else:
-                ai_move_timer = 0
+                ai_move_time = None
             
             self.draw()
-            self.clock.tick(60)  # 60 FPS
+            if busy:
+                self.clock.tick(FPS)
         
+        self.ai_worker.cancel()
         pygame.quit()
@@ -0,0 +1,421 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Headless self-play match runner for comparing two ChessAI configurations.
+
+Games are played without a display across a process pool, so engine
+changes can be benchmarked in batch:
+
+    python -m chess.match --games 100 --engine1 depth=3 --engine2 depth=2
+    python -m chess.match --engine1 "name=new,time=0.5" --engine2 "name=old,time=0.5,mobility=off" \\
+        --jsonl results.jsonl --pgn games.pgn
+
+Games are played in pairs from the same random opening, with each engine
+taking white once, so neither side profits from a lucky opening. Results
+are appended to the JSONL and PGN files as each game finishes, and the run
+ends with the win/draw/loss record and an Elo difference with its 95%
+error margin. Like chess.engine, this module must never import pygame.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from chess.ai import ChessAI
+from chess.board import Board
+from chess.notation import move_to_san, move_to_uci
+
+# Engine spec keys and how their values are parsed; see parse_engine_spec
+ENGINE_OPTIONS = ('name', 'depth', 'time', 'nodes', 'hash', 'mobility')
+TRUE_VALUES = ('1', 'true', 'on', 'yes')
+FALSE_VALUES = ('0', 'false', 'off', 'no')
+
+DEFAULT_DEPTH = 2
+DEFAULT_OPENING_PLIES = 4
+DEFAULT_MAX_PLIES = 400
+
+# Results from white's point of view, and the score each gives white
+WHITE_WINS = '1-0'
+BLACK_WINS = '0-1'
+DRAW = '1/2-1/2'
+WHITE_SCORES = {WHITE_WINS: 1.0, BLACK_WINS: 0.0, DRAW: 0.5}
+
+# Scores are clamped this far from 0 and 1 so a clean sweep gives a finite Elo
+SCORE_LIMIT = 0.001
+
+# Two-sided 95% confidence interval of a normal distribution
+CONFIDENCE_Z = 1.96
+
+
+def parse_engine_spec(spec: str) -> Dict:
+    """
+    Parse an engine description such as "depth=3,time=0.5,mobility=off".
+    
+    Keys: name (label used in results), depth, time (seconds per move),
+    nodes (per move), hash (MB) and mobility (evaluation mobility term).
+    
+    Args:
+        spec: Comma-separated key=value pairs
+        
+    Returns:
+        Dict of the given options with parsed values; 'name' defaults to
+        the spec itself
+        
+    Raises:
+        ValueError: If a key is unknown or a value cannot be parsed
+    """
+    config: Dict = {'name': spec}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        key, separator, value = item.partition('=')
+        key = key.strip().lower()
+        value = value.strip()
+        if not separator or key not in ENGINE_OPTIONS:
+            raise ValueError(f"Invalid engine option {item!r}; use key=value with "
+                             f"keys {', '.join(ENGINE_OPTIONS)}")
+        try:
+            if key in ('depth', 'nodes'):
+                config[key] = int(value)
+            elif key in ('time', 'hash'):
+                config[key] = float(value)
+            elif key == 'mobility':
+                if value.lower() not in TRUE_VALUES + FALSE_VALUES:
+                    raise ValueError(value)
+                config[key] = value.lower() in TRUE_VALUES
+            else:
+                config[key] = value
+        except ValueError:
+            raise ValueError(f"Invalid value for engine option {key}: {value!r}") from None
+    return config
+
+
+def create_ai(config: Dict, seed: Optional[int] = None) -> ChessAI:
+    """
+    Create a single-process ChessAI from a parsed engine spec.
+    
+    Args:
+        config: Dict from parse_engine_spec
+        seed: Seed for choosing between equal moves
+        
+    Returns:
+        New ChessAI
+    """
+    depth = config.get('depth')
+    if depth is None and config.get('time') is None and config.get('nodes') is None:
+        depth = DEFAULT_DEPTH
+    return ChessAI(depth=depth, hash_size_mb=config.get('hash', 16),
+                   time_limit=config.get('time'), node_limit=config.get('nodes'),
+                   seed=seed, eval_mobility=config.get('mobility', True))
+
+
+def game_result(board: Board, max_plies: int) -> Optional[Tuple[str, str]]:
+    """
+    Check whether a game has ended.
+    
+    Args:
+        board: Current position
+        max_plies: Plies after which the game is adjudicated a draw
+        
+    Returns:
+        (result, termination) or None while the game goes on
+    """
+    turn = board.current_turn
+    if board.is_checkmate(turn):
+        return (BLACK_WINS if turn == 'white' else WHITE_WINS), 'checkmate'
+    if board.is_stalemate(turn):
+        return DRAW, 'stalemate'
+    if board.is_threefold_repetition():
+        return DRAW, 'repetition'
+    if board.is_fifty_move_draw():
+        return DRAW, 'fifty-move rule'
+    if len(board.move_history) >= max_plies:
+        return DRAW, 'move limit'
+    return None
+
+
+def play_game(index: int, white: Dict, black: Dict, opening_seed: int,
+              opening_plies: int = DEFAULT_OPENING_PLIES,
+              max_plies: int = DEFAULT_MAX_PLIES) -> Dict:
+    """
+    Play one game between two engine configurations.
+    
+    The game starts with random legal moves chosen by opening_seed, so the
+    two games of a pair share their opening.
+    
+    Args:
+        index: Game number, for the result record
+        white, black: Engine configs from parse_engine_spec
+        opening_seed: Seed for the random opening and the engines' tie-breaks
+        opening_plies: Number of random plies before the engines take over
+        max_plies: Plies after which the game is adjudicated a draw
+        
+    Returns:
+        Result record: game, white, black, result, termination, plies,
+        opening_plies, opening_seed, moves (UCI), san and seconds
+    """
+    start_time = time.perf_counter()
+    board = Board()
+    rng = random.Random(opening_seed)
+    uci_moves: List[str] = []
+    san_moves: List[str] = []
+    
+    def play(move):
+        """Record a move in both notations and make it."""
+        uci_moves.append(move_to_uci(move, board))
+        san_moves.append(move_to_san(move, board))
+        board.push(move)
+    
+    for _ in range(opening_plies):
+        moves = board.get_all_moves(board.current_turn)
+        if not moves:
+            break
+        play(rng.choice(moves))
+    
+    engines = {'white': create_ai(white, opening_seed), 'black': create_ai(black, opening_seed)}
+    try:
+        outcome = game_result(board, max_plies)
+        while outcome is None:
+            move = engines[board.current_turn].get_best_move(board, board.current_turn)
+            play(move)
+            outcome = game_result(board, max_plies)
+    finally:
+        for ai in engines.values():
+            ai.close()
+    
+    result, termination = outcome
+    return {
+        'game': index,
+        'white': white['name'],
+        'black': black['name'],
+        'result': result,
+        'termination': termination,
+        'plies': len(uci_moves),
+        'opening_plies': min(opening_plies, len(uci_moves)),
+        'opening_seed': opening_seed,
+        'moves': uci_moves,
+        'san': san_moves,
+        'seconds': round(time.perf_counter() - start_time, 3),
+    }
+
+
+def format_pgn(record: Dict, event: str = "Chess MVP self-play") -> str:
+    """
+    Format a game record as PGN.
+    
+    Args:
+        record: Result record from play_game
+        event: Event tag value
+        
+    Returns:
+        PGN text of the game, ending with a blank line
+    """
+    tags = [
+        ('Event', event),
+        ('Site', '?'),
+        ('Date', time.strftime('%Y.%m.%d')),
+        ('Round', str(record['game'] + 1)),
+        ('White', record['white']),
+        ('Black', record['black']),
+        ('Result', record['result']),
+        ('PlyCount', str(record['plies'])),
+        ('Termination', record['termination']),
+    ]
+    lines = [f'[{name} "{value}"]' for name, value in tags]
+    
+    tokens = []
+    for ply, san in enumerate(record['san']):
+        if ply % 2 == 0:
+            tokens.append(f"{ply // 2 + 1}.")
+        tokens.append(san)
+    tokens.append(record['result'])
+    
+    # Wrap movetext at 80 columns as the PGN standard asks
+    movetext = []
+    line = ''
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > 79:
+            movetext.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    movetext.append(line)
+    return '\n'.join(lines) + '\n\n' + '\n'.join(movetext) + '\n\n'
+
+
+def elo_difference(wins: int, draws: int, losses: int) -> Tuple[float, float]:
+    """
+    Estimate the Elo difference from a match result.
+    
+    The margin is a 95% confidence interval derived from the spread of
+    the per-game scores.
+    
+    Args:
+        wins, draws, losses: Results from the first engine's point of view
+        
+    Returns:
+        (Elo difference, margin); positive means the first engine is stronger
+    """
+    games = wins + draws + losses
+    if games == 0:
+        return 0.0, 0.0
+    score = (wins + draws / 2) / games
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 +
+                losses * score ** 2) / games
+    score_margin = CONFIDENCE_Z * math.sqrt(variance / games)
+    low = _score_to_elo(score - score_margin)
+    high = _score_to_elo(score + score_margin)
+    return _score_to_elo(score), (high - low) / 2
+
+
+def _score_to_elo(score: float) -> float:
+    """Convert an expected score (0-1) to an Elo difference."""
+    score = min(max(score, SCORE_LIMIT), 1 - SCORE_LIMIT)
+    return -400 * math.log10(1 / score - 1)
+
+
+def run_match(engine1: Dict, engine2: Dict, games: int, workers: Optional[int] = None,
+              opening_plies: int = DEFAULT_OPENING_PLIES, max_plies: int = DEFAULT_MAX_PLIES,
+              seed: Optional[int] = None, jsonl_path: Optional[str] = None,
+              pgn_path: Optional[str] = None, report=None) -> Dict[str, int]:
+    """
+    Play a match and stream the results as games finish.
+    
+    Game i is played with engine1 as white when i is even. Games 2k and
+    2k + 1 share their random opening.
+    
+    Args:
+        engine1, engine2: Engine configs from parse_engine_spec
+        games: Number of games
+        workers: Number of processes (None for one per CPU); with 1 the
+            games are played in this process
+        opening_plies: Random plies at the start of each game
+        max_plies: Plies after which a game is adjudicated a draw
+        seed: Seed for the openings (None for a random one)
+        jsonl_path: File to append one JSON record per game to
+        pgn_path: File to append each game's PGN to
+        report: Called with (record, totals) after each game
+        
+    Returns:
+        Totals from engine1's point of view: wins, draws and losses
+    """
+    if seed is None:
+        seed = random.randrange(1 << 32)
+    workers = min(workers or os.cpu_count() or 1, max(1, games))
+    jobs = []
+    for index in range(games):
+        white, black = (engine1, engine2) if index % 2 == 0 else (engine2, engine1)
+        jobs.append((index, white, black, seed + index // 2, opening_plies, max_plies))
+    
+    totals = {'wins': 0, 'draws': 0, 'losses': 0}
+    jsonl_file = open(jsonl_path, 'a') if jsonl_path else None
+    pgn_file = open(pgn_path, 'a') if pgn_path else None
+    
+    def record_result(record: Dict):
+        """Count a finished game and write it out."""
+        score = WHITE_SCORES[record['result']]
+        if record['game'] % 2 == 1:
+            score = 1 - score  # engine1 had black
+        totals['wins' if score == 1 else 'losses' if score == 0 else 'draws'] += 1
+        if jsonl_file:
+            jsonl_file.write(json.dumps(record) + '\n')
+            jsonl_file.flush()
+        if pgn_file:
+            pgn_file.write(format_pgn(record))
+            pgn_file.flush()
+        if report:
+            report(record, totals)
+    
+    try:
+        if workers == 1:
+            for job in jobs:
+                record_result(play_game(*job))
+        else:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            # Spawned workers match ChessAI's pool and avoid forking threads
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                futures = [pool.submit(play_game, *job) for job in jobs]
+                try:
+                    for future in as_completed(futures):
+                        record_result(future.result())
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+    finally:
+        if jsonl_file:
+            jsonl_file.close()
+        if pgn_file:
+            pgn_file.close()
+    return totals
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+    
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+        
+    Returns:
+        Exit status (0 on success)
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess.match",
+                                     description="Play a headless match between two engine settings.")
+    parser.add_argument("--engine1", default=f"depth={DEFAULT_DEPTH}",
+                        help="First engine, e.g. 'name=new,depth=3,time=0.5,mobility=off'")
+    parser.add_argument("--engine2", default=f"depth={DEFAULT_DEPTH}",
+                        help="Second engine, in the same form")
+    parser.add_argument("--games", type=int, default=10, help="Number of games (default: 10)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Game processes (default: 0, one per CPU; 1 plays in this process)")
+    parser.add_argument("--openings", type=int, default=DEFAULT_OPENING_PLIES, metavar="PLIES",
+                        help=f"Random opening plies per game (default: {DEFAULT_OPENING_PLIES})")
+    parser.add_argument("--max-plies", type=int, default=DEFAULT_MAX_PLIES,
+                        help=f"Adjudicate a draw after this many plies (default: {DEFAULT_MAX_PLIES})")
+    parser.add_argument("--seed", type=int, help="Seed for the random openings")
+    parser.add_argument("--jsonl", help="Append one JSON result per game to this file")
+    parser.add_argument("--pgn", help="Append the games to this PGN file")
+    parser.add_argument("--quiet", action="store_true", help="Only print the final result")
+    args = parser.parse_args(argv)
+    
+    try:
+        engine1 = parse_engine_spec(args.engine1)
+        engine2 = parse_engine_spec(args.engine2)
+    except ValueError as e:
+        parser.error(str(e))
+    if engine1['name'] == engine2['name']:
+        engine1['name'] += ' (1)'
+        engine2['name'] += ' (2)'
+    
+    def report(record, totals):
+        """Print each finished game and the running score."""
+        print(f"Game {record['game'] + 1}/{args.games}: {record['white']} - {record['black']} "
+              f"{record['result']} ({record['termination']}, {record['plies']} plies)  "
+              f"Score {totals['wins']}-{totals['losses']}-{totals['draws']}", flush=True)
+    
+    start_time = time.perf_counter()
+    totals = run_match(engine1, engine2, args.games, workers=args.workers or None,
+                       opening_plies=args.openings, max_plies=args.max_plies, seed=args.seed,
+                       jsonl_path=args.jsonl, pgn_path=args.pgn,
+                       report=None if args.quiet else report)
+    elapsed = time.perf_counter() - start_time
+    
+    wins, draws, losses = totals['wins'], totals['draws'], totals['losses']
+    games = wins + draws + losses
+    elo, margin = elo_difference(wins, draws, losses)
+    print(f"{engine1['name']} vs {engine2['name']}: "
+          f"+{wins} ={draws} -{losses} in {games} games ({elapsed:.1f}s)")
+    if games:
+        print(f"Score: {(wins + draws / 2) / games:.1%}  "
+              f"Elo difference: {elo:+.1f} +/- {margin:.1f} (95%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
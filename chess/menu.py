@@ -111,9 +111,11 @@ class GameMenu:
         """
         running = True
         selected_mode = None
+        self.draw()
         
         while running:
-            for event in pygame.event.get():
+            # The menu is static, so sleep until an event arrives
+            for event in [pygame.event.wait()] + pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                     selected_mode = None
@@ -127,8 +129,7 @@ class GameMenu:
                         if mode:
                             selected_mode = mode
                             running = False
-            
-            self.draw()
-            pygame.time.Clock().tick(60)
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.draw()  # Window contents were lost
         
         return selected_mode
@@ -0,0 +1,158 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Legal move generation using check and pin detection.
+
+King attackers, check-blocking squares and absolutely pinned pieces are
+computed once per position, so pseudo-legal moves can be filtered without
+trying each one on the board. Only en passant captures, which can expose
+the king along a rank, are verified by making the move.
+"""
+
+from typing import Dict, List, Set, Tuple
+from chess.bitboard import (
+    PIECE_INDEX, COLOR_INDEX, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING,
+    iter_bits, lsb, square_position
+)
+from chess.attacks import (
+    KNIGHT_ATTACKS, PAWN_ATTACKS, RAY_MASKS, RAY_TARGETS,
+    ROOK_DIRECTIONS, BISHOP_DIRECTIONS
+)
+
+# ((start_row, start_col), (end_row, end_col)); an underpromotion adds the
+# piece type as a third element, a plain move to the last rank promotes to a queen
+Move = Tuple[Tuple[int, int], Tuple[int, int]]
+
+UNDERPROMOTIONS = ('rook', 'bishop', 'knight')
+
+
+def find_checks_and_pins(board, color: str, king_row: int, king_col: int
+                         ) -> Tuple[int, Set[Tuple[int, int]], Dict[Tuple[int, int], Set[Tuple[int, int]]]]:
+    """
+    Find pieces giving check to a king and friendly pieces pinned to it.
+    
+    Args:
+        board: Board instance
+        color: Color of the king
+        king_row, king_col: King position
+        
+    Returns:
+        (number of checkers, squares that resolve a single check,
+         map of pinned piece position -> squares it may move to)
+    """
+    checkers = 0
+    block_squares: Set[Tuple[int, int]] = set()
+    pins: Dict[Tuple[int, int], Set[Tuple[int, int]]] = {}
+    grid = board.grid
+    bitboards = board.bitboards
+    king_square = king_row * 8 + king_col
+    own_index = COLOR_INDEX[color]
+    base = 6 * (1 - own_index)  # Opponent's block of bitboards
+    
+    # Sliding attackers and pins, walking outward from the king. Rays with
+    # no enemy slider of the right kind on them can be skipped entirely.
+    queens = bitboards[base + QUEEN]
+    for directions, sliders in ((ROOK_DIRECTIONS, bitboards[base + ROOK] | queens),
+                                (BISHOP_DIRECTIONS, bitboards[base + BISHOP] | queens)):
+        for direction in directions:
+            if not RAY_MASKS[direction][king_square] & sliders:
+                continue
+            ray = []
+            blocker = None
+            for row, col in RAY_TARGETS[direction][king_square]:
+                ray.append((row, col))
+                piece = grid[row][col]
+                if piece is None:
+                    continue
+                if piece.color_index == own_index:
+                    if blocker is not None:
+                        break  # Two friendly pieces: no pin on this ray
+                    blocker = (row, col)
+                else:
+                    if (sliders >> (row * 8 + col)) & 1:
+                        if blocker is None:
+                            checkers += 1
+                            block_squares.update(ray)
+                        else:
+                            pins[blocker] = set(ray)
+                    break
+    
+    # Knight and pawn checks, looked up from the king square
+    leapers = ((KNIGHT_ATTACKS[king_square] & bitboards[base + KNIGHT]) |
+               (PAWN_ATTACKS[own_index][king_square] & bitboards[base + PAWN]))
+    for square in iter_bits(leapers):
+        checkers += 1
+        block_squares.add(square_position(square))
+    
+    return checkers, block_squares, pins
+
+
+def generate_legal_moves(board, color: str,
+                         captures_only: bool = False,
+                         underpromotions: bool = False) -> List[Move]:
+    """
+    Generate all legal moves for a color.
+    
+    Args:
+        board: Board instance
+        color: 'white' or 'black'
+        captures_only: Only generate captures (including en passant) and
+            pawn promotions, as needed by quiescence search
+        underpromotions: Also generate promotions to rook, bishop and
+            knight as (start, end, piece_type) moves
+            
+    Returns:
+        List of ((start_row, start_col), (end_row, end_col)) tuples
+    """
+    king_bitboard = board.bitboards[PIECE_INDEX[('king', color)]]
+    if not king_bitboard:
+        return []
+    king_row, king_col = square_position(lsb(king_bitboard))
+    checkers, block_squares, pins = find_checks_and_pins(board, color, king_row, king_col)
+    
+    grid = board.grid
+    moves: List[Move] = []
+    for square in iter_bits(board.color_occupancy[COLOR_INDEX[color]]):
+        row, col = square_position(square)
+        piece = grid[row][col]
+        start = (row, col)
+        
+        if piece.type_index == KING:
+            # Lift the king so squares behind it on a checking ray count as attacked
+            board.set_piece(row, col, None)
+            for end in piece.get_pseudo_legal_moves(board):
+                if captures_only and grid[end[0]][end[1]] is None:
+                    continue
+                if not board.is_square_attacked(end[0], end[1], color):
+                    moves.append((start, end))
+            board.set_piece(row, col, piece)
+            if not checkers and not captures_only:
+                for end in piece.get_castling_moves(board):
+                    moves.append((start, end))
+            continue
+        
+        if checkers > 1:
+            continue  # Double check: only the king can move
+        
+        pin_ray = pins.get(start)
+        is_pawn = piece.type_index == PAWN
+        en_passant = board.en_passant_target if is_pawn else None
+        for end in piece.get_pseudo_legal_moves(board):
+            if (captures_only and grid[end[0]][end[1]] is None and
+                    not (is_pawn and (end == en_passant or end[0] == 0 or end[0] == 7))):
+                continue
+            if end == en_passant and grid[end[0]][end[1]] is None:
+                # En passant removes two pieces from a rank; verify directly
+                if board.is_move_safe(row, col, end[0], end[1], color):
+                    moves.append((start, end))
+                continue
+            if pin_ray is not None and end not in pin_ray:
+                continue
+            if checkers and end not in block_squares:
+                continue
+            moves.append((start, end))
+            if underpromotions and is_pawn and (end[0] == 0 or end[0] == 7):
+                for piece_type in UNDERPROMOTIONS:
+                    moves.append((start, end, piece_type))
+    
+    return moves
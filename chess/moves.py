@@ -0,0 +1,130 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Compact integer move encoding.
+
+The board, move generator and UI work with ((start_row, start_col),
+(end_row, end_col)) tuples, optionally with an underpromotion piece type as
+a third element. Places that keep many moves alive for a long time, such as
+the transposition table, store them as a single int instead:
+
+    bits 0-5    start square (row * 8 + col)
+    bits 6-11   end square
+    bits 12-14  promotion piece type code (0 for none)
+    bits 15-18  flags: capture, en passant, castling, double pawn push
+
+pack_move and unpack_move convert between the two forms. 0 (a8 to a8) is
+never a legal move and stands for "no move".
+"""
+
+from typing import Optional
+from chess.bitboard import PIECE_TYPES, PAWN, KNIGHT, QUEEN, KING
+
+NULL_MOVE = 0
+
+TO_SHIFT = 6
+PROMOTION_SHIFT = 12
+SQUARE_MASK = 0x3F
+PROMOTION_MASK = 0x7
+
+# Flags, only set when pack_move is given the board the move is played on
+CAPTURE = 1 << 15
+EN_PASSANT = 1 << 16
+CASTLING = 1 << 17
+DOUBLE_PUSH = 1 << 18
+
+# Shared (row, col) tuples, so unpacking allocates only the outer tuple
+SQUARE_POSITIONS = tuple((square >> 3, square & 7) for square in range(64))
+
+PROMOTION_CODES = {PIECE_TYPES[code]: code for code in range(KNIGHT, QUEEN + 1)}
+
+
+def encode_move(start: int, end: int, promotion: int = 0, flags: int = 0) -> int:
+    """
+    Pack square indices into a move int.
+    
+    Args:
+        start: Start square (0-63)
+        end: End square (0-63)
+        promotion: Promotion piece type code (KNIGHT..QUEEN), or 0
+        flags: Any of CAPTURE, EN_PASSANT, CASTLING, DOUBLE_PUSH
+        
+    Returns:
+        Packed move
+    """
+    return start | end << TO_SHIFT | promotion << PROMOTION_SHIFT | flags
+
+
+def move_start(code: int) -> int:
+    """Get the start square of a packed move."""
+    return code & SQUARE_MASK
+
+
+def move_end(code: int) -> int:
+    """Get the end square of a packed move."""
+    return code >> TO_SHIFT & SQUARE_MASK
+
+
+def move_promotion(code: int) -> int:
+    """Get the promotion piece type code of a packed move (0 for none)."""
+    return code >> PROMOTION_SHIFT & PROMOTION_MASK
+
+
+def pack_move(move, board=None) -> int:
+    """
+    Convert a move tuple to a packed move.
+    
+    Without a board, only the squares and an explicit underpromotion are
+    recorded, which is enough to unpack the same tuple again. With the board
+    the move is about to be played on, queen promotions and the flags are
+    filled in as well.
+    
+    Args:
+        move: (start, end) or (start, end, piece_type) tuple
+        board: Board the move is played on (optional)
+        
+    Returns:
+        Packed move
+    """
+    (start_row, start_col), (end_row, end_col) = move[0], move[1]
+    start = start_row * 8 + start_col
+    end = end_row * 8 + end_col
+    promotion = PROMOTION_CODES[move[2]] if len(move) > 2 else 0
+    flags = 0
+    if board is not None:
+        piece = board.grid[start_row][start_col]
+        if board.grid[end_row][end_col] is not None:
+            flags |= CAPTURE
+        if piece is not None and piece.type_index == PAWN:
+            if end_row == 0 or end_row == 7:
+                promotion = promotion or QUEEN
+            elif board.en_passant_target == (end_row, end_col):
+                flags |= CAPTURE | EN_PASSANT
+            elif abs(end_row - start_row) == 2:
+                flags |= DOUBLE_PUSH
+        elif piece is not None and piece.type_index == KING and abs(end_col - start_col) == 2:
+            flags |= CASTLING
+    return encode_move(start, end, promotion, flags)
+
+
+def unpack_move(code: int) -> Optional[tuple]:
+    """
+    Convert a packed move back to the tuple form Board.push accepts.
+    
+    Queen promotions unpack to plain (start, end) moves, which Board.push
+    promotes to a queen by default.
+    
+    Args:
+        code: Packed move
+        
+    Returns:
+        (start, end) or (start, end, piece_type) tuple, or None for NULL_MOVE
+    """
+    if not code:
+        return None
+    start = SQUARE_POSITIONS[code & SQUARE_MASK]
+    end = SQUARE_POSITIONS[code >> TO_SHIFT & SQUARE_MASK]
+    promotion = code >> PROMOTION_SHIFT & PROMOTION_MASK
+    if promotion and promotion != QUEEN:
+        return (start, end, PIECE_TYPES[promotion])
+    return (start, end)
@@ -0,0 +1,151 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Conversions between board coordinates and algebraic square names, UCI
+move strings such as "e2e4" or "e7e8n", and standard algebraic notation
+(SAN) such as "Nf3" or "exd8=Q+" as used in PGN files.
+"""
+
+from typing import Tuple
+
+FILES = 'abcdefgh'
+
+# UCI promotion suffixes; a move without one promotes to a queen on the board
+PROMOTION_LETTERS = {'queen': 'q', 'rook': 'r', 'bishop': 'b', 'knight': 'n'}
+PROMOTION_TYPES = {letter: piece_type for piece_type, letter in PROMOTION_LETTERS.items()}
+
+# SAN piece letters; pawn moves have none
+SAN_LETTERS = {'knight': 'N', 'bishop': 'B', 'rook': 'R', 'queen': 'Q', 'king': 'K'}
+
+
+def square_name(row: int, col: int) -> str:
+    """
+    Get the algebraic name of a square.
+    
+    Args:
+        row, col: Square position (row 0 is rank 8)
+        
+    Returns:
+        Name such as 'e4'
+    """
+    return f"{FILES[col]}{8 - row}"
+
+
+def parse_square(name: str) -> Tuple[int, int]:
+    """
+    Get the position of a square from its algebraic name.
+    
+    Args:
+        name: Name such as 'e4'
+        
+    Returns:
+        (row, col) tuple
+        
+    Raises:
+        ValueError: If the name is not a square
+    """
+    if len(name) != 2 or name[0] not in FILES or name[1] not in '12345678':
+        raise ValueError(f"Invalid square: {name!r}")
+    return 8 - int(name[1]), FILES.index(name[0])
+
+
+def move_to_uci(move, board=None) -> str:
+    """
+    Convert a move to a UCI string.
+    
+    Args:
+        move: (start, end) or (start, end, promotion_type)
+        board: Position before the move. Queen promotions are plain
+            (start, end) moves, so without it they get no 'q' suffix.
+            
+    Returns:
+        UCI move such as 'e2e4' or 'a7a8n'
+    """
+    (start_row, start_col), (end_row, end_col) = move[0], move[1]
+    text = square_name(start_row, start_col) + square_name(end_row, end_col)
+    if len(move) > 2:
+        text += PROMOTION_LETTERS[move[2]]
+    elif board is not None and (end_row == 0 or end_row == 7):
+        piece = board.grid[start_row][start_col]
+        if piece is not None and piece.piece_type == 'pawn':
+            text += PROMOTION_LETTERS['queen']
+    return text
+
+
+def uci_to_move(text: str):
+    """
+    Convert a UCI string to a move.
+    
+    Queen promotions become plain (start, end) moves, matching the moves
+    generated for the board; other promotions keep the piece type.
+    
+    Args:
+        text: UCI move such as 'e2e4' or 'a7a8n'
+        
+    Returns:
+        (start, end) or (start, end, promotion_type)
+        
+    Raises:
+        ValueError: If the text is not a UCI move
+    """
+    if len(text) not in (4, 5):
+        raise ValueError(f"Invalid UCI move: {text!r}")
+    start = parse_square(text[0:2])
+    end = parse_square(text[2:4])
+    if len(text) == 5:
+        if text[4] not in PROMOTION_TYPES:
+            raise ValueError(f"Invalid promotion in UCI move: {text!r}")
+        if text[4] != 'q':
+            return (start, end, PROMOTION_TYPES[text[4]])
+    return (start, end)
+
+
+def move_to_san(move, board) -> str:
+    """
+    Convert a legal move to standard algebraic notation.
+    
+    Args:
+        move: (start, end) or (start, end, promotion_type)
+        board: Position before the move; restored before returning
+        
+    Returns:
+        SAN move such as 'e4', 'Nbd7', 'O-O' or 'exd8=Q#'
+    """
+    (start_row, start_col), (end_row, end_col) = move[0], move[1]
+    piece = board.grid[start_row][start_col]
+    target = square_name(end_row, end_col)
+    
+    if piece.piece_type == 'king' and abs(end_col - start_col) == 2:
+        text = 'O-O' if end_col > start_col else 'O-O-O'
+    elif piece.piece_type == 'pawn':
+        capture = start_col != end_col
+        text = f"{FILES[start_col]}x{target}" if capture else target
+        if end_row == 0 or end_row == 7:
+            text += '=' + PROMOTION_LETTERS[move[2] if len(move) > 2 else 'queen'].upper()
+    else:
+        # Name the file, the rank, or both when another piece of the same
+        # kind could also reach the target square
+        rivals = [
+            start for start, end in board.get_all_moves(piece.color)
+            if end == (end_row, end_col) and start != (start_row, start_col) and
+            board.grid[start[0]][start[1]].piece_type == piece.piece_type
+        ]
+        disambiguation = ''
+        if rivals:
+            if all(col != start_col for _, col in rivals):
+                disambiguation = FILES[start_col]
+            elif all(row != start_row for row, _ in rivals):
+                disambiguation = str(8 - start_row)
+            else:
+                disambiguation = square_name(start_row, start_col)
+        capture = 'x' if board.grid[end_row][end_col] is not None else ''
+        text = f"{SAN_LETTERS[piece.piece_type]}{disambiguation}{capture}{target}"
+    
+    board.push(move)
+    opponent = board.current_turn
+    if board.is_checkmate(opponent):
+        text += '#'
+    elif board.is_in_check(opponent):
+        text += '+'
+    board.pop()
+    return text
@@ -0,0 +1,217 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Perft: count the leaf nodes of the legal move tree to a fixed depth.
+
+Perft checks move generation against published node counts and measures
+how fast moves are generated, made and unmade. Run it from the command line:
+
+    python -m chess.perft                     # reference positions
+    python -m chess.perft --fen "<FEN>" --depth 4 --divide
+    python -m chess.perft --bench --baseline perft_baseline.json
+
+Benchmark mode fails (exit status 2) when the speed drops more than the
+threshold below a saved baseline.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from chess.board import Board
+from chess.movegen import generate_legal_moves
+from chess.notation import move_to_uci
+
+# (name, FEN, node counts for depth 1, 2, ...) from the Chess Programming Wiki
+REFERENCE_POSITIONS: List[Tuple[str, str, List[int]]] = [
+    ("startpos", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+     [20, 400, 8902, 197281, 4865609]),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+     [48, 2039, 97862, 4085603]),
+    ("position3", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+     [14, 191, 2812, 43238, 674624]),
+    ("position4", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+     [6, 264, 9467, 422333]),
+    ("position5", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+     [44, 1486, 62379, 2103487]),
+    ("position6", "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+     [46, 2079, 89890, 3894594]),
+]
+
+# Depth per reference position used by the default run and the benchmark
+DEFAULT_DEPTHS = {
+    "startpos": 4, "kiwipete": 3, "position3": 4,
+    "position4": 3, "position5": 3, "position6": 3,
+}
+
+# Allowed slowdown against the baseline before the benchmark fails
+DEFAULT_THRESHOLD = 0.2
+
+
+def perft(board: Board, depth: int) -> int:
+    """
+    Count leaf nodes of the legal move tree.
+    
+    Args:
+        board: Position to search; restored before returning
+        depth: Number of plies
+        
+    Returns:
+        Number of move sequences of exactly this length
+    """
+    moves = generate_legal_moves(board, board.current_turn, underpromotions=True)
+    if depth <= 1:
+        return len(moves) if depth == 1 else 1
+    nodes = 0
+    for move in moves:
+        board.push(move)
+        nodes += perft(board, depth - 1)
+        board.pop()
+    return nodes
+
+
+def divide(board: Board, depth: int) -> Dict[str, int]:
+    """
+    Count leaf nodes below each root move, for finding move generation bugs.
+    
+    Args:
+        board: Position to search; restored before returning
+        depth: Number of plies including the root move
+        
+    Returns:
+        Dict mapping each root move in UCI notation to its node count
+    """
+    counts = {}
+    for move in generate_legal_moves(board, board.current_turn, underpromotions=True):
+        name = move_to_uci(move, board)
+        board.push(move)
+        counts[name] = perft(board, depth - 1)
+        board.pop()
+    return counts
+
+
+def run_reference(depths: Optional[Dict[str, int]] = None, verbose: bool = True) -> Tuple[bool, int, float]:
+    """
+    Run perft on the reference positions and compare with the known counts.
+    
+    Positions searched deeper than their listed counts are run and reported
+    with "no reference" but are not counted as wrong.
+    
+    Args:
+        depths: Depth per position name (default: DEFAULT_DEPTHS)
+        verbose: Print a line per position
+        
+    Returns:
+        (all checked counts correct, total nodes, total seconds)
+    """
+    depths = depths or DEFAULT_DEPTHS
+    all_correct = True
+    total_nodes = 0
+    total_time = 0.0
+    for name, fen, expected in REFERENCE_POSITIONS:
+        depth = depths.get(name)
+        if not depth:
+            continue
+        board = Board.from_fen(fen)
+        start = time.perf_counter()
+        nodes = perft(board, depth)
+        elapsed = time.perf_counter() - start
+        total_nodes += nodes
+        total_time += elapsed
+        if depth > len(expected):
+            # Deeper than the published counts: report the count unchecked
+            status = "no reference"
+        elif nodes == expected[depth - 1]:
+            status = "OK"
+        else:
+            status = f"FAIL (expected {expected[depth - 1]})"
+            all_correct = False
+        if verbose:
+            print(f"{name:10} depth {depth}: {nodes:>9} nodes "
+                  f"{elapsed:7.2f}s {_nps(nodes, elapsed):>8} nps  {status}")
+    return all_correct, total_nodes, total_time
+
+
+def _nps(nodes: int, seconds: float) -> int:
+    """Nodes per second, or 0 if no time was measured."""
+    return int(nodes / seconds) if seconds > 0 else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+    
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+        
+    Returns:
+        Exit status: 0 on success, 1 on wrong counts, 2 on a benchmark slowdown
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess.perft",
+                                     description="Perft move generation checks and benchmark.")
+    parser.add_argument("--fen", help="Position to search instead of the reference set")
+    parser.add_argument("--depth", type=int, help="Search depth (default: per position)")
+    parser.add_argument("--divide", action="store_true", help="Show node counts per root move")
+    parser.add_argument("--bench", action="store_true",
+                        help="Compare speed with the baseline file")
+    parser.add_argument("--baseline", default="perft_baseline.json",
+                        help="Benchmark baseline file (default: perft_baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write this run's speed as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction (default: 0.2)")
+    args = parser.parse_args(argv)
+    
+    if args.fen:
+        try:
+            board = Board.from_fen(args.fen)
+        except ValueError as e:
+            parser.error(str(e))
+        depth = args.depth or 3
+        start = time.perf_counter()
+        if args.divide:
+            counts = divide(board, depth)
+            for move, count in sorted(counts.items()):
+                print(f"{move}: {count}")
+            nodes = sum(counts.values())
+        else:
+            nodes = perft(board, depth)
+        elapsed = time.perf_counter() - start
+        print(f"Nodes: {nodes}  Time: {elapsed:.2f}s  NPS: {_nps(nodes, elapsed)}")
+        return 0
+    
+    depths = {name: args.depth for name, _, _ in REFERENCE_POSITIONS} if args.depth else None
+    correct, nodes, elapsed = run_reference(depths)
+    nps = _nps(nodes, elapsed)
+    print(f"Total: {nodes} nodes  {elapsed:.2f}s  {nps} nps")
+    if not correct:
+        print("[FAILED] Node counts differ from the reference")
+        return 1
+    
+    if args.save_baseline:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump({'nps': nps, 'depths': depths or DEFAULT_DEPTHS}, baseline_file, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    elif args.bench:
+        try:
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)
+        except FileNotFoundError:
+            print(f"No baseline at {args.baseline}; run with --save-baseline first")
+            return 2
+        if baseline.get('depths') != (depths or DEFAULT_DEPTHS):
+            print("Baseline was recorded with different depths; save a new one")
+            return 2
+        minimum = baseline['nps'] * (1 - args.threshold)
+        print(f"Baseline: {baseline['nps']} nps  minimum allowed: {int(minimum)} nps")
+        if nps < minimum:
+            print(f"[FAILED] Move generation is {1 - nps / baseline['nps']:.0%} slower than the baseline")
+            return 2
+        print("[OK] Within the allowed slowdown")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,12 +3,13 @@ Author: Sepehr Bayat | Open Source Chess MVP
 
 Piece image loader and renderer.
 Falls back to high-quality drawn chess pieces if images are not available.
+Sprites are built once per piece, color and square size and then reused.
 """
 
 import pygame
 import os
 import math
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from pathlib import Path
 from chess.constants import SQUARE_SIZE
 
@@ -19,6 +20,10 @@ class PieceImageLoader:
     def __init__(self):
         """Initialize the image loader."""
         self.images: Dict[str, pygame.Surface] = {}
+        # Unscaled images from assets, for scaling to other square sizes
+        self._source_images: Dict[str, pygame.Surface] = {}
+        # Ready-to-blit sprites keyed by (piece_type, color, square_size)
+        self._sprites: Dict[Tuple[str, str, int], pygame.Surface] = {}
         self.use_images = False
         self.assets_dir = Path(__file__).parent.parent / "assets"
         self._load_images()
@@ -46,9 +51,10 @@ class PieceImageLoader:
             if image_path.exists():
                 try:
                     img = pygame.image.load(str(image_path))
+                    self._source_images[key] = img
                     # Scale to fit square size
                     img = pygame.transform.scale(img, (int(SQUARE_SIZE * 0.85), int(SQUARE_SIZE * 0.85)))
-                    self.images[key] = img
+                    self.images[key] = self._prepare(img)
                     self.use_images = True
                 except Exception as e:
                     print(f"Warning: Could not load {image_path}: {e}")
@@ -78,19 +84,58 @@ class PieceImageLoader:
         piece_key = f"{piece_type}_{color}"
         return self.images.get(piece_key)
     
-    def create_simple_image(self, piece_type: str, color: str) -> pygame.Surface:
+    def get_sprite(self, piece_type: str, color: str,
+                   square_size: int = SQUARE_SIZE) -> pygame.Surface:
+        """
+        Get the surface to draw a piece with, building it on first use.
+        
+        Uses the image from assets if there is one, otherwise a drawn piece.
+        The result is cached, so drawing a board does no rendering.
+        
+        Args:
+            piece_type: Type of piece
+            color: Color of piece
+            square_size: Size of a board square in pixels
+            
+        Returns:
+            Pygame surface with the piece
+        """
+        cache_key = (piece_type, color, square_size)
+        sprite = self._sprites.get(cache_key)
+        if sprite is None:
+            image_key = f"{piece_type}_{color}"
+            if self.use_images and image_key in self._source_images:
+                image_size = int(square_size * 0.85)
+                sprite = pygame.transform.scale(self._source_images[image_key], (image_size, image_size))
+            else:
+                sprite = self.create_simple_image(piece_type, color, square_size)
+            sprite = self._prepare(sprite)
+            self._sprites[cache_key] = sprite
+        return sprite
+    
+    def _prepare(self, surface: pygame.Surface) -> pygame.Surface:
+        """Convert a surface to the display's pixel format for fast blitting."""
+        if pygame.display.get_surface() is None:
+            return surface  # No display mode set yet, so nothing to convert to
+        return surface.convert_alpha()
+    
+    def create_simple_image(self, piece_type: str, color: str,
+                            square_size: int = SQUARE_SIZE) -> pygame.Surface:
         """
         Create a high-quality, detailed chess piece image using pygame drawing.
         This draws realistic-looking chess pieces with better detail.
         
+        Each call draws a new surface; use get_sprite to reuse them.
+        
         Args:
             piece_type: Type of piece
             color: Color of piece
+            square_size: Size of a board square in pixels
             
         Returns:
             Pygame surface with drawn piece
         """
-        size = int(SQUARE_SIZE * 0.9)
+        size = int(square_size * 0.9)
         surface = pygame.Surface((size, size), pygame.SRCALPHA)
         center_x, center_y = size // 2, size // 2
         
@@ -4,12 +4,28 @@ Author: Sepehr Bayat | Open Source Chess MVP
 Piece classes: Base Piece class and all 6 piece subclasses with move validation.
 """
 
-from typing import List, Tuple, Optional
+from typing import List, Tuple
 from abc import ABC, abstractmethod
+from chess.bitboard import COLOR_INDEX, WHITE_INDEX, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
+from chess.attacks import (
+    KNIGHT_TARGETS, KING_TARGETS, PAWN_TARGETS, RAY_TARGETS,
+    ROOK_DIRECTIONS, BISHOP_DIRECTIONS, QUEEN_DIRECTIONS
+)
 
 
 class Piece(ABC):
-    """Base class for all chess pieces."""
+    """
+    Base class for all chess pieces.
+    
+    Pieces use __slots__ to keep per-instance memory small. The type name and
+    code are class attributes; color_index and index (the piece's slot in
+    Board.bitboards) are small ints for comparisons on hot paths.
+    """
+    
+    __slots__ = ('color', 'color_index', 'index', 'row', 'col', 'has_moved')
+    
+    piece_type: str = ''
+    type_index: int = 0
     
     def __init__(self, color: str, row: int, col: int):
         """
@@ -21,10 +37,11 @@ class Piece(ABC):
             col: Column position (0-7)
         """
         self.color = color
+        self.color_index = COLOR_INDEX[color]
+        self.index = self.color_index * 6 + self.type_index
         self.row = row
         self.col = col
         self.has_moved = False
-        self.piece_type = self.__class__.__name__.lower()
     
     def get_position(self) -> Tuple[int, int]:
         """Get the current position of the piece."""
@@ -36,7 +53,6 @@ class Piece(ABC):
         self.col = col
         self.has_moved = True
     
-    @abstractmethod
     def get_valid_moves(self, board) -> List[Tuple[int, int]]:
         """
         Get all valid moves for this piece.
@@ -47,8 +63,54 @@ class Piece(ABC):
         Returns:
             List of (row, col) tuples representing valid moves
         """
+        # Filter the board's cached move list so all pieces share one generation
+        start = (self.row, self.col)
+        return [end for move_start, end in board.get_all_moves(self.color) if move_start == start]
+    
+    @abstractmethod
+    def get_pseudo_legal_moves(self, board) -> List[Tuple[int, int]]:
+        """
+        Get moves for this piece ignoring whether they leave the king in check.
+        
+        Castling is not included; the legal move generator adds it.
+        
+        Args:
+            board: Board instance
+            
+        Returns:
+            List of (row, col) tuples
+        """
         pass
     
+    def _get_sliding_moves(self, board, directions) -> List[Tuple[int, int]]:
+        """Walk precomputed rays until blocked, including enemy captures."""
+        moves = []
+        grid = board.grid
+        rays = RAY_TARGETS
+        square = self.row * 8 + self.col
+        color_index = self.color_index
+        for direction in directions:
+            for new_row, new_col in rays[direction][square]:
+                target = grid[new_row][new_col]
+                if target is None:
+                    moves.append((new_row, new_col))
+                else:
+                    if target.color_index != color_index:
+                        moves.append((new_row, new_col))
+                    break
+        return moves
+    
+    def _get_leaper_moves(self, board, targets) -> List[Tuple[int, int]]:
+        """Filter a precomputed target list down to empty or enemy squares."""
+        moves = []
+        grid = board.grid
+        color_index = self.color_index
+        for new_row, new_col in targets:
+            target = grid[new_row][new_col]
+            if target is None or target.color_index != color_index:
+                moves.append((new_row, new_col))
+        return moves
+    
     @abstractmethod
     def get_symbol(self) -> str:
         """Get the Unicode symbol for this piece."""
@@ -67,11 +129,16 @@ class Piece(ABC):
 class Pawn(Piece):
     """Pawn piece with forward movement and diagonal capture."""
     
-    def get_valid_moves(self, board) -> List[Tuple[int, int]]:
-        """Get valid moves for a pawn."""
+    __slots__ = ()
+    piece_type = 'pawn'
+    type_index = PAWN
+    
+    def get_pseudo_legal_moves(self, board) -> List[Tuple[int, int]]:
+        """Get moves for a pawn without checking king safety."""
         moves = []
-        direction = -1 if self.color == 'white' else 1
-        start_row = 6 if self.color == 'white' else 1
+        color_index = self.color_index
+        direction = -1 if color_index == WHITE_INDEX else 1
+        start_row = 6 if color_index == WHITE_INDEX else 1
         
         # Forward move (one square)
         new_row = self.row + direction
@@ -85,13 +152,10 @@ class Pawn(Piece):
                     moves.append((new_row2, self.col))
         
         # Diagonal captures
-        for col_offset in [-1, 1]:
-            new_col = self.col + col_offset
-            new_row = self.row + direction
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                target = board.get_piece(new_row, new_col)
-                if target is not None and target.color != self.color:
-                    moves.append((new_row, new_col))
+        for new_row, new_col in PAWN_TARGETS[color_index][self.row * 8 + self.col]:
+            target = board.grid[new_row][new_col]
+            if target is not None and target.color_index != color_index:
+                moves.append((new_row, new_col))
         
         # En passant
         if board.en_passant_target:
@@ -100,13 +164,7 @@ class Pawn(Piece):
                 abs(ep_col - self.col) == 1):
                 moves.append((ep_row, ep_col))
         
-        # Filter out moves that would leave king in check
-        valid_moves = []
-        for move in moves:
-            if board.is_move_safe(self.row, self.col, move[0], move[1], self.color):
-                valid_moves.append(move)
-        
-        return valid_moves
+        return moves
     
     def get_symbol(self) -> str:
         """Get pawn Unicode symbol."""
@@ -117,35 +175,13 @@ class Pawn(Piece):
 class Rook(Piece):
     """Rook piece with horizontal and vertical movement."""
     
-    def get_valid_moves(self, board) -> List[Tuple[int, int]]:
-        """Get valid moves for a rook."""
-        moves = []
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]  # Right, Left, Down, Up
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row = self.row + (dr * i)
-                new_col = self.col + (dc * i)
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                
-                target = board.get_piece(new_row, new_col)
-                if target is None:
-                    moves.append((new_row, new_col))
-                elif target.color != self.color:
-                    moves.append((new_row, new_col))
-                    break
-                else:
-                    break
-        
-        # Filter out moves that would leave king in check
-        valid_moves = []
-        for move in moves:
-            if board.is_move_safe(self.row, self.col, move[0], move[1], self.color):
-                valid_moves.append(move)
-        
-        return valid_moves
+    __slots__ = ()
+    piece_type = 'rook'
+    type_index = ROOK
+    
+    def get_pseudo_legal_moves(self, board) -> List[Tuple[int, int]]:
+        """Get moves for a rook without checking king safety."""
+        return self._get_sliding_moves(board, ROOK_DIRECTIONS)
     
     def get_symbol(self) -> str:
         """Get rook Unicode symbol."""
@@ -156,30 +192,13 @@ class Rook(Piece):
 class Knight(Piece):
     """Knight piece with L-shaped movement."""
     
-    def get_valid_moves(self, board) -> List[Tuple[int, int]]:
-        """Get valid moves for a knight."""
-        moves = []
-        knight_moves = [
-            (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-            (1, -2), (1, 2), (2, -1), (2, 1)
-        ]
-        
-        for dr, dc in knight_moves:
-            new_row = self.row + dr
-            new_col = self.col + dc
-            
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                target = board.get_piece(new_row, new_col)
-                if target is None or target.color != self.color:
-                    moves.append((new_row, new_col))
-        
-        # Filter out moves that would leave king in check
-        valid_moves = []
-        for move in moves:
-            if board.is_move_safe(self.row, self.col, move[0], move[1], self.color):
-                valid_moves.append(move)
-        
-        return valid_moves
+    __slots__ = ()
+    piece_type = 'knight'
+    type_index = KNIGHT
+    
+    def get_pseudo_legal_moves(self, board) -> List[Tuple[int, int]]:
+        """Get moves for a knight without checking king safety."""
+        return self._get_leaper_moves(board, KNIGHT_TARGETS[self.row * 8 + self.col])
     
     def get_symbol(self) -> str:
         """Get knight Unicode symbol."""
@@ -190,35 +209,13 @@ class Knight(Piece):
 class Bishop(Piece):
     """Bishop piece with diagonal movement."""
     
-    def get_valid_moves(self, board) -> List[Tuple[int, int]]:
-        """Get valid moves for a bishop."""
-        moves = []
-        directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]  # All diagonals
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row = self.row + (dr * i)
-                new_col = self.col + (dc * i)
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                
-                target = board.get_piece(new_row, new_col)
-                if target is None:
-                    moves.append((new_row, new_col))
-                elif target.color != self.color:
-                    moves.append((new_row, new_col))
-                    break
-                else:
-                    break
-        
-        # Filter out moves that would leave king in check
-        valid_moves = []
-        for move in moves:
-            if board.is_move_safe(self.row, self.col, move[0], move[1], self.color):
-                valid_moves.append(move)
-        
-        return valid_moves
+    __slots__ = ()
+    piece_type = 'bishop'
+    type_index = BISHOP
+    
+    def get_pseudo_legal_moves(self, board) -> List[Tuple[int, int]]:
+        """Get moves for a bishop without checking king safety."""
+        return self._get_sliding_moves(board, BISHOP_DIRECTIONS)
     
     def get_symbol(self) -> str:
         """Get bishop Unicode symbol."""
@@ -229,38 +226,13 @@ class Bishop(Piece):
 class Queen(Piece):
     """Queen piece with combined rook and bishop movement."""
     
-    def get_valid_moves(self, board) -> List[Tuple[int, int]]:
-        """Get valid moves for a queen."""
-        moves = []
-        directions = [
-            (0, 1), (0, -1), (1, 0), (-1, 0),  # Rook moves
-            (1, 1), (1, -1), (-1, 1), (-1, -1)  # Bishop moves
-        ]
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row = self.row + (dr * i)
-                new_col = self.col + (dc * i)
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                
-                target = board.get_piece(new_row, new_col)
-                if target is None:
-                    moves.append((new_row, new_col))
-                elif target.color != self.color:
-                    moves.append((new_row, new_col))
-                    break
-                else:
-                    break
-        
-        # Filter out moves that would leave king in check
-        valid_moves = []
-        for move in moves:
-            if board.is_move_safe(self.row, self.col, move[0], move[1], self.color):
-                valid_moves.append(move)
-        
-        return valid_moves
+    __slots__ = ()
+    piece_type = 'queen'
+    type_index = QUEEN
+    
+    def get_pseudo_legal_moves(self, board) -> List[Tuple[int, int]]:
+        """Get moves for a queen without checking king safety."""
+        return self._get_sliding_moves(board, QUEEN_DIRECTIONS)
     
     def get_symbol(self) -> str:
         """Get queen Unicode symbol."""
@@ -271,40 +243,34 @@ class Queen(Piece):
 class King(Piece):
     """King piece with one-square movement and castling."""
     
-    def get_valid_moves(self, board) -> List[Tuple[int, int]]:
-        """Get valid moves for a king."""
-        moves = []
-        king_moves = [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1),           (0, 1),
-            (1, -1),  (1, 0),  (1, 1)
-        ]
+    __slots__ = ()
+    piece_type = 'king'
+    type_index = KING
+    
+    def get_pseudo_legal_moves(self, board) -> List[Tuple[int, int]]:
+        """Get moves for a king without checking king safety."""
+        return self._get_leaper_moves(board, KING_TARGETS[self.row * 8 + self.col])
+    
+    def get_castling_moves(self, board) -> List[Tuple[int, int]]:
+        """
+        Get castling moves; the caller must ensure the king is not in check.
         
-        for dr, dc in king_moves:
-            new_row = self.row + dr
-            new_col = self.col + dc
+        Args:
+            board: Board instance
             
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                target = board.get_piece(new_row, new_col)
-                if target is None or target.color != self.color:
-                    moves.append((new_row, new_col))
-        
-        # Castling
-        if not self.has_moved and not board.is_in_check(self.color):
-            # Kingside castling
-            if self._can_castle_kingside(board):
-                moves.append((self.row, self.col + 2))
-            # Queenside castling
-            if self._can_castle_queenside(board):
-                moves.append((self.row, self.col - 2))
-        
-        # Filter out moves that would leave king in check
-        valid_moves = []
-        for move in moves:
-            if board.is_move_safe(self.row, self.col, move[0], move[1], self.color):
-                valid_moves.append(move)
-        
-        return valid_moves
+        Returns:
+            List of (row, col) king destinations
+        """
+        moves = []
+        if self.has_moved:
+            return moves
+        # Kingside castling
+        if self._can_castle_kingside(board):
+            moves.append((self.row, self.col + 2))
+        # Queenside castling
+        if self._can_castle_queenside(board):
+            moves.append((self.row, self.col - 2))
+        return moves
     
     def _can_castle_kingside(self, board) -> bool:
         """Check if kingside castling is possible."""
@@ -313,7 +279,7 @@ class King(Piece):
         
         rook_col = 7
         rook = board.get_piece(self.row, rook_col)
-        if rook is None or rook.piece_type != 'rook' or rook.has_moved:
+        if rook is None or rook.type_index != ROOK or rook.has_moved:
             return False
         
         # Check if squares between are empty
@@ -335,7 +301,7 @@ class King(Piece):
         
         rook_col = 0
         rook = board.get_piece(self.row, rook_col)
-        if rook is None or rook.piece_type != 'rook' or rook.has_moved:
+        if rook is None or rook.type_index != ROOK or rook.has_moved:
             return False
         
         # Check if squares between are empty
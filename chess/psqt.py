@@ -0,0 +1,106 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Material values and piece-square tables for fast search evaluation.
+
+Values are in centipawns. Tables are written from white's point of view with
+the first row being rank 8, matching Board.grid, and are mirrored for black.
+They follow the well-known "simplified evaluation function" values.
+"""
+
+from chess.constants import PIECE_VALUES
+from chess.bitboard import COLORS, PIECE_TYPES
+
+# Centipawn material values; the king is never traded, so it counts zero
+MATERIAL_VALUES = {
+    piece_type: (value * 100 if piece_type != 'king' else 0)
+    for piece_type, value in PIECE_VALUES.items()
+}
+
+_PAWN_TABLE = [
+    0,   0,   0,   0,   0,   0,   0,   0,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    10,  10,  20,  30,  30,  20,  10,  10,
+    5,   5,  10,  25,  25,  10,   5,   5,
+    0,   0,   0,  20,  20,   0,   0,   0,
+    5,  -5, -10,   0,   0, -10,  -5,   5,
+    5,  10,  10, -20, -20,  10,  10,   5,
+    0,   0,   0,   0,   0,   0,   0,   0,
+]
+
+_KNIGHT_TABLE = [
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20,   0,   0,   0,   0, -20, -40,
+    -30,   0,  10,  15,  15,  10,   0, -30,
+    -30,   5,  15,  20,  20,  15,   5, -30,
+    -30,   0,  15,  20,  20,  15,   0, -30,
+    -30,   5,  10,  15,  15,  10,   5, -30,
+    -40, -20,   0,   5,   5,   0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+]
+
+_BISHOP_TABLE = [
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,  10,  10,   5,   0, -10,
+    -10,   5,   5,  10,  10,   5,   5, -10,
+    -10,   0,  10,  10,  10,  10,   0, -10,
+    -10,  10,  10,  10,  10,  10,  10, -10,
+    -10,   5,   0,   0,   0,   0,   5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+]
+
+_ROOK_TABLE = [
+    0,   0,   0,   0,   0,   0,   0,   0,
+    5,  10,  10,  10,  10,  10,  10,   5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    0,   0,   0,   5,   5,   0,   0,   0,
+]
+
+_QUEEN_TABLE = [
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,   5,   5,   5,   0, -10,
+    -5,   0,   5,   5,   5,   5,   0,  -5,
+    0,   0,   5,   5,   5,   5,   0,  -5,
+    -10,   5,   5,   5,   5,   5,   0, -10,
+    -10,   0,   5,   0,   0,   0,   0, -10,
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+]
+
+_KING_TABLE = [
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+    20,  20,   0,   0,   0,   0,  20,  20,
+    20,  30,  10,   0,   0,  10,  30,  20,
+]
+
+_WHITE_TABLES = {
+    'pawn': _PAWN_TABLE,
+    'knight': _KNIGHT_TABLE,
+    'bishop': _BISHOP_TABLE,
+    'rook': _ROOK_TABLE,
+    'queen': _QUEEN_TABLE,
+    'king': _KING_TABLE,
+}
+
+# Per-square bonus indexed like Board.bitboards: [color * 6 + type][square]
+PIECE_SQUARE_TABLES = [
+    [
+        _WHITE_TABLES[piece_type][square if color == 'white' else (7 - (square >> 3)) * 8 + (square & 7)]
+        for square in range(64)
+    ]
+    for color in COLORS
+    for piece_type in PIECE_TYPES
+]
+
+# Material value indexed like Board.bitboards
+MATERIAL_BY_INDEX = [MATERIAL_VALUES[piece_type] for _ in COLORS for piece_type in PIECE_TYPES]
@@ -0,0 +1,148 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Fixed-size transposition table for the AI search.
+
+Each bucket holds two entries: a depth-preferred slot that keeps the deepest
+search of the current age, and an always-replace slot for everything else.
+Entries are plain tuples (key, depth, score, flag, best_move, age) to keep
+allocation per store down to one tuple; best moves are packed ints (see
+chess.moves) rather than nested move tuples.
+"""
+
+from typing import Dict, Optional, Tuple
+
+# Bound types
+EXACT = 0
+LOWER_BOUND = 1  # Score is at least this (search failed high)
+UPPER_BOUND = 2  # Score is at most this (search failed low)
+
+# Entry tuple fields
+KEY, DEPTH, SCORE, FLAG, BEST_MOVE, AGE = range(6)
+
+# Approximate memory per bucket in CPython: two slot pointers plus two
+# six-field entry tuples with their 64-bit key ints
+BUCKET_BYTES = 2 * 8 + 2 * (88 + 36)
+
+
+class TranspositionTable:
+    """Position-keyed cache of search results with a bounded memory budget."""
+    
+    def __init__(self, size_mb: float = 16):
+        """
+        Initialize the table.
+        
+        Args:
+            size_mb: Approximate memory budget in megabytes
+        """
+        self.age = 0
+        self.resize(size_mb)
+    
+    def resize(self, size_mb: float):
+        """
+        Reallocate the table for a new memory budget, discarding all entries.
+        
+        Args:
+            size_mb: Approximate memory budget in megabytes
+        """
+        buckets = max(1, int(size_mb * 1024 * 1024) // BUCKET_BYTES)
+        # Round down to a power of two so the index is a mask of the key
+        self.size = 1 << (buckets.bit_length() - 1)
+        self.size_mb = size_mb
+        self._mask = self.size - 1
+        self.clear()
+    
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        self._depth_slots = [None] * self.size
+        self._always_slots = [None] * self.size
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+    
+    def new_search(self):
+        """Start a new search; entries from older searches become replaceable."""
+        self.age += 1
+    
+    def probe(self, key: int) -> Optional[Tuple]:
+        """
+        Look up a position.
+        
+        Args:
+            key: Zobrist key of the position
+            
+        Returns:
+            Entry tuple (key, depth, score, flag, best_move, age) or None
+        """
+        index = key & self._mask
+        entry = self._depth_slots[index]
+        if entry is not None and entry[KEY] == key:
+            self.hits += 1
+            return entry
+        other = self._always_slots[index]
+        if other is not None and other[KEY] == key:
+            self.hits += 1
+            return other
+        if entry is not None or other is not None:
+            self.collisions += 1  # Bucket is in use by other positions
+        else:
+            self.misses += 1
+        return None
+    
+    def store(self, key: int, depth: int, score: float, flag: int, best_move):
+        """
+        Store a search result.
+        
+        The depth-preferred slot is replaced when it holds the same position,
+        a shallower result, or a result from an earlier search; otherwise the
+        always-replace slot takes the entry.
+        
+        Args:
+            key: Zobrist key of the position
+            depth: Remaining search depth the score was computed with
+            score: Score from the side to move's point of view
+            flag: EXACT, LOWER_BOUND or UPPER_BOUND
+            best_move: Best move found, packed with chess.moves.pack_move
+                (NULL_MOVE for none)
+        """
+        index = key & self._mask
+        entry = (key, depth, score, flag, best_move, self.age)
+        current = self._depth_slots[index]
+        self.stores += 1
+        if (current is None or current[KEY] == key or
+                depth >= current[DEPTH] or current[AGE] != self.age):
+            if current is not None and current[KEY] != key:
+                self._always_slots[index] = current  # Keep it a little longer
+            self._depth_slots[index] = entry
+        else:
+            self._always_slots[index] = entry
+    
+    def get_best_move(self, key: int):
+        """Get the stored packed best move for a position without counting a probe."""
+        index = key & self._mask
+        for entry in (self._depth_slots[index], self._always_slots[index]):
+            if entry is not None and entry[KEY] == key:
+                return entry[BEST_MOVE]
+        return None
+    
+    def hashfull(self) -> int:
+        """Estimate table occupancy in permille from the first 1000 buckets."""
+        sample = min(1000, self.size)
+        used = sum(1 for entry in self._depth_slots[:sample] if entry is not None)
+        return used * 1000 // sample
+    
+    def stats(self) -> Dict[str, float]:
+        """Get hit/miss/collision counters for sizing the table."""
+        probes = self.hits + self.misses + self.collisions
+        return {
+            'size_mb': self.size_mb,
+            'buckets': self.size,
+            'probes': probes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'collisions': self.collisions,
+            'stores': self.stores,
+            'hit_rate_permille': self.hits * 1000 // probes if probes else 0,
+            'hashfull': self.hashfull(),
+        }
@@ -0,0 +1,269 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+UCI (Universal Chess Interface) front-end for ChessAI.
+
+Reads commands from stdin and writes responses to stdout so the engine can
+be used from chess GUIs and tournament managers:
+
+    python -m chess.uci
+
+Supported commands: uci, isready, ucinewgame, setoption (Hash, Threads),
+position (startpos/fen, moves), go (depth, movetime, wtime/btime with
+winc/binc/movestogo, nodes, infinite), stop and quit. Searches run on a
+background thread, so stop and isready are answered while searching.
+"""
+
+import sys
+import threading
+from typing import List, Optional, TextIO
+
+from chess.ai import ChessAI, MATE_SCORE, MATE_THRESHOLD, MAX_SEARCH_DEPTH
+from chess.board import Board, STARTING_FEN
+from chess.movegen import generate_legal_moves
+from chess.notation import move_to_uci, uci_to_move
+
+ENGINE_NAME = "Chess MVP"
+ENGINE_AUTHOR = "Sepehr Bayat"
+
+DEFAULT_HASH_MB = 16
+MAX_HASH_MB = 4096
+MAX_THREADS = 256
+
+# Clock management: share of the remaining time to spend when the number of
+# moves to the next time control is unknown, and a safety margin in seconds
+DEFAULT_MOVES_TO_GO = 30
+MOVE_OVERHEAD = 0.05
+
+
+def format_score(score: float) -> str:
+    """
+    Format a search score for an info line.
+    
+    Args:
+        score: Score in centipawns from the side to move's point of view
+        
+    Returns:
+        'cp <centipawns>' or 'mate <moves>' (negative when getting mated)
+    """
+    if score > MATE_THRESHOLD:
+        return f"mate {(MATE_SCORE - int(score) + 1) // 2}"
+    if score < -MATE_THRESHOLD:
+        return f"mate -{(MATE_SCORE + int(score)) // 2}"
+    return f"cp {int(score)}"
+
+
+class UCIEngine:
+    """UCI command handler around one ChessAI instance."""
+    
+    def __init__(self, output: TextIO = sys.stdout):
+        """
+        Initialize the engine.
+        
+        Args:
+            output: Stream to write responses to
+        """
+        self.output = output
+        self.hash_mb = DEFAULT_HASH_MB
+        self.threads = 1
+        self.ai = self._create_ai()
+        self.board = Board()
+        self._output_lock = threading.Lock()
+        self._search_thread: Optional[threading.Thread] = None
+        # Set by stop; an infinite search waits for it before reporting
+        self._stop_event = threading.Event()
+    
+    def _create_ai(self) -> ChessAI:
+        """Create the AI with the current Hash and Threads options."""
+        return ChessAI(depth=MAX_SEARCH_DEPTH, hash_size_mb=self.hash_mb, workers=self.threads)
+    
+    def send(self, line: str):
+        """Write one response line."""
+        with self._output_lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+    
+    def run(self, input_stream: TextIO = sys.stdin):
+        """
+        Handle commands until quit or end of input.
+        
+        Args:
+            input_stream: Stream to read commands from
+        """
+        for line in input_stream:
+            if not self.handle(line):
+                break
+        self.quit()
+    
+    def handle(self, line: str) -> bool:
+        """
+        Handle one command line.
+        
+        Args:
+            line: Command as received
+            
+        Returns:
+            False if the engine should quit, otherwise True
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+        
+        if command == "uci":
+            self.send(f"id name {ENGINE_NAME}")
+            self.send(f"id author {ENGINE_AUTHOR}")
+            self.send(f"option name Hash type spin default {DEFAULT_HASH_MB} min 1 max {MAX_HASH_MB}")
+            self.send(f"option name Threads type spin default 1 min 1 max {MAX_THREADS}")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "ucinewgame":
+            self.wait()
+            self.ai.transposition_table.clear()
+        elif command == "setoption":
+            self._set_option(args)
+        elif command == "position":
+            self._set_position(args)
+        elif command == "go":
+            self._go(args)
+        elif command == "stop":
+            self.stop()
+        elif command == "quit":
+            return False
+        return True
+    
+    def stop(self):
+        """Stop any running search and wait for it to report its best move."""
+        self._stop_event.set()
+        if self._search_thread is None:
+            return
+        while self._search_thread.is_alive():
+            # Repeat the request in case the search had not started yet
+            self.ai.stop()
+            self._search_thread.join(0.01)
+        self._search_thread = None
+    
+    def wait(self):
+        """Wait for a running search to finish on its own."""
+        if self._search_thread is not None:
+            self._search_thread.join()
+            self._search_thread = None
+    
+    def quit(self):
+        """Stop searching and release the search worker processes."""
+        self.stop()
+        self.ai.close()
+    
+    def _set_option(self, args: List[str]):
+        """Handle 'setoption name <name> value <value>'."""
+        if "name" not in args or "value" not in args:
+            return
+        name = " ".join(args[args.index("name") + 1:args.index("value")]).lower()
+        value = " ".join(args[args.index("value") + 1:])
+        try:
+            number = int(value)
+        except ValueError:
+            return
+        self.wait()
+        if name == "hash":
+            self.hash_mb = max(1, min(number, MAX_HASH_MB))
+            if self.threads > 1:
+                # Workers size their own tables when the pool starts
+                self.ai.close()
+                self.ai = self._create_ai()
+            else:
+                self.ai.hash_size_mb = self.hash_mb
+                self.ai.transposition_table.resize(self.hash_mb)
+        elif name == "threads":
+            self.threads = max(1, min(number, MAX_THREADS))
+            self.ai.close()
+            self.ai = self._create_ai()
+    
+    def _set_position(self, args: List[str]):
+        """Handle 'position startpos|fen <fen> [moves <move> ...]'."""
+        self.wait()
+        if "moves" in args:
+            moves = args[args.index("moves") + 1:]
+            args = args[:args.index("moves")]
+        else:
+            moves = []
+        try:
+            if args and args[0] == "fen":
+                board = Board.from_fen(" ".join(args[1:]))
+            else:
+                board = Board.from_fen(STARTING_FEN)
+            for text in moves:
+                move = uci_to_move(text)
+                if move not in generate_legal_moves(board, board.current_turn, underpromotions=True):
+                    raise ValueError(f"Illegal move: {text}")
+                board.push(move)
+        except ValueError as e:
+            self.send(f"info string {e}")
+            return
+        self.board = board
+    
+    def _go(self, args: List[str]):
+        """Handle 'go' with its search limits and start the search."""
+        self.wait()
+        options = {}
+        infinite = not args or "infinite" in args
+        for index, name in enumerate(args[:-1]):
+            if name in ("depth", "movetime", "wtime", "btime", "winc", "binc", "movestogo", "nodes"):
+                try:
+                    options[name] = int(args[index + 1])
+                except ValueError:
+                    pass
+        
+        time_limit = None
+        if "movetime" in options:
+            time_limit = options["movetime"] / 1000
+        else:
+            own = "w" if self.board.current_turn == 'white' else "b"
+            if f"{own}time" in options:
+                remaining = options[f"{own}time"] / 1000
+                increment = options.get(f"{own}inc", 0) / 1000
+                moves_to_go = options.get("movestogo", DEFAULT_MOVES_TO_GO)
+                time_limit = remaining / max(1, moves_to_go) + increment * 0.8
+                time_limit = max(0.01, min(time_limit, remaining - MOVE_OVERHEAD))
+        if infinite:
+            time_limit = None
+        
+        self.ai.depth = options.get("depth", MAX_SEARCH_DEPTH)
+        self._stop_event.clear()
+        self._search_thread = threading.Thread(
+            target=self._search,
+            args=(self.board.copy(), time_limit, options.get("nodes"), infinite),
+            daemon=True
+        )
+        self._search_thread.start()
+    
+    def _search(self, board: Board, time_limit: Optional[float],
+                node_limit: Optional[int], infinite: bool):
+        """Search thread body: report progress and the best move."""
+        def report(info):
+            pv = []
+            for move in info['pv']:
+                pv.append(move_to_uci(move, board))
+                board.push(move)
+            for _ in info['pv']:
+                board.pop()
+            self.send(f"info depth {info['depth']} score {format_score(info['score'])} "
+                      f"nodes {info['nodes']} nps {info['nps']} "
+                      f"time {int(info['time'] * 1000)} pv {' '.join(pv)}")
+        
+        best_move = self.ai.get_best_move(board, board.current_turn, time_limit=time_limit,
+                                          node_limit=node_limit, progress_callback=report)
+        if infinite:
+            self._stop_event.wait()  # UCI: no bestmove before stop in infinite mode
+        self.send(f"bestmove {move_to_uci(best_move, board) if best_move else '0000'}")
+
+
+def main() -> int:
+    """Run the UCI loop on stdin and stdout."""
+    UCIEngine().run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Author: Sepehr Bayat | Open Source Chess MVP
+
+Zobrist hashing keys for identifying board positions.
+
+A position key is the XOR of one random 64-bit number per (piece, square),
+plus keys for black to move, the castling rights and a capturable en passant
+file. Because XOR is its own inverse, Board updates the key incrementally as
+pieces are placed and removed.
+"""
+
+import random
+
+from chess.bitboard import COLOR_INDEX, PAWN
+from chess.attacks import PAWN_ATTACKS
+
+# Castling right bits
+WHITE_KINGSIDE = 1
+WHITE_QUEENSIDE = 2
+BLACK_KINGSIDE = 4
+BLACK_QUEENSIDE = 8
+ALL_CASTLING = 15
+
+# Fixed seed so keys are identical across processes and runs
+_rng = random.Random(20241214)
+
+PIECE_KEYS = [[_rng.getrandbits(64) for _ in range(64)] for _ in range(12)]
+SIDE_KEY = _rng.getrandbits(64)  # XORed in when black is to move
+CASTLING_KEYS = [_rng.getrandbits(64) for _ in range(16)]
+EN_PASSANT_KEYS = [_rng.getrandbits(64) for _ in range(8)]
+
+# Castling rights that survive a move from or to each square. Moving the
+# king or a rook off its home square (or capturing a rook there) clears them.
+CASTLING_MASKS = [ALL_CASTLING] * 64
+CASTLING_MASKS[7 * 8 + 4] = ALL_CASTLING & ~(WHITE_KINGSIDE | WHITE_QUEENSIDE)
+CASTLING_MASKS[7 * 8 + 7] = ALL_CASTLING & ~WHITE_KINGSIDE
+CASTLING_MASKS[7 * 8 + 0] = ALL_CASTLING & ~WHITE_QUEENSIDE
+CASTLING_MASKS[0 * 8 + 4] = ALL_CASTLING & ~(BLACK_KINGSIDE | BLACK_QUEENSIDE)
+CASTLING_MASKS[0 * 8 + 7] = ALL_CASTLING & ~BLACK_KINGSIDE
+CASTLING_MASKS[0 * 8 + 0] = ALL_CASTLING & ~BLACK_QUEENSIDE
+
+
+def castling_rights_from_pieces(board) -> int:
+    """
+    Derive castling rights from unmoved kings and rooks on their home squares.
+    
+    Args:
+        board: Board instance
+        
+    Returns:
+        Bitmask of castling rights
+    """
+    rights = 0
+    for row, color, kingside, queenside in ((7, 'white', WHITE_KINGSIDE, WHITE_QUEENSIDE),
+                                            (0, 'black', BLACK_KINGSIDE, BLACK_QUEENSIDE)):
+        king = board.get_piece(row, 4)
+        if king is None or king.piece_type != 'king' or king.color != color or king.has_moved:
+            continue
+        for col, right in ((7, kingside), (0, queenside)):
+            rook = board.get_piece(row, col)
+            if (rook is not None and rook.piece_type == 'rook' and
+                    rook.color == color and not rook.has_moved):
+                rights |= right
+    return rights
+
+
+def en_passant_key(board) -> int:
+    """
+    Get the en passant key, counted only if the side to move can capture.
+    
+    Args:
+        board: Board instance
+        
+    Returns:
+        Key for the en passant file, or 0
+    """
+    if board.en_passant_target is None:
+        return 0
+    ep_row, ep_col = board.en_passant_target
+    mover_index = COLOR_INDEX[board.current_turn]
+    # Capturing pawns stand where an opponent pawn on the target would attack
+    capturers = PAWN_ATTACKS[1 - mover_index][ep_row * 8 + ep_col]
+    if capturers & board.bitboards[mover_index * 6 + PAWN]:
+        return EN_PASSANT_KEYS[ep_col]
+    return 0
+
+
+def compute_key(board) -> int:
+    """
+    Compute a position key from scratch.
+    
+    Args:
+        board: Board instance
+        
+    Returns:
+        64-bit Zobrist key
+    """
+    key = 0
+    for row in range(8):
+        for col in range(8):
+            piece = board.get_piece(row, col)
+            if piece is not None:
+                key ^= PIECE_KEYS[piece.index][row * 8 + col]
+    if board.current_turn == 'black':
+        key ^= SIDE_KEY
+    key ^= CASTLING_KEYS[board.castling_rights]
+    key ^= en_passant_key(board)
+    return key
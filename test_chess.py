@@ -4,6 +4,7 @@ Author: Sepehr Bayat | Open Source Chess MVP
 Simple test script to verify the chess game components work correctly.
 """
 
+import os
 import sys
 
 def test_imports():
@@ -110,6 +111,792 @@ def test_move_execution():
         traceback.print_exc()
         return False
 
+def test_bitboards():
+    """Test that bitboards stay in sync with the grid."""
+    print("\nTesting bitboards...")
+    try:
+        from chess.board import Board
+        from chess.bitboard import popcount, square_bit
+        board = Board()
+        
+        assert popcount(board.occupied) == 32, "Start position should have 32 pieces"
+        assert board.get_bitboard('king', 'white') == square_bit(7, 4), "White king bit should be e1"
+        
+        board.make_move((6, 4), (4, 4))
+        assert board.get_bitboard('pawn', 'white') & square_bit(4, 4), "Pawn bit should move to e4"
+        assert not board.occupied & square_bit(6, 4), "e2 should be empty"
+        
+        for row in range(8):
+            for col in range(8):
+                piece = board.get_piece(row, col)
+                occupied = bool(board.occupied & square_bit(row, col))
+                assert occupied == (piece is not None), f"Mismatch at ({row}, {col})"
+        
+        print("[OK] Bitboards match the grid")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Bitboard error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_push_pop():
+    """Test that push/pop restore the board exactly."""
+    print("\nTesting push/pop...")
+    try:
+        from chess.board import Board
+        board = Board()
+        
+        # Reach a position with castling and en passant available
+        for move in [((6, 4), (4, 4)), ((1, 0), (2, 0)), ((4, 4), (3, 4)),
+                     ((2, 0), (3, 0)), ((7, 6), (5, 5)), ((3, 0), (4, 0)),
+                     ((7, 5), (6, 4)), ((1, 3), (3, 3))]:
+            assert board.make_move(*move), f"Setup move {move} should succeed"
+        
+        before = [[repr(board.get_piece(r, c)) for c in range(8)] for r in range(8)]
+        bitboards = list(board.bitboards)
+        
+        for move in [((3, 4), (2, 3)), ((7, 4), (7, 6))]:  # En passant, castling
+            board.push(move)
+            board.pop()
+            after = [[repr(board.get_piece(r, c)) for c in range(8)] for r in range(8)]
+            assert after == before, f"Board should be restored after {move}"
+            assert board.bitboards == bitboards, "Bitboards should be restored"
+            assert not board.get_piece(7, 4).has_moved, "King has_moved should be restored"
+        
+        assert board.en_passant_target == (2, 3), "En passant target should be restored"
+        assert board.current_turn == 'white', "Turn should be restored"
+        
+        print("[OK] Push/pop restored the board")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Push/pop error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_legal_moves():
+    """Test pins, castling through check and the start position move count."""
+    print("\nTesting legal move generation...")
+    try:
+        from chess.board import Board
+        from chess.pieces import King, Rook, Bishop
+        board = Board()
+        assert len(board.get_all_moves('white')) == 20, "Start position has 20 moves"
+        
+        # Clear the board and set up a pin and an attacked castling square
+        for row in range(8):
+            for col in range(8):
+                board.set_piece(row, col, None)
+        board.set_piece(7, 4, King('white', 7, 4))
+        board.set_piece(7, 7, Rook('white', 7, 7))
+        board.set_piece(6, 4, Bishop('white', 6, 4))
+        board.set_piece(0, 0, King('black', 0, 0))
+        board.set_piece(0, 4, Rook('black', 0, 4))
+        board.set_piece(0, 5, Rook('black', 0, 5))
+        
+        assert board.get_piece(6, 4).get_valid_moves(board) == [], "Pinned bishop cannot move"
+        king_moves = board.get_piece(7, 4).get_valid_moves(board)
+        assert (7, 6) not in king_moves, "King cannot castle through an attacked square"
+        assert (7, 5) not in king_moves, "King cannot step onto an attacked square"
+        
+        print("[OK] Legal move generation handles pins and castling")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Legal move error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_zobrist():
+    """Test that position keys are incremental and transposition-aware."""
+    print("\nTesting Zobrist hashing...")
+    try:
+        from chess.board import Board
+        from chess.zobrist import compute_key
+        
+        board_a = Board()
+        board_b = Board()
+        start_key = board_a.zobrist_key
+        for move in [((7, 6), (5, 5)), ((0, 6), (2, 5)), ((7, 1), (5, 2))]:
+            board_a.make_move(*move)
+        for move in [((7, 1), (5, 2)), ((0, 6), (2, 5)), ((7, 6), (5, 5))]:
+            board_b.make_move(*move)
+        
+        assert board_a.zobrist_key == board_b.zobrist_key, "Transpositions should share a key"
+        assert board_a.zobrist_key == compute_key(board_a), "Incremental key should match full key"
+        
+        for _ in range(3):
+            board_a.pop()
+        assert board_a.zobrist_key == start_key, "Key should be restored by pop"
+        
+        print("[OK] Zobrist keys are consistent")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Zobrist error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_fen():
+    """Test FEN import and export."""
+    print("\nTesting FEN...")
+    try:
+        from chess.board import Board, STARTING_FEN
+        board = Board()
+        assert board.to_fen() == STARTING_FEN, f"Unexpected start FEN {board.to_fen()}"
+        assert Board.from_fen(STARTING_FEN).zobrist_key == board.zobrist_key, \
+            "Loaded start position should match the initial board"
+        
+        board.push(((6, 4), (4, 4)))
+        board.push(((0, 6), (2, 5)))
+        fen = "rnbqkb1r/pppppppp/5n2/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 1 2"
+        assert board.to_fen() == fen, f"Unexpected FEN {board.to_fen()}"
+        board.pop()
+        board.pop()
+        assert board.to_fen() == STARTING_FEN, "Pop should restore the move clocks"
+        
+        loaded = Board.from_fen("r3k2r/8/8/8/8/8/8/R3K2R b Kq - 12 40")
+        assert loaded.to_fen() == "r3k2r/8/8/8/8/8/8/R3K2R b Kq - 12 40", "FEN should round-trip"
+        assert loaded.grid[7][0].has_moved, "Rook without castling rights should count as moved"
+        assert ((0, 4), (0, 2)) in loaded.get_all_moves('black'), "Black may castle queenside"
+        assert ((0, 4), (0, 6)) not in loaded.get_all_moves('black'), "Black may not castle kingside"
+        
+        try:
+            Board.from_fen("8/8/8 w - - 0 1")
+            assert False, "Malformed FEN should raise ValueError"
+        except ValueError:
+            pass
+        
+        print("[OK] FEN import and export work")
+        return True
+    except Exception as e:
+        print(f"[ERROR] FEN error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_incremental_eval():
+    """Test that the running material and piece-square totals match a recount."""
+    print("\nTesting incremental evaluation...")
+    try:
+        from chess.board import Board
+        from chess.movegen import generate_legal_moves
+        from chess.psqt import PIECE_SQUARE_TABLES, MATERIAL_BY_INDEX
+        
+        def recount(board):
+            material, psqt = [0, 0], [0, 0]
+            for row in range(8):
+                for col in range(8):
+                    piece = board.get_piece(row, col)
+                    if piece is not None:
+                        material[piece.color_index] += MATERIAL_BY_INDEX[piece.index]
+                        psqt[piece.color_index] += PIECE_SQUARE_TABLES[piece.index][row * 8 + col]
+            return material, psqt
+        
+        board = Board.from_fen("r3k2r/1P6/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1")
+        start_totals = (list(board.material), list(board.psqt_score))
+        assert start_totals == recount(board), "Totals should match after from_fen"
+        
+        # En passant, castling, capturing promotion, capture, underpromotion
+        moves = [((3, 4), (2, 3)), ((0, 4), (0, 6)), ((1, 1), (0, 0)),
+                 ((0, 5), (0, 0)), ((7, 4), (7, 2)), ((0, 0), (0, 1)),
+                 ((2, 3), (1, 3)), ((0, 1), (6, 1)), ((1, 3), (0, 3), 'knight')]
+        history = [start_totals]
+        for move in moves:
+            legal = generate_legal_moves(board, board.current_turn, underpromotions=True)
+            assert move in legal, f"{move} should be legal"
+            board.push(move)
+            totals = (list(board.material), list(board.psqt_score))
+            assert totals == recount(board), f"Totals should match after pushing {move}"
+            history.append(totals)
+        assert board.get_piece(0, 3).piece_type == 'knight', "Underpromotion should be on the board"
+        
+        for move in reversed(moves):
+            history.pop()
+            board.pop()
+            assert (board.material, board.psqt_score) == history[-1], \
+                f"Totals should be restored after popping {move}"
+        
+        print("[OK] Incremental totals match a full recount")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Incremental evaluation error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_move_cache():
+    """Test that legal moves are remembered per position."""
+    print("\nTesting move cache...")
+    try:
+        from chess.board import Board
+        from chess.movegen import generate_legal_moves
+        board = Board()
+        
+        moves = board.get_all_moves('white')
+        assert moves == generate_legal_moves(board, 'white'), "Cached moves should match generation"
+        moves.clear()
+        assert len(board.get_all_moves('white')) == 20, "Callers must not be able to alter the cache"
+        
+        board.push(((6, 4), (4, 4)))
+        assert board.get_all_moves('black') == generate_legal_moves(board, 'black'), \
+            "A new position should get its own moves"
+        assert ((7, 5), (4, 2)) in board.get_all_moves('white'), "Bishop should be free after e4"
+        board.pop()
+        assert ((7, 5), (4, 2)) not in board.get_all_moves('white'), "Pop should restore the old moves"
+        assert board.get_piece(7, 6).get_valid_moves(board) == [(5, 5), (5, 7)], \
+            "Piece moves should come from the cached list"
+        
+        mated = Board.from_fen("rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3")
+        assert mated.is_checkmate('white') and not mated.is_stalemate('white'), "Fool's mate"
+        stalemated = Board.from_fen("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+        assert stalemated.is_stalemate('black') and not stalemated.is_checkmate('black'), "Stalemate"
+        
+        print("[OK] Move cache works")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Move cache error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_packed_moves():
+    """Test compact pieces and the packed move encoding."""
+    print("\nTesting packed moves...")
+    try:
+        from chess.board import Board
+        from chess.movegen import generate_legal_moves
+        from chess.moves import (
+            pack_move, unpack_move, move_start, move_end, move_promotion,
+            NULL_MOVE, CAPTURE, EN_PASSANT, CASTLING, DOUBLE_PUSH
+        )
+        from chess.bitboard import KNIGHT, QUEEN
+        
+        board = Board()
+        pawn = board.get_piece(6, 4)
+        assert not hasattr(pawn, '__dict__'), "Pieces should use __slots__"
+        assert (pawn.piece_type, pawn.type_index, pawn.color_index) == ('pawn', 0, 0), \
+            "Pieces should carry int type and color codes"
+        
+        board = Board.from_fen("r3k2r/1P6/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1")
+        for move in generate_legal_moves(board, 'white', underpromotions=True):
+            assert unpack_move(pack_move(move)) == move, f"{move} should round-trip"
+            assert unpack_move(pack_move(move, board)) == move, f"{move} should round-trip with flags"
+        assert unpack_move(NULL_MOVE) is None, "0 should mean no move"
+        
+        assert pack_move(((3, 4), (2, 3)), board) & (CAPTURE | EN_PASSANT) == CAPTURE | EN_PASSANT
+        assert pack_move(((7, 4), (7, 6)), board) & CASTLING, "Castling should be flagged"
+        assert pack_move(((6, 0), (4, 0)), Board()) & DOUBLE_PUSH, "Double push should be flagged"
+        promotion = pack_move(((1, 1), (0, 0)), board)
+        assert (move_start(promotion), move_end(promotion), move_promotion(promotion)) == (9, 0, QUEEN)
+        assert move_promotion(pack_move(((1, 1), (0, 1), 'knight'))) == KNIGHT
+        
+        board.push(pack_move(((1, 1), (0, 0), 'knight')))
+        assert board.get_piece(0, 0).piece_type == 'knight', "Push should accept packed moves"
+        assert board.move_history[-1] == ((1, 1), (0, 0), 'knight'), "History should keep tuples"
+        
+        print("[OK] Packed moves round-trip")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Packed move error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_draw_detection():
+    """Test threefold repetition and fifty-move rule detection."""
+    print("\nTesting draw detection...")
+    try:
+        from chess.board import Board
+        board = Board()
+        shuffle = [((7, 6), (5, 5)), ((0, 6), (2, 5)), ((5, 5), (7, 6)), ((2, 5), (0, 6))]
+        for move in shuffle * 2:
+            assert not board.is_threefold_repetition(), "Repeated too early"
+            board.push(move)
+        assert board.repetition_count() == 3, f"Expected 3 occurrences, got {board.repetition_count()}"
+        assert board.is_threefold_repetition(), "Start position occurred three times"
+        
+        copy = Board.from_state(board.to_state())
+        assert copy.is_threefold_repetition(), "Worker boards should keep the key history"
+        assert board.copy().repetition_count() == 3, "Copies should keep the key history"
+        
+        board.pop()
+        assert board.repetition_count() == 2, "Pop should undo the repetition count"
+        assert len(board.key_history) == len(board.move_history) + 1, "One key per position"
+        
+        board = Board.from_fen("7k/8/6K1/8/8/8/8/R7 w - - 99 80")
+        assert not board.is_fifty_move_draw(), "99 plies is not yet a draw"
+        board.push(((7, 0), (6, 0)))
+        assert board.is_fifty_move_draw(), "100 quiet plies is a draw"
+        board.pop()
+        board.push(((7, 0), (0, 0)))
+        assert board.is_checkmate('black') and board.is_fifty_move_draw(), \
+            "Status checks must test mate before the fifty-move rule"
+        
+        # Table entries stored with a low clock must not hide the draw
+        from chess.ai import ChessAI, MATE_THRESHOLD
+        ai = ChessAI(depth=3, seed=1)
+        ai.get_best_move(Board.from_fen("7k/8/8/8/8/8/8/KQ6 w - - 0 1"), 'white')
+        assert ai.best_score > 500, f"Queen up should be winning, got {ai.best_score}"
+        ai.get_best_move(Board.from_fen("7k/8/8/8/8/8/8/KQ6 w - - 99 80"), 'white')
+        assert ai.best_score == 0, f"Every quiet move ends in a fifty-move draw, got {ai.best_score}"
+        move = ai.get_best_move(Board.from_fen("7k/8/6K1/8/8/8/8/R7 w - - 99 80"), 'white')
+        assert move == ((7, 0), (0, 0)) and ai.best_score > MATE_THRESHOLD, \
+            "Search must prefer mate over the fifty-move draw"
+        
+        print("[OK] Repetition and fifty-move draws detected")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Draw detection error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_perft():
+    """Test move generation node counts against the reference positions."""
+    print("\nTesting perft...")
+    try:
+        from chess.board import Board
+        from chess.perft import REFERENCE_POSITIONS, perft
+        from chess.notation import move_to_uci, uci_to_move
+        depths = {"startpos": 3, "kiwipete": 2, "position4": 3, "position5": 2}
+        for name, fen, expected in REFERENCE_POSITIONS:
+            if name in depths:
+                nodes = perft(Board.from_fen(fen), depths[name])
+                assert nodes == expected[depths[name] - 1], \
+                    f"{name}: expected {expected[depths[name] - 1]} nodes, got {nodes}"
+        
+        # Depths beyond the listed counts are reported, not failed
+        import chess.perft
+        saved = chess.perft.REFERENCE_POSITIONS
+        chess.perft.REFERENCE_POSITIONS = [("startpos", saved[0][1], [20])]
+        try:
+            correct, nodes, _ = chess.perft.run_reference({"startpos": 2}, verbose=False)
+        finally:
+            chess.perft.REFERENCE_POSITIONS = saved
+        assert correct and nodes == 400, "Unlisted depth should not count as wrong"
+        
+        import contextlib
+        import io
+        errors = io.StringIO()
+        try:
+            with contextlib.redirect_stderr(errors):
+                chess.perft.main(['--fen', 'not a fen'])
+            raise AssertionError("Malformed FEN should be rejected")
+        except SystemExit:
+            pass
+        assert "FEN" in errors.getvalue(), "Malformed FEN should be reported as a usage error"
+        
+        assert uci_to_move("e2e4") == ((6, 4), (4, 4)), "UCI move should parse"
+        assert move_to_uci(((1, 0), (0, 0), 'knight')) == "a7a8n", "Underpromotion should format"
+        
+        print("[OK] Perft node counts match the reference positions")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Perft error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_transposition_table():
+    """Test transposition table replacement, ageing, counters and resizing."""
+    print("\nTesting transposition table...")
+    try:
+        from chess.transposition import TranspositionTable, EXACT, LOWER_BOUND, KEY, DEPTH, AGE
+        table = TranspositionTable(size_mb=0.01)
+        size = table.size
+        assert size & (size - 1) == 0, "Bucket count should be a power of two"
+        # Three positions sharing bucket 5
+        first, second, third = 5, 5 + size, 5 + 2 * size
+        
+        table.store(first, 4, 10, EXACT, 0)
+        assert table.probe(first)[DEPTH] == 4, "Stored entry should be found"
+        assert table.probe(second) is None, "Other key in a used bucket is not a hit"
+        assert table.probe(6) is None, "Empty bucket is not a hit"
+        
+        # Shallower result of the same search goes to the always-replace slot
+        table.store(second, 2, 20, LOWER_BOUND, 0)
+        assert table._depth_slots[5][KEY] == first, "Deeper entry should keep its slot"
+        assert table._always_slots[5][KEY] == second, "Shallower entry should use the other slot"
+        assert table.probe(second)[DEPTH] == 2, "Both entries of a bucket should be found"
+        
+        # Deeper result takes the depth-preferred slot and demotes the old entry
+        table.store(third, 6, 30, EXACT, 0)
+        assert table._depth_slots[5][KEY] == third, "Deeper entry should take the depth slot"
+        assert table._always_slots[5][KEY] == first, "Replaced entry should be demoted"
+        assert table.probe(second) is None, "Always-replace entry should be overwritten"
+        
+        # After new_search, even a shallow result replaces the old deep entry
+        table.new_search()
+        table.store(second, 1, 40, EXACT, 0)
+        assert table._depth_slots[5][KEY] == second, "Old entries should be replaceable"
+        assert table._depth_slots[5][AGE] == table.age, "Entry should carry the current age"
+        assert table.probe(third)[DEPTH] == 6, "Aged entry should be demoted, not dropped"
+        
+        stats = table.stats()
+        assert (stats['hits'], stats['misses'], stats['collisions'], stats['stores']) == (3, 1, 2, 4), \
+            f"Unexpected counters {stats}"
+        assert stats['probes'] == 6, "Probes should add up hits, misses and collisions"
+        assert stats['hit_rate_permille'] == 500, "Hit rate should follow the counters"
+        
+        table.resize(0.04)
+        assert table.size == size * 4, f"Resize should scale the buckets, got {table.size}"
+        assert table.probe(second) is None, "Resize should discard the entries"
+        assert table.stats()['stores'] == 0, "Resize should reset the counters"
+        
+        print("[OK] Transposition table replaces, ages and counts entries")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Transposition table error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_ai_finds_mate():
+    """Test that the AI finds a back-rank mate in one."""
+    print("\nTesting AI search...")
+    try:
+        from chess.board import Board
+        from chess.ai import ChessAI
+        from chess.pieces import King, Rook, Pawn
+        board = Board()
+        for row in range(8):
+            for col in range(8):
+                board.set_piece(row, col, None)
+        board.set_piece(0, 7, King('black', 0, 7))
+        board.set_piece(1, 6, Pawn('black', 1, 6))
+        board.set_piece(1, 7, Pawn('black', 1, 7))
+        board.set_piece(7, 0, Rook('white', 7, 0))
+        board.set_piece(7, 6, King('white', 7, 6))
+        
+        ai = ChessAI(depth=3, seed=1)
+        move = ai.get_best_move(board, 'white')
+        assert move == ((7, 0), (0, 0)), f"AI should play Ra8#, got {move}"
+        
+        print(f"[OK] AI found mate in one ({ai.nodes} nodes)")
+        return True
+    except Exception as e:
+        print(f"[ERROR] AI search error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_quiescence():
+    """Test that a depth 1 search sees the recapture after a capture."""
+    print("\nTesting quiescence search...")
+    try:
+        from chess.board import Board
+        from chess.ai import ChessAI
+        # Qxd5 wins a pawn on a static count but loses the queen to cxd5
+        board = Board.from_fen("4k3/8/2p5/3p4/8/8/3Q4/4K3 w - - 0 1")
+        queen_takes = ((6, 3), (3, 3))
+        ai = ChessAI(depth=1, seed=1)
+        
+        static_scores = {}
+        for move in board.get_all_moves('white'):
+            board.push(move)
+            static_scores[move] = ai._evaluate_board(board, 'white')
+            board.pop()
+        assert max(static_scores, key=static_scores.get) == queen_takes, \
+            "Without quiescence depth 1 would take the pawn"
+        
+        move = ai.get_best_move(board, 'white')
+        assert move != queen_takes, "Search should see the pawn recapture"
+        assert ai.best_score < static_scores[queen_takes], "Score should not count the free pawn"
+        
+        board.push(queen_takes)
+        ai.get_best_move(board, 'black')
+        assert ai.best_score > 0, f"Black should come out ahead after Qxd5, got {ai.best_score}"
+        
+        print("[OK] Quiescence search resolves the capture sequence")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Quiescence error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_search_limits():
+    """Test that iterative deepening honours time and node budgets."""
+    print("\nTesting search limits...")
+    try:
+        import time
+        from chess.board import Board
+        from chess.ai import ChessAI, CHECK_INTERVAL
+        # Best move changes between depths: d4 at 2 and 4, Nc3 at 3
+        fen = "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3"
+        
+        reports = []
+        ai = ChessAI(depth=3, seed=1)
+        ai.get_best_move(Board.from_fen(fen), 'white', progress_callback=reports.append)
+        depth3_nodes, depth3_move = reports[-1]['nodes'], reports[-1]['best_move']
+        
+        # Run out of nodes just after depth 3: its move is returned, not
+        # a guess from the abandoned depth 4
+        budget = depth3_nodes + 1
+        reports = []
+        ai = ChessAI(depth=None, node_limit=budget, seed=1)
+        move = ai.get_best_move(Board.from_fen(fen), 'white', progress_callback=reports.append)
+        assert ai.completed_depth == 3, f"Depth 3 should be the last completed, got {ai.completed_depth}"
+        assert move == depth3_move == reports[-1]['best_move'], \
+            f"Stopped search should return the depth 3 move, got {move}"
+        assert ai.nodes <= budget + CHECK_INTERVAL, f"Node budget overrun: {ai.nodes} > {budget}"
+        
+        ai = ChessAI(depth=None, node_limit=1000, seed=1)
+        ai.get_best_move(Board(), 'white')
+        assert ai.nodes <= 1000 + CHECK_INTERVAL, f"Node budget overrun: {ai.nodes} > 1000"
+        
+        ai = ChessAI(depth=None, time_limit=0.2, seed=1)
+        started = time.perf_counter()
+        move = ai.get_best_move(Board(), 'white')
+        elapsed = time.perf_counter() - started
+        assert elapsed < 0.2 + 0.5, f"Time limit overrun: {elapsed:.2f}s"
+        assert ai.completed_depth >= 1 and move in Board().get_all_moves('white'), \
+            "Timed search should return a legal move"
+        
+        print(f"[OK] Search stops within its budgets ({elapsed:.2f}s for 0.2s)")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Search limits error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_ai_worker():
+    """Test that the background AI worker reports progress and can be cancelled."""
+    print("\nTesting AI worker...")
+    try:
+        import time
+        from chess.board import Board
+        from chess.ai import ChessAI
+        from chess.ai_worker import AIWorker, PROGRESS, BEST_MOVE
+        board = Board()
+        worker = AIWorker()
+        
+        worker.start(ChessAI(depth=2, seed=1), board, 'white')
+        messages = []
+        deadline = time.time() + 30
+        while not any(kind == BEST_MOVE for kind, _ in messages) and time.time() < deadline:
+            messages.extend(worker.poll())
+            time.sleep(0.01)
+        kinds = [kind for kind, _ in messages]
+        assert kinds == [PROGRESS, PROGRESS, BEST_MOVE], f"Unexpected messages {kinds}"
+        assert messages[-1][1] in board.get_all_moves('white'), "Worker move should be legal"
+        assert board.move_history == [], "Worker should search a copy of the board"
+        
+        worker.start(ChessAI(depth=None, time_limit=60, seed=1), board, 'white')
+        started = time.time()
+        worker.cancel()
+        assert not worker.is_running(), "Cancelled search should stop"
+        assert time.time() - started < 5, "Cancel should return promptly"
+        assert not any(kind == BEST_MOVE for kind, _ in worker.poll()), \
+            "Cancelled search should not report a move"
+        
+        # A failing search still reports, so the UI stops waiting
+        import threading
+        class FailingAI(ChessAI):
+            def get_best_move(self, *args, **kwargs):
+                raise RuntimeError("search failed")
+        saved_hook = threading.excepthook
+        threading.excepthook = lambda args: None
+        try:
+            worker.start(FailingAI(depth=1), board, 'white')
+            worker._thread.join(5)
+        finally:
+            threading.excepthook = saved_hook
+        assert worker.poll() == [(BEST_MOVE, None)], "Failed search should report no move"
+        
+        print("[OK] AI worker searches in the background and cancels")
+        return True
+    except Exception as e:
+        print(f"[ERROR] AI worker error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_parallel_search():
+    """Test board state packing and the multi-process root search."""
+    print("\nTesting parallel search...")
+    try:
+        from chess.board import Board
+        from chess.ai import ChessAI, CHECK_INTERVAL
+        board = Board()
+        board.push(((6, 4), (4, 4)))
+        restored = Board.from_state(board.to_state())
+        assert restored.to_state() == board.to_state(), "State should round-trip"
+        assert restored.zobrist_key == board.zobrist_key, "Restored key should match"
+        assert restored.en_passant_target == (5, 4), "En passant target should survive"
+        
+        serial = ChessAI(depth=3, seed=1)
+        parallel = ChessAI(depth=3, seed=1, workers=2)
+        try:
+            serial_move = serial.get_best_move(board, 'black')
+            parallel_move = parallel.get_best_move(board, 'black')
+            parallel_score = parallel.best_score
+            
+            # Workers share the node budget; each may only overrun its share
+            # by the nodes between two budget checks
+            budget = 5000
+            parallel.depth = 6
+            parallel.get_best_move(board, 'black', node_limit=budget)
+            slack = CHECK_INTERVAL * len(board.get_all_moves('black'))
+            assert parallel.nodes <= budget + slack, \
+                f"Node budget overshot: {parallel.nodes} > {budget} + {slack}"
+        finally:
+            parallel.close()
+        assert parallel_score == serial.best_score, \
+            f"Scores differ: {parallel_score} vs {serial.best_score}"
+        assert parallel_move in board.get_all_moves('black'), "Parallel move should be legal"
+        
+        # Worker tables age once per search generation, not once per task
+        import multiprocessing
+        import chess.ai
+        chess.ai._init_worker(multiprocessing.Value('d', float('-inf')), multiprocessing.Value('b', 0),
+                              multiprocessing.Value('i', 1), 1, True)
+        worker_table = chess.ai._worker_ai.transposition_table
+        state, reply = board.to_state(), ((1, 4), (3, 4))
+        for generation in (1, 1, 2):
+            chess.ai._search_root_move(state, reply, 1, None, None, 1, generation)
+        assert worker_table.age == 2, f"Worker table should be aged twice, got {worker_table.age}"
+        
+        print(f"[OK] Parallel search agrees with serial search ({serial_move})")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Parallel search error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_headless_engine():
+    """Test that the headless engine runs without ever importing pygame."""
+    print("\nTesting headless engine...")
+    try:
+        import subprocess
+        # Blocking the module makes any pygame import fail, even if it is installed
+        script = (
+            "import sys; sys.modules['pygame'] = None\n"
+            "import chess.engine, chess.ai, chess.ai_worker, chess.perft, chess.match\n"
+            "sys.exit(chess.engine.main(['--depth', '2', '--seed', '1', '--quiet']))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        assert result.returncode == 0, f"Engine failed: {result.stderr}"
+        assert result.stdout.startswith("bestmove "), f"Unexpected output: {result.stdout!r}"
+        
+        print(f"[OK] Headless engine ran without pygame ({result.stdout.strip()})")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Headless engine error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_uci():
+    """Test the UCI front-end commands and asynchronous search."""
+    print("\nTesting UCI...")
+    try:
+        import io
+        import time
+        from chess.uci import UCIEngine
+        output = io.StringIO()
+        engine = UCIEngine(output)
+        
+        engine.handle("uci")
+        engine.handle("position fen 6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+        engine.handle("go depth 3")
+        engine.wait()
+        lines = output.getvalue().splitlines()
+        assert "uciok" in lines, "uci should answer uciok"
+        assert any("score mate 1" in line and "pv a1a8" in line for line in lines), \
+            "Info should report the mate and its pv"
+        assert lines[-1] == "bestmove a1a8", f"Unexpected last line {lines[-1]!r}"
+        
+        engine.handle("position startpos moves e2e4 e7e5")
+        engine.handle("go infinite")
+        time.sleep(0.2)
+        engine.handle("isready")
+        assert "readyok" in output.getvalue().splitlines(), \
+            "isready should be answered during a search"
+        started = time.time()
+        engine.handle("stop")
+        assert time.time() - started < 2, "stop should end the search promptly"
+        assert output.getvalue().splitlines()[-1].startswith("bestmove "), "stop should report a move"
+        engine.quit()
+        
+        # Hash sent after Threads must reach the worker processes too
+        engine = UCIEngine(io.StringIO())
+        engine.handle("setoption name Threads value 2")
+        engine.handle("setoption name Hash value 4")
+        pool = engine.ai._get_pool()
+        assert pool._initargs[3] == 4, f"Workers should get 4 MB tables, got {pool._initargs[3]}"
+        assert engine.ai.transposition_table.size_mb == 4, "Parent table should be resized"
+        engine.quit()
+        
+        print("[OK] UCI commands and search control work")
+        return True
+    except Exception as e:
+        print(f"[ERROR] UCI error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_match():
+    """Test the headless self-play match runner."""
+    print("\nTesting match runner...")
+    try:
+        import json
+        import tempfile
+        from chess.board import Board
+        from chess.notation import move_to_san
+        from chess.match import parse_engine_spec, elo_difference, play_game, run_match
+        
+        board = Board.from_fen("r3k2r/1P6/8/3pP3/8/2N3N1/8/R3K2R w KQkq d6 0 1")
+        for move, san in [(((3, 4), (2, 3)), "exd6"), (((7, 4), (7, 6)), "O-O"),
+                          (((5, 2), (4, 4)), "Nce4"), (((1, 1), (0, 0), 'knight'), "bxa8=N"),
+                          (((7, 0), (0, 0)), "Rxa8+")]:
+            assert move_to_san(move, board) == san, f"Expected {san}, got {move_to_san(move, board)}"
+        assert move_to_san(((7, 0), (0, 0)), Board.from_fen("7k/8/6K1/8/8/8/8/R7 w - - 0 1")) == "Ra8#"
+        
+        config = parse_engine_spec("name=fast,depth=1,mobility=off")
+        assert config == {'name': 'fast', 'depth': 1, 'mobility': False}, f"Unexpected {config}"
+        try:
+            parse_engine_spec("speed=9")
+            assert False, "Unknown engine options should raise ValueError"
+        except ValueError:
+            pass
+        
+        assert elo_difference(5, 0, 5)[0] == 0.0, "An even score is 0 Elo"
+        elo, margin = elo_difference(30, 40, 10)
+        assert 80 < elo < 95 and 0 < margin < elo, f"Unexpected Elo {elo} +/- {margin}"
+        
+        record = play_game(0, config, config, opening_seed=3, opening_plies=2, max_plies=8)
+        assert record['plies'] == 8 and record['termination'] == 'move limit', f"Unexpected {record}"
+        assert record['result'] == '1/2-1/2' and len(record['san']) == 8, "Move limit is a draw"
+        
+        with tempfile.TemporaryDirectory() as directory:
+            jsonl_path = os.path.join(directory, "results.jsonl")
+            pgn_path = os.path.join(directory, "games.pgn")
+            other = parse_engine_spec("name=other,depth=1")
+            totals = run_match(config, other, games=2, workers=1, max_plies=6, seed=5,
+                               jsonl_path=jsonl_path, pgn_path=pgn_path)
+            assert totals == {'wins': 0, 'draws': 2, 'losses': 0}, f"Unexpected totals {totals}"
+            with open(jsonl_path) as jsonl_file:
+                records = [json.loads(line) for line in jsonl_file]
+            assert [(r['white'], r['black']) for r in records] == [('fast', 'other'), ('other', 'fast')], \
+                "Engines should alternate colors"
+            assert records[0]['moves'][:4] == records[1]['moves'][:4], "Game pairs should share an opening"
+            with open(pgn_path) as pgn_file:
+                assert pgn_file.read().count('[Event ') == 2, "Each game should be written as PGN"
+        
+        print("[OK] Match runner plays, records and scores games")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Match runner error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def test_evaluator():
     """Test that evaluator works."""
     print("\nTesting evaluator...")
@@ -125,6 +912,21 @@ def test_evaluator():
         score = evaluator.evaluate_move(board, move, 'white')
         
         assert 0 <= score <= 100, f"Score should be 0-100, got {score}"
+        
+        # Moves are scored on the position Board.push produces, so the
+        # castling rook, en passant capture and moved flags all count
+        expected = {((6, 4), (4, 4)): 68, ((7, 6), (5, 5)): 53, ((7, 1), (5, 2)): 53}
+        for pinned_move, pinned_score in expected.items():
+            assert evaluator.evaluate_move(board, pinned_move, 'white') == pinned_score, \
+                f"Score for {pinned_move} changed"
+        fen = "r3k2r/8/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1"
+        board = Board.from_fen(fen)
+        expected = {((3, 4), (2, 3)): 60, ((7, 4), (7, 6)): 57, ((7, 4), (7, 2)): 53}
+        for pinned_move, pinned_score in expected.items():
+            assert evaluator.evaluate_move(board, pinned_move, 'white') == pinned_score, \
+                f"Score for {pinned_move} changed"
+        assert board.to_fen() == fen, "Scoring a move should leave the board unchanged"
+        
         print(f"[OK] Evaluator returned score: {score}/100")
         
         return True
@@ -145,6 +947,25 @@ def main():
         test_board_initialization,
         test_piece_moves,
         test_move_execution,
+        test_bitboards,
+        test_push_pop,
+        test_legal_moves,
+        test_zobrist,
+        test_fen,
+        test_incremental_eval,
+        test_move_cache,
+        test_packed_moves,
+        test_draw_detection,
+        test_perft,
+        test_transposition_table,
+        test_ai_finds_mate,
+        test_quiescence,
+        test_search_limits,
+        test_ai_worker,
+        test_parallel_search,
+        test_headless_engine,
+        test_uci,
+        test_match,
         test_evaluator,
     ]
     